@@ -6,6 +6,8 @@ from .dependencies import (
     get_settings_dependency,
     get_node_manager,
     get_health_monitor,
+    get_user_id,
+    UserIdDep,
 )
 from .api import cluster_router
 
@@ -13,5 +15,7 @@ __all__ = [
     "get_settings_dependency",
     "get_node_manager",
     "get_health_monitor",
+    "get_user_id",
+    "UserIdDep",
     "cluster_router",
 ]
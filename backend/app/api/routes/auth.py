@@ -10,6 +10,8 @@ from typing import Optional
 from models.user import UserLogin, UserSession, UserPublic, UserQuota
 from services.auth_service import auth_service
 from services.quota_service import quota_service
+from app.dependencies import UserIdDep
+from core.responses import ORJSONResponse
 
 
 # 라우터 생성
@@ -54,15 +56,12 @@ async def login(credentials: UserLogin) -> UserSession:
     description="Get information about the currently authenticated user."
 )
 async def get_current_user(
-    x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+    user_id: UserIdDep
 ) -> UserPublic:
     """
     현재 인증된 사용자 정보를 반환합니다.
     """
-    if not x_user_id:
-        x_user_id = "user-demo-001"  # 기본 데모 사용자
-    
-    user = await auth_service.get_user_by_id(x_user_id)
+    user = await auth_service.get_user_by_id(user_id)
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -77,25 +76,21 @@ async def get_current_user(
 
 @router.get(
     "/quota",
-    response_model=dict,
     summary="Get Resource Quota",
     description="Get the current user's resource quota and usage."
 )
 async def get_quota(
-    x_user_id: Optional[str] = Header(None, alias="X-User-ID")
-) -> dict:
+    user_id: UserIdDep
+) -> ORJSONResponse:
     """
     현재 사용자의 리소스 쿼터 및 사용량을 반환합니다.
     """
-    if not x_user_id:
-        x_user_id = "user-demo-001"  # 기본 데모 사용자
-    
-    summary = await quota_service.get_quota_summary(x_user_id)
+    summary = await quota_service.get_quota_summary(user_id)
     
     if not summary:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return summary
+    return ORJSONResponse(summary)
 
 
 @router.post(
@@ -111,18 +106,17 @@ async def logout(
     현재 세션을 무효화합니다.
     """
     if x_session_id:
-        await auth_service.invalidate_session(x_session_id)
+        auth_service.invalidate_session(x_session_id)
 
 
 @router.get(
     "/billing",
-    response_model=dict,
     summary="Get Billing Summary",
     description="Get the current user's usage-based billing information."
 )
 async def get_billing(
-    x_user_id: Optional[str] = Header(None, alias="X-User-ID")
-) -> dict:
+    user_id: UserIdDep
+) -> ORJSONResponse:
     """
     현재 사용자의 청구 요약을 반환합니다.
     
@@ -133,8 +127,5 @@ async def get_billing(
     """
     from services.billing_service import billing_service
     
-    if not x_user_id:
-        x_user_id = "user-demo-001"
-    
-    summary = await billing_service.get_billing_summary(x_user_id)
-    return summary
+    summary = await billing_service.get_billing_summary(user_id)
+    return ORJSONResponse(summary)
@@ -4,14 +4,17 @@
 # 설명: 클러스터 상태 및 노드 관리 API 엔드포인트
 # ============================================================================
 
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from typing import Optional, AsyncIterator, Sequence
 
 from models.node import NodeInfo, NodeStatus, NodeWithStatus, NodeRole
 from models.cluster import ClusterStatus
 from services.node_manager import node_manager
 from services.health_monitor import health_monitor
 from core.exceptions import NodeNotFoundException
+from core.cache import cached
 
 
 # 라우터 생성
@@ -21,6 +24,10 @@ router = APIRouter(
     responses={404: {"description": "리소스를 찾을 수 없음"}}
 )
 
+# 목록 응답 직렬화기 (응답 검증 없이 바로 JSON 바이트로 직렬화)
+_NODE_LIST_ADAPTER = TypeAdapter(Sequence[NodeInfo])  # 역할 필터 결과는 tuple
+_NODE_STATUS_LIST_ADAPTER = TypeAdapter(list[NodeWithStatus])
+
 
 @router.get(
     "/status",
@@ -28,6 +35,7 @@ router = APIRouter(
     summary="클러스터 상태 조회",
     description="17개 분산 노드의 현재 상태를 종합적으로 조회합니다."
 )
+@cached(ttl=5, stale_on_error=True)
 async def get_cluster_status(
     include_nodes: bool = Query(
         default=False,
@@ -40,14 +48,15 @@ async def get_cluster_status(
     - **include_nodes**: True로 설정하면 각 노드의 상세 정보도 포함됩니다.
     
     이 API는 asyncio.gather를 사용하여 17개 노드를 동시에 체크하므로
-    빠른 응답 시간을 보장합니다.
+    빠른 응답 시간을 보장합니다. 결과는 5초간 캐싱되며, 헬스체크 실패 시
+    마지막으로 성공한 결과를 반환합니다.
     """
     return await health_monitor.get_cluster_status(include_nodes=include_nodes)
 
 
 @router.get(
     "/nodes",
-    response_model=list[NodeInfo],
+    responses={200: {"model": list[NodeInfo]}},
     summary="전체 노드 목록 조회",
     description="클러스터에 등록된 모든 노드의 기본 정보를 조회합니다."
 )
@@ -56,15 +65,17 @@ async def get_all_nodes(
         default=None,
         description="특정 역할의 노드만 필터링"
     )
-) -> list[NodeInfo]:
+) -> Response:
     """
     모든 노드의 기본 정보를 반환합니다.
     
     - **role**: 특정 역할 (master, worker, storage)로 필터링할 수 있습니다.
     """
     if role:
-        return await node_manager.get_nodes_by_role(role)
-    return await node_manager.get_all_nodes()
+        nodes = await node_manager.get_nodes_by_role(role)
+    else:
+        nodes = await node_manager.get_all_nodes()
+    return Response(_NODE_LIST_ADAPTER.dump_json(nodes), media_type="application/json")
 
 
 @router.get(
@@ -160,17 +171,42 @@ async def delete_node(node_id: str) -> None:
         raise HTTPException(status_code=404, detail=e.message)
 
 
+async def _stream_node_health(force: bool) -> AsyncIterator[bytes]:
+    """노드 상태를 완료 순서대로 NDJSON 레코드로 직렬화합니다."""
+    async for node_with_status in health_monitor.iter_node_health(force=force):
+        yield node_with_status.model_dump_json().encode() + b"\n"
+
+
 @router.post(
     "/health-check",
-    response_model=list[NodeWithStatus],
+    responses={200: {"model": list[NodeWithStatus]}},
     summary="전체 노드 헬스체크",
     description="모든 노드에 대한 실시간 헬스체크를 수행합니다."
 )
-async def check_all_nodes_health() -> list[NodeWithStatus]:
+async def check_all_nodes_health(
+    request: Request,
+    force: bool = Query(
+        default=False,
+        description="최신 스냅샷 대신 즉시 전체 노드를 체크할지 여부"
+    )
+) -> Response:
     """
-    클러스터의 모든 노드에 대해 동시에 헬스체크를 수행합니다.
+    클러스터의 모든 노드 헬스 상태를 반환합니다.
     
-    asyncio.gather를 사용하여 17개 노드를 병렬로 체크하므로
-    전체 응답 시간이 크게 단축됩니다.
-    """
-    return await health_monitor.check_all_nodes()
+    기본적으로 백그라운드에서 주기적으로 갱신되는 스냅샷을 반환하며,
+    **force**를 True로 설정하면 17개 노드를 즉시 병렬로 체크합니다.
+    
+    `Accept: application/x-ndjson` 헤더를 보내면 체크가 끝난 노드부터
+    한 줄에 하나씩 NDJSON으로 스트리밍합니다.
+    """
+    if "application/x-ndjson" in request.headers.get("accept", ""):
+        return StreamingResponse(
+            _stream_node_health(force),
+            media_type="application/x-ndjson"
+        )
+    
+    nodes_with_status = await health_monitor.check_all_nodes(force=force)
+    return Response(
+        _NODE_STATUS_LIST_ADAPTER.dump_json(nodes_with_status),
+        media_type="application/json"
+    )
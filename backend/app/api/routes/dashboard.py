@@ -4,15 +4,25 @@
 # 설명: 프론트엔드 대시보드용 통합 데이터 API
 # ============================================================================
 
-from fastapi import APIRouter, Header
+import asyncio
+import hashlib
+from operator import attrgetter
+
+import orjson
+from fastapi import APIRouter, Header, Response
+from pydantic import TypeAdapter
 from typing import Optional
-from datetime import datetime
 
 from services.instance_manager import instance_manager
 from services.quota_service import quota_service
 from services.health_monitor import health_monitor
 from services.node_manager import node_manager
-from models.node import NodeRole
+from services.ray_service import ray_service
+from models.node import NodeRole, NodeStatusView
+from core.cache import cached
+from core.clock import request_now
+from core.responses import ORJSONResponse
+from app.dependencies import UserIdDep
 
 
 # 라우터 생성
@@ -23,15 +33,89 @@ router = APIRouter(
 )
 
 
+# 사용 가능한 컨테이너 이미지 목록 (정적 데이터이므로 로드 시 한 번만 직렬화)
+AVAILABLE_IMAGES = [
+    {
+        "id": "ubuntu:22.04",
+        "name": "Ubuntu 22.04 LTS",
+        "description": "Ubuntu 22.04 LTS (Jammy Jellyfish)",
+        "category": "Operating System"
+    },
+    {
+        "id": "ubuntu:20.04",
+        "name": "Ubuntu 20.04 LTS",
+        "description": "Ubuntu 20.04 LTS (Focal Fossa)",
+        "category": "Operating System"
+    },
+    {
+        "id": "python:3.11",
+        "name": "Python 3.11",
+        "description": "Python 3.11 runtime environment",
+        "category": "Runtime"
+    },
+    {
+        "id": "python:3.10",
+        "name": "Python 3.10",
+        "description": "Python 3.10 runtime environment",
+        "category": "Runtime"
+    },
+    {
+        "id": "node:20",
+        "name": "Node.js 20",
+        "description": "Node.js 20 LTS runtime",
+        "category": "Runtime"
+    },
+    {
+        "id": "node:18",
+        "name": "Node.js 18",
+        "description": "Node.js 18 LTS runtime",
+        "category": "Runtime"
+    },
+    {
+        "id": "nginx:latest",
+        "name": "Nginx",
+        "description": "High-performance web server",
+        "category": "Web Server"
+    },
+    {
+        "id": "redis:latest",
+        "name": "Redis",
+        "description": "In-memory data store",
+        "category": "Database"
+    }
+]
+_IMAGES_JSON = orjson.dumps(AVAILABLE_IMAGES)
+_IMAGES_ETAG = f'"{hashlib.sha1(_IMAGES_JSON).hexdigest()}"'
+
+# 리소스 선택 옵션 기본 단계 (CPU: 1, 2, 4, ... / 메모리: 2, 4, 8, ...)
+_CPU_OPTION_STEPS = (1, 2, 4, 8, 16, 32)
+_MEMORY_OPTION_STEPS = (2, 4, 8, 16, 32, 64)
+
+
+def _build_options(steps: tuple[int, ...], limit: int) -> tuple[int, ...]:
+    """limit 이하의 기본 단계에 limit 자체를 더한 정렬된 옵션 목록을 만듭니다."""
+    return tuple(sorted({s for s in steps if s <= limit} | {limit}))
+
+
+# 최대값별 옵션 테이블 (1 ~ 128을 로드 시 미리 계산)
+_CPU_OPTIONS = {n: _build_options(_CPU_OPTION_STEPS, n) for n in range(1, 129)}
+_MEMORY_OPTIONS = {n: _build_options(_MEMORY_OPTION_STEPS, n) for n in range(1, 129)}
+
+# 노드 상태 목록에서 사용하는 필드 추출기
+_node_fields = attrgetter("id", "hostname", "tailscale_ip", "role", "cpu_cores", "memory_gb")
+_status_fields = attrgetter("health", "is_online", "response_time_ms")
+_NODE_STATUS_VIEW_ADAPTER = TypeAdapter(list[NodeStatusView])
+
+
 @router.get(
     "/summary",
-    response_model=dict,
     summary="Dashboard Summary",
     description="Get aggregated data for the dashboard view."
 )
+@cached(ttl=10)
 async def get_dashboard_summary(
-    x_user_id: Optional[str] = Header(None, alias="X-User-ID")
-) -> dict:
+    user_id: UserIdDep
+) -> ORJSONResponse:
     """
     대시보드에 표시할 요약 데이터를 반환합니다.
     
@@ -39,44 +123,38 @@ async def get_dashboard_summary(
     - Active Nodes
     - Resource Quota
     """
-    if not x_user_id:
-        x_user_id = "user-demo-001"
-    
-    # 인스턴스 요약
-    instance_summary = await instance_manager.get_instance_summary(x_user_id)
+    # 인스턴스 요약, 쿼터 정보, 노드 정보를 동시에 조회
+    instance_summary, quota_summary, all_nodes = await asyncio.gather(
+        instance_manager.get_instance_summary(user_id),
+        quota_service.get_quota_summary(user_id),
+        node_manager.get_all_nodes(),
+    )
     
-    # 쿼터 정보
-    quota_summary = await quota_service.get_quota_summary(x_user_id)
-    
-    # 노드 정보
-    all_nodes = await node_manager.get_all_nodes()
-    worker_nodes = await node_manager.get_nodes_by_role(NodeRole.WORKER)
-    
-    return {
+    return ORJSONResponse({
         "instances": instance_summary,
         "quota": quota_summary,
         "nodes": {
             "total": len(all_nodes),
-            "workers": len(worker_nodes),
+            "workers": sum(1 for n in all_nodes if n.role == NodeRole.WORKER),
             "master": 1
         },
-        "timestamp": datetime.now().isoformat()
-    }
+        "timestamp": request_now()
+    })
 
 
 @router.get(
     "/health",
-    response_model=dict,
     summary="Cluster Health",
     description="Get the current health status of the cluster."
 )
-async def get_cluster_health() -> dict:
+@cached(ttl=5, stale_on_error=True)
+async def get_cluster_health() -> ORJSONResponse:
     """
     클러스터 헬스 상태를 반환합니다.
     """
     cluster_status = await health_monitor.get_cluster_status(include_nodes=False)
     
-    return {
+    return ORJSONResponse({
         "cluster_name": cluster_status.cluster_name,
         "health": cluster_status.health.value,
         "summary": {
@@ -86,134 +164,91 @@ async def get_cluster_health() -> dict:
             "availability_percent": cluster_status.summary.availability_percent
         },
         "message": cluster_status.message,
-        "checked_at": cluster_status.checked_at.isoformat()
-    }
+        "checked_at": cluster_status.checked_at
+    })
 
 
 @router.get(
     "/nodes/status",
-    response_model=list[dict],
+    responses={200: {"model": list[NodeStatusView]}},
     summary="Node Status List",
     description="Get the status of all nodes for display."
 )
-async def get_nodes_status() -> list[dict]:
+@cached(ttl=5, stale_on_error=True)
+async def get_nodes_status() -> Response:
     """
     모든 노드의 상태를 반환합니다.
     """
     nodes_with_status = await health_monitor.check_all_nodes()
     
-    result = []
+    # 스냅샷의 값은 이미 검증되었으므로 검증 없이 구성
+    rows = []
     for node_with_status in nodes_with_status:
-        node = node_with_status.info
-        status = node_with_status.status
+        node_id, hostname, ip, role, cpu_cores, memory_gb = _node_fields(node_with_status.info)
+        health, is_online, response_time_ms = _status_fields(node_with_status.status)
         
-        result.append({
-            "id": node.id,
-            "hostname": node.hostname,
-            "ip": node.tailscale_ip,
-            "role": node.role.value,
-            "health": status.health.value,
-            "is_online": status.is_online,
-            "response_time_ms": status.response_time_ms,
-            "cpu_cores": node.cpu_cores,
-            "memory_gb": node.memory_gb
-        })
+        rows.append(NodeStatusView.model_construct(
+            id=node_id,
+            hostname=hostname,
+            ip=ip,
+            role=role,
+            health=health,
+            is_online=is_online,
+            response_time_ms=response_time_ms,
+            cpu_cores=cpu_cores,
+            memory_gb=memory_gb
+        ))
     
-    return result
+    return Response(_NODE_STATUS_VIEW_ADAPTER.dump_json(rows), media_type="application/json")
 
 
 @router.get(
     "/images",
-    response_model=list[dict],
     summary="Available Images",
     description="Get the list of available container images."
 )
-async def get_available_images() -> list[dict]:
+async def get_available_images(
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match")
+) -> Response:
     """
     사용 가능한 컨테이너 이미지 목록을 반환합니다.
+    
+    목록은 정적이므로 미리 직렬화된 바이트를 그대로 전송하며,
+    ETag가 일치하면 본문 없이 304를 반환합니다.
     """
-    return [
-        {
-            "id": "ubuntu:22.04",
-            "name": "Ubuntu 22.04 LTS",
-            "description": "Ubuntu 22.04 LTS (Jammy Jellyfish)",
-            "category": "Operating System"
-        },
-        {
-            "id": "ubuntu:20.04",
-            "name": "Ubuntu 20.04 LTS",
-            "description": "Ubuntu 20.04 LTS (Focal Fossa)",
-            "category": "Operating System"
-        },
-        {
-            "id": "python:3.11",
-            "name": "Python 3.11",
-            "description": "Python 3.11 runtime environment",
-            "category": "Runtime"
-        },
-        {
-            "id": "python:3.10",
-            "name": "Python 3.10",
-            "description": "Python 3.10 runtime environment",
-            "category": "Runtime"
-        },
-        {
-            "id": "node:20",
-            "name": "Node.js 20",
-            "description": "Node.js 20 LTS runtime",
-            "category": "Runtime"
-        },
-        {
-            "id": "node:18",
-            "name": "Node.js 18",
-            "description": "Node.js 18 LTS runtime",
-            "category": "Runtime"
-        },
-        {
-            "id": "nginx:latest",
-            "name": "Nginx",
-            "description": "High-performance web server",
-            "category": "Web Server"
-        },
-        {
-            "id": "redis:latest",
-            "name": "Redis",
-            "description": "In-memory data store",
-            "category": "Database"
-        }
-    ]
+    if if_none_match == _IMAGES_ETAG:
+        return Response(status_code=304, headers={"ETag": _IMAGES_ETAG})
+    
+    return Response(
+        content=_IMAGES_JSON,
+        media_type="application/json",
+        headers={"ETag": _IMAGES_ETAG}
+    )
 
 
 @router.get(
     "/capacity",
-    response_model=dict,
     summary="Cluster Capacity",
     description="Get the maximum available CPU and memory from the cluster."
 )
-async def get_cluster_capacity() -> dict:
+async def get_cluster_capacity() -> ORJSONResponse:
     """
     등록된 Worker 노드 중 단일 노드가 제공할 수 있는 최대 리소스를 반환합니다.
     
     UI에서 리소스 선택 옵션을 동적으로 제한하는 데 사용됩니다.
     """
-    from services.ray_service import ray_service
-    from services.node_manager import node_manager
-    from models.node import NodeRole
-    
     # 등록된 Worker 노드 조회
     workers = await node_manager.get_nodes_by_role(NodeRole.WORKER)
     worker_ips = {w.tailscale_ip for w in workers}
     
-    # Ray에서 노드별 리소스 조회
-    ray_nodes = ray_service.get_nodes_with_available_resources()
+    # Ray에서 노드별 리소스 조회 (짧은 TTL 캐시)
+    # RayService의 스냅샷 캐시를 그대로 사용 (배치 후 invalidate_cache()가 바로 반영됨)
+    ray_nodes = await ray_service.get_nodes_with_available_resources()
     
     # Worker 노드들의 최대 용량 계산
-    max_cpu = 0
-    max_memory = 0
-    for ray_node in ray_nodes:
-        if ray_node.get("node_ip") in worker_ips:
-            max_cpu = max(max_cpu, int(ray_node.get("cpu_available", 0)))
-            max_memory = max(max_memory, int(ray_node.get("memory_available_gb", 0)))
+    worker_ray_nodes = [n for n in ray_nodes if n.get("node_ip") in worker_ips]
+    max_cpu = int(max((n.get("cpu_available", 0) for n in worker_ray_nodes), default=0))
+    max_memory = int(max((n.get("memory_available_gb", 0) for n in worker_ray_nodes), default=0))
     
     # 기본값 (Worker가 없거나 Ray 연결 안됨)
     if max_cpu == 0:
@@ -221,23 +256,15 @@ async def get_cluster_capacity() -> dict:
     if max_memory == 0:
         max_memory = 8
     
-    # CPU 옵션 생성 (1, 2, 4, ... max)
-    cpu_options = [c for c in [1, 2, 4, 8, 16, 32] if c <= max_cpu]
-    if max_cpu not in cpu_options and max_cpu > 0:
-        cpu_options.append(max_cpu)
-        cpu_options.sort()
-    
-    # 메모리 옵션 생성 (2, 4, 8, ... max)
-    memory_options = [m for m in [2, 4, 8, 16, 32, 64] if m <= max_memory]
-    if max_memory not in memory_options and max_memory > 0:
-        memory_options.append(max_memory)
-        memory_options.sort()
+    # 선택 옵션 (미리 계산된 테이블에서 조회, 범위를 넘으면 직접 계산)
+    cpu_options = _CPU_OPTIONS.get(max_cpu) or _build_options(_CPU_OPTION_STEPS, max_cpu)
+    memory_options = _MEMORY_OPTIONS.get(max_memory) or _build_options(_MEMORY_OPTION_STEPS, max_memory)
     
-    return {
+    return ORJSONResponse({
         "max_cpu": max_cpu,
         "max_memory_gb": max_memory,
         "cpu_options": cpu_options,
         "memory_options": memory_options,
-        "timestamp": datetime.now().isoformat()
-    }
+        "timestamp": request_now()
+    })
 
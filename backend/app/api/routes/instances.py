@@ -4,12 +4,15 @@
 # 설명: 사용자 인스턴스 관리 API 엔드포인트
 # ============================================================================
 
-from fastapi import APIRouter, HTTPException, Header, Query
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import TypeAdapter
 from typing import Optional
 
 from models.instance import Instance, InstanceCreate, InstanceSummary, InstanceStatus
 from services.instance_manager import instance_manager, InstanceNotFoundException, QuotaExceededException
 from core.exceptions import MCPOrchestratorException, InsufficientCapacityException
+from app.dependencies import UserIdDep
+from core.responses import ORJSONResponse
 
 
 # 라우터 생성
@@ -23,17 +26,8 @@ router = APIRouter(
     }
 )
 
-
-def get_user_id(x_user_id: Optional[str] = Header(None, alias="X-User-ID")) -> str:
-    """
-    요청에서 사용자 ID를 추출합니다.
-    
-    프로덕션에서는 JWT 토큰에서 추출해야 합니다.
-    """
-    if not x_user_id:
-        # 기본 사용자 (데모용)
-        return "user-demo-001"
-    return x_user_id
+# 인스턴스 목록 직렬화기 (응답 검증 없이 바로 JSON 바이트로 직렬화)
+_INSTANCE_LIST_ADAPTER = TypeAdapter(list[Instance])
 
 
 @router.post(
@@ -45,7 +39,7 @@ def get_user_id(x_user_id: Optional[str] = Header(None, alias="X-User-ID")) -> s
 )
 async def create_instance(
     request: InstanceCreate,
-    x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+    user_id: UserIdDep
 ) -> Instance:
     """
     새 인스턴스를 생성합니다.
@@ -55,8 +49,6 @@ async def create_instance(
     - **cpu**: CPU 코어 수 (1-8)
     - **memory**: 메모리 GB (1-32)
     """
-    user_id = get_user_id(x_user_id)
-    
     try:
         instance = await instance_manager.create_instance(user_id, request)
         return instance
@@ -85,44 +77,36 @@ async def create_instance(
 
 @router.get(
     "",
-    response_model=list[Instance],
+    responses={200: {"model": list[Instance]}},
     summary="List Instances",
     description="List all instances owned by the current user."
 )
 async def list_instances(
-    x_user_id: Optional[str] = Header(None, alias="X-User-ID"),
+    user_id: UserIdDep,
     status: Optional[InstanceStatus] = Query(None, description="Filter by status")
-) -> list[Instance]:
+) -> Response:
     """
     사용자의 모든 인스턴스를 조회합니다.
     
     - **status**: 상태별 필터링 (running, stopped, pending)
     """
-    user_id = get_user_id(x_user_id)
-    
-    instances = await instance_manager.get_user_instances(user_id)
+    instances = await instance_manager.get_user_instances(user_id, status)
     
-    if status:
-        instances = [i for i in instances if i.status == status]
-    
-    return instances
+    return Response(_INSTANCE_LIST_ADAPTER.dump_json(instances), media_type="application/json")
 
 
 @router.get(
     "/summary",
-    response_model=dict,
     summary="Instance Summary",
     description="Get a summary of instance counts by status."
 )
 async def get_instance_summary(
-    x_user_id: Optional[str] = Header(None, alias="X-User-ID")
-) -> dict:
+    user_id: UserIdDep
+) -> ORJSONResponse:
     """
     사용자의 인스턴스 요약 정보를 반환합니다.
     """
-    user_id = get_user_id(x_user_id)
-    
-    return await instance_manager.get_instance_summary(user_id)
+    return ORJSONResponse(await instance_manager.get_instance_summary(user_id))
 
 
 @router.get(
@@ -133,15 +117,13 @@ async def get_instance_summary(
 )
 async def get_instance(
     instance_id: str,
-    x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+    user_id: UserIdDep
 ) -> Instance:
     """
     특정 인스턴스의 상세 정보를 조회합니다.
     
     - **instance_id**: 인스턴스 ID
     """
-    user_id = get_user_id(x_user_id)
-    
     try:
         return await instance_manager.get_instance(instance_id, user_id)
     except InstanceNotFoundException as e:
@@ -156,15 +138,13 @@ async def get_instance(
 )
 async def stop_instance(
     instance_id: str,
-    x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+    user_id: UserIdDep
 ) -> Instance:
     """
     실행 중인 인스턴스를 중지합니다.
     
     - **instance_id**: 인스턴스 ID
     """
-    user_id = get_user_id(x_user_id)
-    
     try:
         return await instance_manager.stop_instance(instance_id, user_id)
     except InstanceNotFoundException as e:
@@ -181,15 +161,13 @@ async def stop_instance(
 )
 async def start_instance(
     instance_id: str,
-    x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+    user_id: UserIdDep
 ) -> Instance:
     """
     중지된 인스턴스를 시작합니다.
     
     - **instance_id**: 인스턴스 ID
     """
-    user_id = get_user_id(x_user_id)
-    
     try:
         return await instance_manager.start_instance(instance_id, user_id)
     except InstanceNotFoundException as e:
@@ -198,6 +176,26 @@ async def start_instance(
         raise HTTPException(status_code=400, detail=e.message)
 
 
+@router.delete(
+    "",
+    summary="Terminate Instances",
+    description="Terminate several instances at once. Unknown or already terminated IDs are skipped."
+)
+async def terminate_instances(
+    user_id: UserIdDep,
+    ids: list[str] = Query(..., description="종료할 인스턴스 ID 목록")
+) -> dict:
+    """
+    여러 인스턴스를 한 번에 종료합니다.
+    
+    - **ids**: 종료할 인스턴스 ID (여러 번 지정 가능, 예: `?ids=a&ids=b`)
+    
+    주의: 이 작업은 되돌릴 수 없습니다.
+    """
+    terminated = await instance_manager.terminate_instances(ids, user_id)
+    return {"terminated": terminated}
+
+
 @router.delete(
     "/{instance_id}",
     status_code=204,
@@ -206,7 +204,7 @@ async def start_instance(
 )
 async def terminate_instance(
     instance_id: str,
-    x_user_id: Optional[str] = Header(None, alias="X-User-ID")
+    user_id: UserIdDep
 ) -> None:
     """
     인스턴스를 종료하고 삭제합니다.
@@ -215,8 +213,6 @@ async def terminate_instance(
     
     주의: 이 작업은 되돌릴 수 없습니다.
     """
-    user_id = get_user_id(x_user_id)
-    
     try:
         await instance_manager.terminate_instance(instance_id, user_id)
     except InstanceNotFoundException as e:
@@ -5,13 +5,52 @@
 # ============================================================================
 
 import asyncio
+
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
-from services.terminal_service import terminal_manager
+from starlette.websockets import WebSocketState
+from services.terminal_service import terminal_manager, TerminalSession
 from services.instance_manager import instance_manager
 
 router = APIRouter(prefix="/ws", tags=["terminal"])
 
 
+# 클라이언트 -> 서버 바이너리 프레임 opcode (첫 1바이트)
+OP_DATA = 0x00      # 터미널 입력
+OP_RESIZE = 0x01    # 터미널 크기 변경 (JSON: {"rows": N, "cols": N})
+
+# PTY 창 크기 허용 범위 (struct winsize의 unsigned short)
+MAX_TERMINAL_SIZE = 65535
+
+
+def _valid_size(value) -> bool:
+    """터미널 행/열 값이 1..MAX_TERMINAL_SIZE 범위의 정수인지 확인합니다 (bool 제외)."""
+    return type(value) is int and 1 <= value <= MAX_TERMINAL_SIZE
+
+
+async def _handle_frame(session: TerminalSession, frame: bytes) -> None:
+    """opcode에 따라 바이너리 프레임을 처리합니다."""
+    if not frame:
+        return
+    
+    opcode = frame[0]
+    if opcode == OP_DATA:
+        await session.write(memoryview(frame)[1:])
+    elif opcode == OP_RESIZE:
+        try:
+            msg = orjson.loads(memoryview(frame)[1:])
+        except ValueError:
+            return
+        # 잘못된 크기 메시지는 무시 (세션 전체를 끊지 않음)
+        if not isinstance(msg, dict):
+            return
+        rows = msg.get("rows", 24)
+        cols = msg.get("cols", 80)
+        if not (_valid_size(rows) and _valid_size(cols)):
+            return
+        session.resize(rows=rows, cols=cols)
+
+
 @router.websocket("/terminal/{instance_id}")
 async def terminal_websocket(websocket: WebSocket, instance_id: str):
     """
@@ -20,9 +59,10 @@ async def terminal_websocket(websocket: WebSocket, instance_id: str):
     xterm.js 클라이언트와 Docker exec 프로세스를 브릿지합니다.
     
     Protocol:
-    - Client -> Server: 터미널 입력 (raw bytes)
+    - Client -> Server: 바이너리 프레임, 첫 바이트가 opcode
+      - 0x00 + 입력 바이트: 터미널 입력
+      - 0x01 + JSON {"rows": N, "cols": N}: 터미널 크기 변경
     - Server -> Client: 터미널 출력 (raw bytes)
-    - 특수 메시지: {"type": "resize", "rows": N, "cols": N}
     """
     await websocket.accept()
     
@@ -54,47 +94,53 @@ async def terminal_websocket(websocket: WebSocket, instance_id: str):
         await websocket.close(code=4007, reason="Failed to create terminal session")
         return
     
+    # 단일 코루틴 양방향 브릿지: Docker 출력과 WebSocket 입력 중 먼저 준비된 쪽을 처리
+    # (루프 안에서 반복 조회하지 않도록 메서드를 미리 바인딩)
+    send_bytes = websocket.send_bytes
+    receive_bytes = websocket.receive_bytes
+    output = aiter(session)
+    
+    output_fut = asyncio.ensure_future(anext(output, None))
+    input_fut = asyncio.ensure_future(receive_bytes())
+    close_code = 1000
     try:
-        # 읽기 태스크: Docker -> WebSocket
-        async def read_loop():
-            while session.is_running:
-                data = await session.read()
-                if data:
-                    await websocket.send_bytes(data)
-                await asyncio.sleep(0.01)
-        
-        read_task = asyncio.create_task(read_loop())
-        
-        # 쓰기 루프: WebSocket -> Docker
         while True:
-            try:
-                data = await websocket.receive()
-                
-                if "bytes" in data:
-                    await session.write(data["bytes"])
-                elif "text" in data:
-                    text = data["text"]
-                    # JSON 메시지 처리 (resize 등)
-                    if text.startswith("{"):
-                        import json
-                        try:
-                            msg = json.loads(text)
-                            if msg.get("type") == "resize":
-                                await session.resize(
-                                    rows=msg.get("rows", 24),
-                                    cols=msg.get("cols", 80)
-                                )
-                        except json.JSONDecodeError:
-                            pass
-                    else:
-                        await session.write(text.encode())
-                        
-            except WebSocketDisconnect:
-                break
-                
+            done, _ = await asyncio.wait(
+                (output_fut, input_fut),
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            
+            # Docker -> WebSocket (None이면 원격 셸 종료)
+            if output_fut in done:
+                data = output_fut.result()
+                if data is None:
+                    break
+                await send_bytes(data)
+                output_fut = asyncio.ensure_future(anext(output, None))
+            
+            # WebSocket -> Docker (연결 종료 시 WebSocketDisconnect,
+            # 텍스트 프레임이면 KeyError로 프로토콜 위반 처리)
+            if input_fut in done:
+                await _handle_frame(session, input_fut.result())
+                input_fut = asyncio.ensure_future(receive_bytes())
+    
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        print(f"Terminal bridge error: {e}")
+        close_code = 1011
     finally:
-        read_task.cancel()
+        output_fut.cancel()
+        input_fut.cancel()
+        await asyncio.wait((output_fut, input_fut))
+        await output.aclose()
         await terminal_manager.close_session(instance_id)
+    
+    if websocket.client_state == WebSocketState.CONNECTED:
+        try:
+            await websocket.close(code=close_code)
+        except RuntimeError:
+            pass
 
 
 # Router export
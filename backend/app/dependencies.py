@@ -4,7 +4,8 @@
 # 설명: FastAPI 의존성 주입을 위한 공통 의존성 정의
 # ============================================================================
 
-from typing import Generator
+from typing import Generator, Annotated, Optional
+from fastapi import Depends, Header
 from core.config import Settings, get_settings
 from services.node_manager import NodeManager, node_manager
 from services.health_monitor import HealthMonitor, health_monitor
@@ -23,3 +24,20 @@ def get_node_manager() -> NodeManager:
 def get_health_monitor() -> HealthMonitor:
     """헬스 모니터 인스턴스를 반환하는 의존성"""
     return health_monitor
+
+
+# 헤더가 없을 때 사용하는 기본 데모 사용자 ID
+DEMO_USER_ID = "user-demo-001"
+
+
+def get_user_id(x_user_id: Optional[str] = Header(None, alias="X-User-ID")) -> str:
+    """
+    요청에서 사용자 ID를 추출하는 의존성
+    
+    프로덕션에서는 JWT 토큰에서 추출해야 합니다.
+    """
+    return x_user_id or DEMO_USER_ID
+
+
+# 핸들러 시그니처용 사용자 ID 타입
+UserIdDep = Annotated[str, Depends(get_user_id)]
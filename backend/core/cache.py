@@ -0,0 +1,130 @@
+# ============================================================================
+# MCP Cloud Orchestrator - 인메모리 TTL 캐시
+# ============================================================================
+# 설명: 자주 조회되지만 드물게 변경되는 응답을 짧은 시간 재사용하기 위한 캐시
+# ============================================================================
+
+import time
+import asyncio
+import functools
+from typing import Any, Callable, Hashable, Optional
+
+
+# 캐시 미스 표시용 센티널 (None도 유효한 캐시 값이므로 별도 객체 사용)
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    TTL 기반 인메모리 캐시
+
+    만료된 항목도 maxsize를 넘기 전까지는 보관하여,
+    재계산이 실패했을 때 마지막 값(stale)을 대체 응답으로 사용할 수 있습니다.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        """
+        Args:
+            ttl: 항목 유효 시간 (초)
+            maxsize: 최대 보관 항목 수 (초과 시 가장 오래된 항목부터 제거)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """유효 기간 내의 값을 반환합니다."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.ttl:
+            return default
+        return entry[1]
+
+    def age(self, key: Hashable) -> Optional[float]:
+        """항목이 저장된 후 경과한 시간(초)을 반환합니다. 항목이 없으면 None."""
+        entry = self._entries.get(key)
+        return None if entry is None else time.monotonic() - entry[0]
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """만료 여부와 관계없이 마지막으로 저장된 값을 반환합니다."""
+        entry = self._entries.get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값을 저장합니다."""
+        # 재삽입으로 순서를 갱신하여 가장 오래된 항목이 맨 앞에 오도록 유지
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic(), value)
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        self._entries.clear()
+
+
+def cached(
+    ttl: float,
+    maxsize: int = 128,
+    stale_on_error: bool = False,
+    stale_ttl: float = 0,
+) -> Callable:
+    """
+    비동기 함수(라우트 핸들러)의 결과를 키워드 인자 기준으로 캐싱하는 데코레이터
+
+    FastAPI는 키워드 인자로 핸들러를 호출하므로 X-User-ID 헤더, 쿼리 파라미터 등이
+    그대로 캐시 키에 포함되어 사용자 간 응답이 섞이지 않습니다.
+
+    Args:
+        ttl: 캐시 유효 시간 (초)
+        maxsize: 최대 보관 항목 수
+        stale_on_error: True이면 재계산 실패 시 마지막 값으로 응답
+        stale_ttl: TTL 만료 후 이 시간(초) 동안은 이전 값을 바로 반환하고
+            백그라운드에서 갱신합니다 (stale-while-revalidate)
+    """
+    def decorator(func: Callable) -> Callable:
+        cache = TTLCache(ttl, maxsize)
+        refreshing: dict[Hashable, asyncio.Task] = {}
+
+        async def refresh(key, args, kwargs):
+            try:
+                value = await func(*args, **kwargs)
+            except Exception:
+                if stale_on_error:
+                    stale = cache.get_stale(key, _MISSING)
+                    if stale is not _MISSING:
+                        return stale
+                raise
+            cache.set(key, value)
+            return value
+
+        def refresh_in_background(key, args, kwargs):
+            if key in refreshing:
+                return
+            task = asyncio.create_task(refresh(key, args, kwargs))
+            refreshing[key] = task
+
+            def on_done(t: asyncio.Task) -> None:
+                refreshing.pop(key, None)
+                # 실패는 다음 요청의 동기 갱신에서 다시 드러나므로 예외만 회수
+                if not t.cancelled():
+                    t.exception()
+
+            task.add_done_callback(on_done)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            age = cache.age(key)
+            if age is not None:
+                if age <= ttl:
+                    return cache.get_stale(key)
+                if age <= ttl + stale_ttl:
+                    refresh_in_background(key, args, kwargs)
+                    return cache.get_stale(key)
+
+            return await refresh(key, args, kwargs)
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
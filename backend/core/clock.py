@@ -0,0 +1,53 @@
+# ============================================================================
+# MCP Cloud Orchestrator - 요청 시각
+# ============================================================================
+# 설명: 요청 단위로 한 번만 읽은 시각을 ContextVar로 공유
+# ============================================================================
+
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+# 요청 시작 시각 (epoch 나노초, 요청 밖에서는 None)
+request_start_ns: ContextVar[Optional[int]] = ContextVar("request_start_ns", default=None)
+
+
+def request_now() -> datetime:
+    """
+    현재 요청의 시작 시각을 반환합니다.
+
+    한 요청 안에서는 항상 같은 값을 반환하며, 요청 컨텍스트 밖에서 호출되면
+    현재 시각을 반환합니다. 응답에는 datetime 그대로 넣으면 orjson이 직접
+    ISO 8601 문자열로 직렬화합니다.
+    """
+    start_ns = request_start_ns.get()
+    if start_ns is None:
+        return datetime.now()
+    return datetime.fromtimestamp(start_ns / 1_000_000_000)
+
+
+class RequestClockMiddleware:
+    """
+    요청 시작 시각을 ContextVar에 기록하는 ASGI 미들웨어
+
+    BaseHTTPMiddleware와 달리 별도 태스크를 만들지 않으므로
+    핸들러에서 같은 컨텍스트의 값을 그대로 읽을 수 있습니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = request_start_ns.set(time.time_ns())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_start_ns.reset(token)
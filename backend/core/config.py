@@ -4,7 +4,7 @@
 # 설명: Pydantic Settings를 활용한 환경 설정 관리
 # ============================================================================
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 from typing import Optional
 from functools import lru_cache
@@ -15,8 +15,16 @@ class Settings(BaseSettings):
     애플리케이션 환경 설정 클래스
     
     환경변수 또는 .env 파일에서 설정값을 로드합니다.
+    시작 시 한 번 로드한 뒤 변경하지 않으므로 불변(frozen)으로 정의합니다.
     """
     
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True
+    )
+    
     # 앱 기본 설정
     app_name: str = Field(default="MCP Cloud Orchestrator", description="애플리케이션 이름")
     app_version: str = Field(default="0.1.0", description="애플리케이션 버전")
@@ -31,15 +39,18 @@ class Settings(BaseSettings):
     
     # 헬스체크 설정
     health_check_timeout: float = Field(default=5.0, description="헬스체크 타임아웃 (초)")
-    health_check_interval: int = Field(default=30, description="헬스체크 주기 (초)")
+    health_check_interval: int = Field(default=10, description="백그라운드 헬스체크 주기 (초)")
+    health_check_http_port: Optional[int] = Field(default=None, description="HTTP 헬스체크 포트 (설정 시 TCP 22 프로브 대신 HTTP 엔드포인트 확인)")
+    health_check_http_path: str = Field(default="/healthz", description="HTTP 헬스체크 경로")
+    health_check_fresh_ttl: float = Field(default=5.0, description="정상 노드 재확인 생략 시간 (초, 0이면 항상 확인)")
+    health_check_parallelism: int = Field(default=32, description="동시에 진행할 최대 헬스체크 수 (노드 증가 시 SYN 폭주 방지)")
+    health_check_deadline: float = Field(default=2.0, description="전체 노드 헬스체크 마감 시간 (초, 넘으면 남은 노드는 비정상 처리)")
+    
+    # Ray 설정
+    ray_cache_ttl: float = Field(default=2.0, description="Ray 클러스터 상태 스냅샷 재사용 시간 (초)")
     
     # Tailscale 설정
     tailscale_network: str = Field(default="100.64.0.0/10", description="Tailscale 네트워크 CIDR")
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
 
 
 @lru_cache()
@@ -0,0 +1,69 @@
+# ============================================================================
+# MCP Cloud Orchestrator - JSON 파일 입출력
+# ============================================================================
+# 설명: data/*.json 저장소 파일을 읽고 쓰는 공용 헬퍼 (orjson + 스레드 오프로딩)
+# ============================================================================
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+# 저장 파일 형식: 2칸 들여쓰기, 비ASCII 문자 그대로 (기존 json.dumps(indent=2, ensure_ascii=False)와 동일)
+_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# 자주 다시 쓰는 저장소용 압축 형식 (들여쓰기 없음, 필요하면 python -m json.tool로 확인)
+_COMPACT_DUMP_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dump_json(data: Any, compact: bool = False) -> bytes:
+    """저장 형식으로 직렬화합니다."""
+    return orjson.dumps(data, option=_COMPACT_DUMP_OPTIONS if compact else _DUMP_OPTIONS)
+
+
+def _load_file(path: Path) -> Any:
+    """파일을 한 번에 읽어 orjson으로 파싱합니다 (스레드에서 실행)."""
+    return orjson.loads(path.read_bytes())
+
+
+async def read_json(path: Path) -> Any:
+    """
+    JSON 파일을 읽어 파싱합니다.
+
+    읽기와 파싱을 같은 워커 스레드에서 수행하여, 재시작 직후처럼 큰 파일을 처음
+    읽을 때도 파싱이 이벤트 루프를 한 번에 오래 막지 않도록 합니다.
+    파싱 오류는 json.JSONDecodeError의 하위 클래스인 orjson.JSONDecodeError로 전달됩니다.
+    """
+    return await asyncio.to_thread(_load_file, path)
+
+
+def _replace_file(path: Path, payload: bytes) -> None:
+    """같은 디렉토리의 임시 파일에 쓴 뒤 원자적으로 교체합니다."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
+async def write_json(path: Path, data: Any, compact: bool = False) -> None:
+    """
+    데이터를 JSON 파일로 저장합니다.
+
+    직렬화는 호출한 이벤트 루프 스레드에서 수행하여 다른 코루틴이 같은 dict를
+    수정하는 도중에 읽는 일이 없도록 하고, 파일 쓰기만 스레드로 넘깁니다.
+    임시 파일에 쓴 뒤 교체하므로 읽는 쪽이나 중단된 쓰기가 잘린 파일을 남기지 않습니다.
+
+    Args:
+        path: 저장할 파일 경로
+        data: 저장할 데이터
+        compact: True이면 들여쓰기 없이 저장 (변경이 잦은 저장소용)
+    """
+    payload = dump_json(data, compact)
+    await write_encoded(path, payload)
+
+
+async def write_encoded(path: Path, payload: bytes) -> None:
+    """이미 직렬화된 JSON 바이트를 write_json과 같은 방식(원자적 교체)으로 저장합니다."""
+    await asyncio.to_thread(_replace_file, path, payload)
@@ -0,0 +1,24 @@
+# ============================================================================
+# MCP Cloud Orchestrator - 응답 클래스
+# ============================================================================
+# 설명: orjson 기반 JSON 응답 클래스 정의
+# ============================================================================
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    orjson으로 직렬화하는 JSON 응답
+
+    표준 json 모듈 대신 C 구현인 orjson을 사용하여 직렬화 비용을 줄입니다.
+    datetime, Enum, UUID 등은 orjson이 직접 처리합니다.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
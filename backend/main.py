@@ -17,10 +17,17 @@ from fastapi.middleware.cors import CORSMiddleware
 sys.path.insert(0, str(Path(__file__).parent))
 
 from core.config import settings
+from core.responses import ORJSONResponse
+from core.clock import RequestClockMiddleware
 from app.api import cluster_router, instances_router, auth_router, dashboard_router, ray_router, terminal_router
 from services.health_monitor import health_monitor
 from services.ray_service import ray_service
 from services.docker_orchestrator import docker_orchestrator
+from services.auth_service import auth_service
+from services.billing_service import billing_service
+from services.instance_manager import instance_manager
+from services.port_allocator import port_allocator
+from services.terminal_service import terminal_manager
 
 
 @asynccontextmanager
@@ -38,12 +45,23 @@ async def lifespan(app: FastAPI):
     print(f"🎯 Ray Dashboard: http://100.117.45.28:8265")
     print("=" * 60)
     
+    # 헬스체크용 공유 HTTP 커넥션 풀 준비
+    await health_monitor.start()
+    # Ray 연결 상태 백그라운드 확인 (요청마다 연결을 확인하지 않도록)
+    await ray_service.start()
+    
     yield
     
     # 종료 시 실행
     print("\n🛑 서버 종료 중...")
     await health_monitor.close()
+    await auth_service.flush()
+    await billing_service.flush()
+    await instance_manager.flush()
+    await port_allocator.flush()
+    await terminal_manager.close_all()
     docker_orchestrator.close_all_connections()
+    await ray_service.close()
     ray_service.disconnect()
     print("✅ 리소스 정리 완료")
 
@@ -72,11 +90,13 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS 미들웨어 설정
 # Production: Tailscale Funnel을 통한 접근 허용
-ALLOWED_ORIGINS = [
+# (요청마다 Origin 포함 여부를 확인하므로 frozenset으로 O(1) 조회)
+ALLOWED_ORIGINS = frozenset([
     "https://kws.p-e.kr",
     "http://kws.p-e.kr",
     "https://camp-gpu-16.tailab95b0.ts.net",
@@ -86,7 +106,7 @@ ALLOWED_ORIGINS = [
     "http://127.0.0.1:5174",
     "http://100.117.45.28:5174",
     "http://100.117.45.28",
-]
+])
 
 app.add_middleware(
     CORSMiddleware,
@@ -96,6 +116,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 시각 기록 미들웨어 (핸들러는 request_now()로 조회)
+app.add_middleware(RequestClockMiddleware)
+
 # 라우터 등록
 app.include_router(cluster_router)
 app.include_router(instances_router)
@@ -141,5 +164,14 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        log_level="info"
+        log_level="info",
+        # C 구현 이벤트 루프 / HTTP 파서 / WebSocket 구현 (uvicorn[standard]에 포함)
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        # 터미널 WebSocket: 바이너리 출력은 압축 효과가 적으므로 deflate 비활성화,
+        # 붙여넣기 등 입력 버스트가 막히지 않도록 수신 큐 확장
+        # (출력 쪽 메모리는 TerminalSession의 병합 버퍼 크기로 제한됨)
+        ws_max_queue=1024,
+        ws_per_message_deflate=False,
     )
@@ -4,7 +4,9 @@
 # 설명: 클러스터 전체 상태를 나타내는 Pydantic 모델
 # ============================================================================
 
-from pydantic import BaseModel, Field, computed_field
+from operator import attrgetter
+
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 from typing import Optional
 from datetime import datetime
 from enum import Enum
@@ -12,6 +14,11 @@ from enum import Enum
 from .node import NodeWithStatus, NodeHealth
 
 
+# 노드 상태 목록 집계용 필드 추출기 (C 구현이라 요소마다 파이썬 코드를 거치지 않음)
+_IS_ONLINE = attrgetter("status.is_online")
+_HEALTH = attrgetter("status.health")
+
+
 class ClusterHealth(str, Enum):
     """클러스터 전체 헬스 상태"""
     HEALTHY = "healthy"              # 모든 노드 정상
@@ -31,6 +38,34 @@ class ClusterSummary(BaseModel):
     healthy_nodes: int = Field(..., description="정상 노드 수")
     unhealthy_nodes: int = Field(..., description="비정상 노드 수")
     
+    @classmethod
+    def from_nodes(cls, nodes: list[NodeWithStatus]) -> "ClusterSummary":
+        """
+        노드 상태 목록으로 요약을 계산합니다.
+        
+        순회와 필드 접근은 map/attrgetter, 개수 세기는 list.count로 처리하여
+        요소마다 파이썬 바이트코드를 실행하지 않습니다.
+        
+        Args:
+            nodes: 상태가 포함된 노드 목록
+            
+        Returns:
+            ClusterSummary: 집계된 상태 요약
+        """
+        online = sum(map(_IS_ONLINE, nodes))
+        healths = list(map(_HEALTH, nodes))
+        healthy = healths.count(NodeHealth.HEALTHY)
+        unhealthy = healths.count(NodeHealth.UNHEALTHY)
+        
+        total = len(nodes)
+        return cls(
+            total_nodes=total,
+            online_nodes=online,
+            offline_nodes=total - online,
+            healthy_nodes=healthy,
+            unhealthy_nodes=unhealthy
+        )
+    
     @computed_field
     @property
     def availability_percent(self) -> float:
@@ -60,8 +95,8 @@ class ClusterStatus(BaseModel):
     # 메시지
     message: Optional[str] = Field(default=None, description="상태 메시지")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "cluster_name": "mcp-cluster",
                 "health": "healthy",
@@ -76,6 +111,7 @@ class ClusterStatus(BaseModel):
                 "message": "모든 노드가 정상 작동 중입니다."
             }
         }
+    )
 
     @classmethod
     def calculate_health(cls, summary: ClusterSummary) -> ClusterHealth:
@@ -4,11 +4,11 @@
 # 설명: 사용자 컨테이너 인스턴스 정보를 나타내는 Pydantic 모델
 # ============================================================================
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 from enum import Enum
-import uuid
+import secrets
 
 
 class InstanceStatus(str, Enum):
@@ -40,8 +40,8 @@ class InstanceCreate(BaseModel):
     cpu: int = Field(default=1, ge=1, le=8, description="CPU 코어 수")
     memory: int = Field(default=2, ge=1, le=32, description="메모리 (GB)")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "my-web-server",
                 "image": "ubuntu:22.04",
@@ -49,12 +49,13 @@ class InstanceCreate(BaseModel):
                 "memory": 4
             }
         }
+    )
 
 
 class Instance(BaseModel):
     """인스턴스 정보 모델"""
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8], description="인스턴스 고유 ID")
+    id: str = Field(default_factory=lambda: secrets.token_hex(4), description="인스턴스 고유 ID")
     name: str = Field(..., description="인스턴스 이름")
     image: str = Field(..., description="컨테이너 이미지")
     
@@ -80,8 +81,8 @@ class Instance(BaseModel):
     # 메타데이터
     tags: list[str] = Field(default_factory=list, description="태그 목록")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "i-abc1234",
                 "name": "my-web-server",
@@ -97,12 +98,17 @@ class Instance(BaseModel):
                 "started_at": "2026-01-30T10:00:05Z"
             }
         }
+    )
     
     @property
     def uptime_seconds(self) -> Optional[int]:
         """인스턴스 가동 시간 (초)"""
+        return self.uptime_seconds_at(datetime.now())
+    
+    def uptime_seconds_at(self, now: datetime) -> Optional[int]:
+        """주어진 기준 시각에서의 가동 시간 (초)"""
         if self.started_at and self.status == InstanceStatus.RUNNING:
-            return int((datetime.now() - self.started_at).total_seconds())
+            return int((now - self.started_at).total_seconds())
         return None
     
     @property
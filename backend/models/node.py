@@ -4,7 +4,7 @@
 # 설명: Tailscale 노드 정보 및 상태를 나타내는 Pydantic 모델
 # ============================================================================
 
-from pydantic import BaseModel, Field, IPvAnyAddress
+from pydantic import BaseModel, ConfigDict, Field, IPvAnyAddress
 from typing import Optional
 from datetime import datetime
 from enum import Enum
@@ -30,8 +30,25 @@ class NodeInfo(BaseModel):
     노드 기본 정보 모델
     
     17개 Tailscale 노드의 기본 정보를 저장합니다.
+    캐시와 헬스체크 스냅샷에서 여러 요청이 같은 객체를 공유하므로 불변으로 정의합니다.
     """
     
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "id": "node-01",
+                "hostname": "cpu-worker-01",
+                "tailscale_ip": "100.64.0.1",
+                "role": "worker",
+                "description": "GPU 없는 CPU 전용 워커 노드",
+                "cpu_cores": 8,
+                "memory_gb": 32.0,
+                "tags": ["production", "high-memory"]
+            }
+        }
+    )
+    
     id: str = Field(..., description="노드 고유 식별자", examples=["node-01"])
     hostname: str = Field(..., description="호스트명", examples=["cpu-worker-01"])
     tailscale_ip: str = Field(..., description="Tailscale VPN IP 주소", examples=["100.64.0.1"])
@@ -45,20 +62,6 @@ class NodeInfo(BaseModel):
     # 메타데이터
     created_at: datetime = Field(default_factory=datetime.now, description="등록 시간")
     tags: list[str] = Field(default_factory=list, description="태그 목록")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "node-01",
-                "hostname": "cpu-worker-01",
-                "tailscale_ip": "100.64.0.1",
-                "role": "worker",
-                "description": "GPU 없는 CPU 전용 워커 노드",
-                "cpu_cores": 8,
-                "memory_gb": 32.0,
-                "tags": ["production", "high-memory"]
-            }
-        }
 
 
 class NodeStatus(BaseModel):
@@ -68,6 +71,20 @@ class NodeStatus(BaseModel):
     헬스체크 결과를 포함한 노드의 현재 상태를 나타냅니다.
     """
     
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "node_id": "node-01",
+                "health": "healthy",
+                "is_online": True,
+                "response_time_ms": 12.5,
+                "last_check_at": "2026-01-30T05:20:00Z",
+                "error_message": None
+            }
+        }
+    )
+    
     node_id: str = Field(..., description="노드 고유 식별자")
     health: NodeHealth = Field(default=NodeHealth.UNKNOWN, description="헬스 상태")
     is_online: bool = Field(default=False, description="온라인 여부")
@@ -80,18 +97,6 @@ class NodeStatus(BaseModel):
     # 리소스 정보 (확장용)
     cpu_usage_percent: Optional[float] = Field(default=None, description="CPU 사용률 (%)")
     memory_usage_percent: Optional[float] = Field(default=None, description="메모리 사용률 (%)")
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "node_id": "node-01",
-                "health": "healthy",
-                "is_online": True,
-                "response_time_ms": 12.5,
-                "last_check_at": "2026-01-30T05:20:00Z",
-                "error_message": None
-            }
-        }
 
 
 class NodeWithStatus(BaseModel):
@@ -99,5 +104,25 @@ class NodeWithStatus(BaseModel):
     노드 정보와 상태를 결합한 모델
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     info: NodeInfo = Field(..., description="노드 기본 정보")
     status: NodeStatus = Field(..., description="노드 현재 상태")
+
+
+class NodeStatusView(BaseModel):
+    """
+    대시보드 노드 목록용 평탄화된 노드 상태 모델
+    
+    NodeWithStatus에서 화면 표시에 필요한 필드만 추려 한 단계로 펼친 형태입니다.
+    """
+    
+    id: str = Field(..., description="노드 고유 식별자")
+    hostname: str = Field(..., description="호스트명")
+    ip: str = Field(..., description="Tailscale VPN IP 주소")
+    role: NodeRole = Field(..., description="노드 역할")
+    health: NodeHealth = Field(..., description="헬스 상태")
+    is_online: bool = Field(..., description="온라인 여부")
+    response_time_ms: Optional[float] = Field(default=None, description="응답 시간 (밀리초)")
+    cpu_cores: Optional[int] = Field(default=None, description="CPU 코어 수")
+    memory_gb: Optional[float] = Field(default=None, description="메모리 용량 (GB)")
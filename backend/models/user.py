@@ -2,9 +2,11 @@
 # MCP Cloud Orchestrator - 사용자 모델
 # ============================================================================
 # 설명: 사용자 정보 및 인증을 위한 Pydantic 모델
+#       저장소에서 읽는 경로는 model_construct로 검증 없이 생성하고,
+#       HTTP 요청 본문 등 외부 입력만 전체 검증을 거칩니다.
 # ============================================================================
 
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
 from typing import Optional
 from datetime import datetime
 import uuid
@@ -13,6 +15,8 @@ import uuid
 class UserQuota(BaseModel):
     """사용자 리소스 쿼터 모델"""
     
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+    
     max_instances: int = Field(default=5, description="최대 인스턴스 수")
     max_cpu: int = Field(default=16, description="최대 CPU 코어 수")
     max_memory: int = Field(default=32, description="최대 메모리 (GB)")
@@ -50,7 +54,7 @@ class UserQuota(BaseModel):
 class User(BaseModel):
     """사용자 정보 모델"""
     
-    id: str = Field(default_factory=lambda: f"user-{str(uuid.uuid4())[:8]}", description="사용자 고유 ID")
+    id: str = Field(default_factory=lambda: f"user-{uuid.uuid4().hex[:8]}", description="사용자 고유 ID")
     username: str = Field(..., description="사용자 이름", min_length=3, max_length=32)
     email: Optional[str] = Field(default=None, description="이메일 주소")
     
@@ -64,8 +68,10 @@ class User(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now, description="생성 시간")
     last_login_at: Optional[datetime] = Field(default=None, description="마지막 로그인 시간")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        json_schema_extra={
             "example": {
                 "id": "user-abc1234",
                 "username": "developer",
@@ -81,6 +87,7 @@ class User(BaseModel):
                 "is_active": True
             }
         }
+    )
 
 
 class UserLogin(BaseModel):
@@ -93,7 +100,9 @@ class UserLogin(BaseModel):
 class UserSession(BaseModel):
     """사용자 세션 모델"""
     
-    session_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="세션 ID")
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+    
+    session_id: str = Field(default_factory=lambda: uuid.uuid4().hex, description="세션 ID")
     user_id: str = Field(..., description="사용자 ID")
     username: str = Field(..., description="사용자 이름")
     created_at: datetime = Field(default_factory=datetime.now, description="세션 생성 시간")
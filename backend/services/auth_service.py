@@ -5,15 +5,37 @@
 #       프로덕션에서는 JWT 또는 OAuth 사용 권장
 # ============================================================================
 
-import json
-import aiofiles
+import asyncio
+import heapq
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 from datetime import datetime, timedelta
 import uuid
 
 from models.user import User, UserQuota, UserSession, UserLogin
 from core.config import settings
+from core.jsonio import read_json, write_json
+
+
+# 로그인 시각(last_login_at)은 즉시 저장하지 않고 이 시간(초) 동안 모아서 한 번에 저장
+LOGIN_FLUSH_DELAY = 5.0
+
+# 만료 세션 일괄 정리 최소 간격 (초)
+SESSION_EVICT_INTERVAL = 1.0
+
+
+def _parse_timestamp(value: Union[int, float, str, None]) -> Optional[datetime]:
+    """
+    users.json에 저장된 시각을 datetime으로 변환합니다.
+    
+    새로 기록되는 값은 epoch 초(int)이며, 이전 형식인 ISO 문자열도 그대로 읽습니다.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+    return datetime.fromisoformat(value)
 
 
 class AuthService:
@@ -36,16 +58,26 @@ class AuthService:
             str(Path(settings.nodes_file_path).parent / "users.json")
         )
         self._users_cache: dict = {}
+        self._users_mtime_ns: int = 0
+        self._username_index: dict[str, str] = {}
+        # 메모리 캐시에만 반영되고 아직 파일에 저장되지 않은 변경이 있는지 여부
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._load_task: Optional[asyncio.Task] = None
+        self._users_lock = asyncio.Lock()
         self._sessions: dict[str, UserSession] = {}
+        self._session_expiry: list[tuple[datetime, str]] = []
+        self._last_evicted_at: float = 0.0
     
     async def _ensure_file_exists(self) -> None:
         """사용자 파일이 존재하는지 확인하고, 없으면 생성합니다."""
         if not self.users_file_path.exists():
             self.users_file_path.parent.mkdir(parents=True, exist_ok=True)
+            now = datetime.now()
             initial_data = {
                 "metadata": {
                     "version": "1.0",
-                    "updated_at": datetime.now().isoformat(),
+                    "updated_at": now.isoformat(),
                     "description": "사용자 데이터 저장소"
                 },
                 "users": {
@@ -63,31 +95,117 @@ class AuthService:
                             "used_memory": 0
                         },
                         "is_active": True,
-                        "created_at": datetime.now().isoformat()
+                        "created_at": int(now.timestamp())
                     }
                 }
             }
-            async with aiofiles.open(self.users_file_path, mode='w', encoding='utf-8') as f:
-                await f.write(json.dumps(initial_data, indent=2, ensure_ascii=False))
+            await write_json(self.users_file_path, initial_data)
     
     async def _load_users(self) -> dict:
-        """사용자 정보를 로드합니다."""
-        await self._ensure_file_exists()
+        """
+        사용자 정보를 로드합니다.
+        
+        파일 수정 시각(mtime)이 마지막으로 읽은 시점과 같으면 락 없이 메모리 캐시를 반환하고,
+        외부에서 파일이 변경된 경우에만 다시 읽습니다. 동시에 들어온 요청들은
+        진행 중인 하나의 읽기 결과를 함께 기다립니다.
+        아직 저장되지 않은 변경이 있으면 메모리 캐시가 최신이므로 다시 읽지 않습니다
+        (다시 읽으면 지연 저장 대기 중인 변경이 사라짐).
+        """
+        if self._dirty and self._users_cache:
+            return self._users_cache
+        
+        try:
+            mtime_ns = self.users_file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        if self._users_cache and mtime_ns == self._users_mtime_ns:
+            return self._users_cache
         
-        async with aiofiles.open(self.users_file_path, mode='r', encoding='utf-8') as f:
-            content = await f.read()
-            data = json.loads(content)
-            self._users_cache = data
-            return data
+        if self._load_task is None:
+            self._load_task = asyncio.create_task(self._reload_users())
+        return await asyncio.shield(self._load_task)
+    
+    async def _reload_users(self) -> dict:
+        """사용자 파일을 다시 읽어 캐시를 갱신합니다 (동시 요청당 한 번만 실행)."""
+        try:
+            async with self._users_lock:
+                await self._ensure_file_exists()
+                
+                mtime_ns = self.users_file_path.stat().st_mtime_ns
+                if self._users_cache and (self._dirty or mtime_ns == self._users_mtime_ns):
+                    return self._users_cache
+                
+                data = await read_json(self.users_file_path)
+                self._set_cache(data, mtime_ns)
+                return data
+        finally:
+            self._load_task = None
     
     async def _save_users(self, data: dict) -> None:
-        """사용자 정보를 저장합니다."""
+        """
+        사용자 정보를 저장합니다 (캐시에도 즉시 반영).
+        
+        Args:
+            data: 저장할 전체 사용자 데이터
+        """
         data["metadata"]["updated_at"] = datetime.now().isoformat()
         
-        async with aiofiles.open(self.users_file_path, mode='w', encoding='utf-8') as f:
-            await f.write(json.dumps(data, indent=2, ensure_ascii=False))
+        async with self._users_lock:
+            # 직렬화 시점에 캐시 전체(대기 중인 변경 포함)가 기록되므로 먼저 해제하고,
+            # 저장 중에 생긴 변경은 다시 dirty로 남음
+            self._dirty = False
+            try:
+                await write_json(self.users_file_path, data)
+            except BaseException:
+                self._dirty = True
+                raise
+            
+            self._set_cache(data, self.users_file_path.stat().st_mtime_ns)
+    
+    def _schedule_flush(self) -> None:
+        """
+        메모리에 반영된 변경을 지연 저장하도록 예약합니다 (이미 예약돼 있으면 합쳐짐).
         
+        저장될 때까지는 파일이 외부에서 바뀌어도 캐시를 다시 읽지 않습니다.
+        """
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
+    async def _flush_later(self) -> None:
+        """잠시 기다린 뒤 그동안 쌓인 메모리 변경을 한 번에 저장합니다 (실패 시 재시도)."""
+        while True:
+            await asyncio.sleep(LOGIN_FLUSH_DELAY)
+            try:
+                await self._flush_dirty()
+            except Exception as e:
+                print(f"Failed to flush users: {e}")
+            if not self._dirty:
+                return
+    
+    async def _flush_dirty(self) -> None:
+        """저장되지 않은 변경이 있으면 파일에 저장합니다."""
+        if not self._dirty:
+            return
+        await self._save_users(self._users_cache)
+    
+    async def flush(self) -> None:
+        """
+        예약된 지연 저장을 즉시 수행합니다.
+        (애플리케이션 종료 시 호출, 이전 지연 저장이 실패했어도 다시 시도)
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self._flush_dirty()
+    
+    def _set_cache(self, data: dict, mtime_ns: int) -> None:
+        """캐시와 사용자 이름 인덱스(username -> user_id)를 갱신합니다."""
         self._users_cache = data
+        self._users_mtime_ns = mtime_ns
+        self._username_index = {
+            user_data.get("username"): user_id
+            for user_id, user_data in data.get("users", {}).items()
+        }
     
     async def authenticate(self, username: str, password: str) -> Optional[UserSession]:
         """
@@ -102,31 +220,36 @@ class AuthService:
         """
         data = await self._load_users()
         
-        for user_id, user_data in data.get("users", {}).items():
-            if user_data.get("username") == username:
-                # 간단한 비밀번호 비교 (프로덕션에서는 해시 비교 필요)
-                if user_data.get("password_hash") == password:
-                    if not user_data.get("is_active", True):
-                        return None
-                    
-                    # 세션 생성
-                    session = UserSession(
-                        session_id=str(uuid.uuid4()),
-                        user_id=user_id,
-                        username=username,
-                        created_at=datetime.now(),
-                        expires_at=datetime.now() + timedelta(hours=24)
-                    )
-                    
-                    self._sessions[session.session_id] = session
-                    
-                    # 마지막 로그인 시간 업데이트
-                    user_data["last_login_at"] = datetime.now().isoformat()
-                    await self._save_users(data)
-                    
-                    return session
+        user_id = self._username_index.get(username)
+        if not user_id:
+            return None
+        user_data = data["users"][user_id]
+        
+        # 간단한 비밀번호 비교 (프로덕션에서는 해시 비교 필요)
+        if user_data.get("password_hash") != password:
+            return None
+        if not user_data.get("is_active", True):
+            return None
         
-        return None
+        # 세션 생성 (현재 시각은 한 번만 조회)
+        # 모든 필드를 서비스가 직접 채우므로 검증 없이 생성 (외부 입력은 UserLogin에서 검증됨)
+        now = datetime.now()
+        session = UserSession.model_construct(
+            session_id=uuid.uuid4().hex,
+            user_id=user_id,
+            username=username,
+            created_at=now,
+            expires_at=now + timedelta(hours=24)
+        )
+        
+        self._sessions[session.session_id] = session
+        heapq.heappush(self._session_expiry, (session.expires_at, session.session_id))
+        
+        # 마지막 로그인 시간 업데이트 (메모리에 먼저 반영, 파일 저장은 지연)
+        user_data["last_login_at"] = int(now.timestamp())
+        self._schedule_flush()
+        
+        return session
     
     async def get_user_by_id(self, user_id: str) -> Optional[User]:
         """
@@ -144,14 +267,23 @@ class AuthService:
         if not user_data:
             return None
         
-        return User(
+        return self._build_user(user_data)
+    
+    def _build_user(self, user_data: dict) -> User:
+        """
+        저장된 사용자 데이터로 User 모델을 생성합니다.
+        
+        서비스가 직접 기록한 데이터이므로 검증 없이(model_construct) 생성하고,
+        저장된 시각만 datetime으로 변환합니다. 검증은 쓰기 경로에서 수행됩니다.
+        """
+        return User.model_construct(
             id=user_data.get("id"),
             username=user_data.get("username"),
             email=user_data.get("email"),
-            quota=UserQuota(**user_data.get("quota", {})),
+            quota=UserQuota.model_construct(**user_data.get("quota", {})),
             is_active=user_data.get("is_active", True),
-            created_at=datetime.fromisoformat(user_data.get("created_at", datetime.now().isoformat())),
-            last_login_at=datetime.fromisoformat(user_data["last_login_at"]) if user_data.get("last_login_at") else None
+            created_at=_parse_timestamp(user_data.get("created_at")) or datetime.now(),
+            last_login_at=_parse_timestamp(user_data.get("last_login_at"))
         )
     
     async def get_user_by_username(self, username: str) -> Optional[User]:
@@ -166,13 +298,13 @@ class AuthService:
         """
         data = await self._load_users()
         
-        for user_id, user_data in data.get("users", {}).items():
-            if user_data.get("username") == username:
-                return await self.get_user_by_id(user_id)
+        user_id = self._username_index.get(username)
+        if not user_id:
+            return None
         
-        return None
+        return self._build_user(data["users"][user_id])
     
-    async def validate_session(self, session_id: str) -> Optional[UserSession]:
+    def validate_session(self, session_id: str) -> Optional[UserSession]:
         """
         세션을 검증합니다.
         
@@ -182,6 +314,7 @@ class AuthService:
         Returns:
             Optional[UserSession]: 유효한 세션, 만료됐거나 없으면 None
         """
+        self._evict_expired()
         session = self._sessions.get(session_id)
         
         if not session:
@@ -193,7 +326,25 @@ class AuthService:
         
         return session
     
-    async def invalidate_session(self, session_id: str) -> bool:
+    def _evict_expired(self) -> None:
+        """
+        만료된 세션을 만료 시각 순서(힙)로 일괄 제거합니다.
+        
+        호출 빈도와 관계없이 SESSION_EVICT_INTERVAL에 한 번만 수행합니다.
+        """
+        monotonic_now = time.monotonic()
+        if monotonic_now - self._last_evicted_at < SESSION_EVICT_INTERVAL:
+            return
+        self._last_evicted_at = monotonic_now
+        
+        now = datetime.now()
+        expiry = self._session_expiry
+        while expiry and expiry[0][0] < now:
+            _, session_id = heapq.heappop(expiry)
+            # 로그아웃으로 이미 제거된 세션은 건너뜀
+            self._sessions.pop(session_id, None)
+    
+    def invalidate_session(self, session_id: str) -> bool:
         """
         세션을 무효화합니다.
         
@@ -228,6 +379,40 @@ class AuthService:
         await self._save_users(data)
         return True
     
+    async def adjust_user_quota(self, user_id: str, instances: int, cpu: int, memory: int) -> bool:
+        """
+        사용자 쿼터 사용량에 증감분을 더합니다 (0 미만으로 내려가지 않음).
+        
+        로드 이후 await 없이 캐시의 dict를 한 번에 갱신하므로 같은 사용자에 대한
+        동시 요청이 서로의 변경을 덮어쓰지 않습니다. 파일 저장은 지연 저장으로 합쳐지며,
+        저장될 때까지는 캐시가 dirty로 표시되어 파일 재로드로 증감분이 사라지지 않습니다
+        (저장에 실패하면 다시 시도하고, 종료 시 flush()로 남은 변경을 저장).
+        
+        Args:
+            user_id: 사용자 ID
+            instances: 인스턴스 수 증감분
+            cpu: CPU 코어 수 증감분
+            memory: 메모리 (GB) 증감분
+            
+        Returns:
+            bool: 성공 여부
+        """
+        data = await self._load_users()
+        
+        user_data = data.get("users", {}).get(user_id)
+        if user_data is None:
+            return False
+        
+        quota = user_data.get("quota") or UserQuota().model_dump()
+        user_data["quota"] = {
+            **quota,
+            "used_instances": max(0, quota.get("used_instances", 0) + instances),
+            "used_cpu": max(0, quota.get("used_cpu", 0) + cpu),
+            "used_memory": max(0, quota.get("used_memory", 0) + memory),
+        }
+        self._schedule_flush()
+        return True
+    
     async def get_all_users(self) -> list[User]:
         """
         모든 사용자 목록을 반환합니다.
@@ -237,13 +422,7 @@ class AuthService:
         """
         data = await self._load_users()
         
-        users = []
-        for user_id in data.get("users", {}).keys():
-            user = await self.get_user_by_id(user_id)
-            if user:
-                users.append(user)
-        
-        return users
+        return [self._build_user(user_data) for user_data in data.get("users", {}).values()]
 
 
 # 싱글톤 인스턴스
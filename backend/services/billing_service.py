@@ -4,12 +4,14 @@
 # 설명: AWS/Railway 스타일 사용량 기반 가상 청구 서비스
 # ============================================================================
 
-import json
-import aiofiles
+import asyncio
+import time
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+from core.jsonio import read_json, write_json
+
 # 요금 체계 (시간당)
 PRICING = {
     "cpu_per_hour": 0.02,       # $0.02 per vCPU per hour
@@ -17,8 +19,19 @@ PRICING = {
     "instance_per_hour": 0.005  # $0.005 per instance per hour
 }
 
+# add_usage/get_billing_summary 경로에서 dict 조회 없이 사용하기 위한 단가 (PRICING과 동일)
+_CPU_PRICE = PRICING["cpu_per_hour"]
+_MEMORY_PRICE = PRICING["memory_per_hour"]
+_INSTANCE_PRICE = PRICING["instance_per_hour"]
+
 DATA_PATH = Path(__file__).parent.parent / "data" / "billing.json"
 
+# 변경된 청구 데이터를 모아서 저장하기까지의 지연 시간 (초)
+BILLING_FLUSH_DELAY = 30.0
+
+# 현재 월 문자열 재계산 간격 (초)
+MONTH_CHECK_INTERVAL = 60.0
+
 
 class BillingService:
     """
@@ -31,6 +44,12 @@ class BillingService:
     def __init__(self):
         self._billing_data: dict = {}
         self._loaded = False
+        # 변경된 사용자 ID -> 마지막 변경 시각 (time.time(), 저장할 때만 문자열로 변환)
+        self._dirty: dict[str, float] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._cached_month: str = ""
+        self._cached_month_checked_at: float = 0.0
     
     async def _load_data(self):
         """청구 데이터를 로드합니다."""
@@ -39,9 +58,7 @@ class BillingService:
         
         try:
             if DATA_PATH.exists():
-                async with aiofiles.open(DATA_PATH, 'r') as f:
-                    content = await f.read()
-                    self._billing_data = json.loads(content)
+                self._billing_data = await read_json(DATA_PATH)
             else:
                 self._billing_data = {}
             self._loaded = True
@@ -51,38 +68,89 @@ class BillingService:
             self._loaded = True
     
     async def _save_data(self):
-        """청구 데이터를 저장합니다."""
+        """청구 데이터를 저장합니다 (실패하면 예외를 그대로 전달)."""
+        await write_json(DATA_PATH, self._billing_data)
+    
+    def _mark_dirty(self, user_id: str) -> None:
+        """사용자 청구 데이터가 변경되었음을 기록하고 지연 저장을 예약합니다."""
+        self._dirty[user_id] = time.time()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
+    async def _flush_later(self) -> None:
+        """
+        잠시 기다린 뒤 그동안 변경된 내용을 한 번에 저장합니다.
+        
+        저장에 실패했거나 저장 중에 다시 변경된 사용자가 있으면 (이 태스크가 실행 중이라
+        _mark_dirty가 새로 예약하지 않으므로) 남은 변경이 없어질 때까지 반복합니다.
+        """
+        while True:
+            await asyncio.sleep(BILLING_FLUSH_DELAY)
+            try:
+                await self._flush_dirty()
+            except Exception as e:
+                print(f"Failed to save billing data: {e}")
+            if not self._dirty:
+                return
+    
+    async def _flush_dirty(self) -> None:
+        """변경된 사용자가 있으면 파일에 저장합니다."""
+        async with self._flush_lock:
+            if not self._dirty:
+                return
+            # 저장이 끝난 뒤에만 비워서, 중간에 취소되면 다음 저장에서 다시 기록
+            flushing = dict(self._dirty)
+            for user_id, changed_at in flushing.items():
+                billing = self._billing_data.get(user_id)
+                if billing is not None:
+                    billing["last_updated"] = datetime.fromtimestamp(changed_at).isoformat()
+            # 저장에 실패하면 예외가 전달되어 변경 기록이 그대로 남음
+            await self._save_data()
+            # 저장 중에 다시 변경된 사용자는 다음 저장을 위해 남겨 둠
+            for user_id, changed_at in flushing.items():
+                if self._dirty.get(user_id) == changed_at:
+                    del self._dirty[user_id]
+    
+    async def flush(self) -> None:
+        """
+        예약된 지연 저장을 즉시 수행합니다.
+        (애플리케이션 종료 시 호출)
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
         try:
-            async with aiofiles.open(DATA_PATH, 'w') as f:
-                await f.write(json.dumps(self._billing_data, indent=2))
+            await self._flush_dirty()
         except Exception as e:
             print(f"Failed to save billing data: {e}")
     
     def _get_current_month(self) -> str:
-        """현재 월을 YYYY-MM 형식으로 반환합니다."""
-        return datetime.now().strftime("%Y-%m")
+        """
+        현재 월을 YYYY-MM 형식으로 반환합니다.
+        
+        월은 거의 바뀌지 않으므로 MONTH_CHECK_INTERVAL 동안은 이전 결과를 재사용합니다.
+        """
+        monotonic_now = time.monotonic()
+        if self._cached_month and monotonic_now - self._cached_month_checked_at < MONTH_CHECK_INTERVAL:
+            return self._cached_month
+        
+        self._cached_month = datetime.now().strftime("%Y-%m")
+        self._cached_month_checked_at = monotonic_now
+        return self._cached_month
     
     async def _ensure_user_billing(self, user_id: str) -> dict:
         """사용자의 청구 데이터를 초기화하거나 월 변경 시 리셋합니다."""
-        await self._load_data()
-        
         current_month = self._get_current_month()
         
-        if user_id not in self._billing_data:
-            self._billing_data[user_id] = {
-                "billing_month": current_month,
-                "usage": {
-                    "cpu_hours": 0,
-                    "memory_gb_hours": 0,
-                    "instance_hours": 0
-                },
-                "total_amount": 0.00,
-                "last_updated": datetime.now().isoformat()
-            }
-            await self._save_data()
+        # 이미 이번 달 데이터가 있으면 바로 반환 (대부분의 호출)
+        billing = self._billing_data.get(user_id)
+        if billing is not None and billing.get("billing_month") == current_month:
+            return billing
+        
+        await self._load_data()
         
-        # 월이 바뀌면 리셋
-        if self._billing_data[user_id].get("billing_month") != current_month:
+        # 신규 사용자이거나 월이 바뀌었으면 리셋
+        billing = self._billing_data.get(user_id)
+        if billing is None or billing.get("billing_month") != current_month:
             self._billing_data[user_id] = {
                 "billing_month": current_month,
                 "usage": {
@@ -90,10 +158,9 @@ class BillingService:
                     "memory_gb_hours": 0,
                     "instance_hours": 0
                 },
-                "total_amount": 0.00,
-                "last_updated": datetime.now().isoformat()
+                "total_amount": 0.00
             }
-            await self._save_data()
+            self._mark_dirty(user_id)
         
         return self._billing_data[user_id]
     
@@ -108,20 +175,22 @@ class BillingService:
             hours: 사용 시간 (기본 1시간)
         """
         billing = await self._ensure_user_billing(user_id)
+        usage = billing["usage"]
         
-        billing["usage"]["cpu_hours"] += cpu * hours
-        billing["usage"]["memory_gb_hours"] += memory_gb * hours
-        billing["usage"]["instance_hours"] += hours
+        cpu_hours = cpu * hours
+        memory_gb_hours = memory_gb * hours
+        usage["cpu_hours"] += cpu_hours
+        usage["memory_gb_hours"] += memory_gb_hours
+        usage["instance_hours"] += hours
         
-        # 금액 재계산
-        billing["total_amount"] = (
-            billing["usage"]["cpu_hours"] * PRICING["cpu_per_hour"] +
-            billing["usage"]["memory_gb_hours"] * PRICING["memory_per_hour"] +
-            billing["usage"]["instance_hours"] * PRICING["instance_per_hour"]
+        # 금액은 이번 사용량만큼 증분 (전체 재계산과 동일한 결과)
+        billing["total_amount"] += (
+            cpu_hours * _CPU_PRICE +
+            memory_gb_hours * _MEMORY_PRICE +
+            hours * _INSTANCE_PRICE
         )
-        billing["last_updated"] = datetime.now().isoformat()
         
-        await self._save_data()
+        self._mark_dirty(user_id)
     
     async def get_billing_summary(self, user_id: str) -> dict:
         """
@@ -134,6 +203,10 @@ class BillingService:
             dict: 청구 요약
         """
         billing = await self._ensure_user_billing(user_id)
+        usage = billing["usage"]
+        cpu_hours = usage["cpu_hours"]
+        memory_gb_hours = usage["memory_gb_hours"]
+        instance_hours = usage["instance_hours"]
         
         # 월말까지 남은 일수 계산
         now = datetime.now()
@@ -146,14 +219,14 @@ class BillingService:
         return {
             "billing_month": billing["billing_month"],
             "usage": {
-                "cpu_hours": round(billing["usage"]["cpu_hours"], 2),
-                "memory_gb_hours": round(billing["usage"]["memory_gb_hours"], 2),
-                "instance_hours": round(billing["usage"]["instance_hours"], 2)
+                "cpu_hours": round(cpu_hours, 2),
+                "memory_gb_hours": round(memory_gb_hours, 2),
+                "instance_hours": round(instance_hours, 2)
             },
             "breakdown": {
-                "cpu_cost": round(billing["usage"]["cpu_hours"] * PRICING["cpu_per_hour"], 2),
-                "memory_cost": round(billing["usage"]["memory_gb_hours"] * PRICING["memory_per_hour"], 2),
-                "instance_cost": round(billing["usage"]["instance_hours"] * PRICING["instance_per_hour"], 2)
+                "cpu_cost": round(cpu_hours * _CPU_PRICE, 2),
+                "memory_cost": round(memory_gb_hours * _MEMORY_PRICE, 2),
+                "instance_cost": round(instance_hours * _INSTANCE_PRICE, 2)
             },
             "total_amount": round(billing["total_amount"], 2),
             "currency": "USD",
@@ -5,12 +5,25 @@
 # ============================================================================
 
 import asyncio
+import shlex
 import subprocess
 import socket
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union
 from fabric import Connection
 from invoke import UnexpectedExit
-import json
+import orjson
+
+
+# 로컬 IP 목록 재조회 주기 (초)
+LOCAL_IPS_TTL = 300.0
+
+# 노드별 CPU 수(nproc) 캐시 유효 시간 (초)
+NPROC_CACHE_TTL = 3600.0
+
+# 여러 노드 일괄 조회 시 동시에 실행할 최대 명령 수 (실행기 스레드 고갈 방지)
+FANOUT_CONCURRENCY = 32
 
 
 class DockerOrchestrator:
@@ -29,7 +42,24 @@ class DockerOrchestrator:
         """
         self.ssh_user = ssh_user
         self._connections: dict[str, Connection] = {}
-        self._local_ips = self._get_local_ips()
+        # 로컬 IP는 첫 명령 실행 시 조회 (import 시점에 subprocess를 실행하지 않음)
+        self._local_ips: frozenset[str] = frozenset()
+        self._local_ips_checked_at: Optional[float] = None
+        self._nproc_cache: dict[str, tuple[int, float]] = {}
+        self._fanout_semaphore = asyncio.Semaphore(FANOUT_CONCURRENCY)
+        # SSH 명령 전용 실행기 (블로킹 paramiko 호출이 기본 실행기를 점유하지 않도록 분리)
+        self._ssh_executor = ThreadPoolExecutor(
+            max_workers=FANOUT_CONCURRENCY, thread_name_prefix="ssh"
+        )
+    
+    async def _ensure_local_ips(self) -> None:
+        """로컬 IP 목록이 없거나 LOCAL_IPS_TTL이 지났으면 스레드에서 다시 조회합니다."""
+        checked_at = self._local_ips_checked_at
+        if checked_at is not None and time.monotonic() - checked_at < LOCAL_IPS_TTL:
+            return
+        
+        self._local_ips = frozenset(await asyncio.to_thread(self._get_local_ips))
+        self._local_ips_checked_at = time.monotonic()
     
     def _get_local_ips(self) -> set[str]:
         """로컬 IP 목록을 가져옵니다."""
@@ -53,6 +83,25 @@ class DockerOrchestrator:
             print(f"Failed to get local IPs: {e}")
         return local_ips
     
+    async def _get_node_cpu_count(self, node_ip: str) -> Optional[int]:
+        """
+        노드의 CPU 수를 반환합니다.
+        
+        가동 중에는 바뀌지 않으므로 NPROC_CACHE_TTL 동안 캐시하여 배포마다
+        nproc 원격 실행을 반복하지 않습니다. 조회에 실패하면 None.
+        """
+        cached = self._nproc_cache.get(node_ip)
+        if cached is not None and time.monotonic() - cached[1] < NPROC_CACHE_TTL:
+            return cached[0]
+        
+        success, output = await self._run_command(node_ip, ["nproc"])
+        if not (success and output.isdigit()):
+            return None
+        
+        cpu_count = int(output)
+        self._nproc_cache[node_ip] = (cpu_count, time.monotonic())
+        return cpu_count
+    
     def _is_local(self, node_ip: str) -> bool:
         """주어진 IP가 로컬인지 확인합니다."""
         return node_ip in self._local_ips
@@ -67,22 +116,29 @@ class DockerOrchestrator:
             )
         return self._connections[node_ip]
     
-    async def _run_command(self, node_ip: str, cmd: str) -> tuple[bool, str]:
+    async def _run_command(self, node_ip: str, cmd: Union[str, list[str]]) -> tuple[bool, str]:
         """
         커맨드를 로컬 또는 원격에서 실행합니다.
         
+        Args:
+            node_ip: 대상 노드 IP
+            cmd: 실행할 명령. 인자 목록(argv)으로 주면 로컬에서는 셸 없이 실행하고,
+                원격에서는 shlex.join으로 인용하여 사용자 입력이 셸에서 해석되지 않도록 합니다.
+        
         Returns:
             (성공 여부, 출력 또는 에러)
         """
         loop = asyncio.get_event_loop()
+        await self._ensure_local_ips()
         
         if self._is_local(node_ip):
-            # 로컬에서 직접 실행
+            # 로컬에서 직접 실행 (argv면 셸을 거치지 않음)
+            use_shell = isinstance(cmd, str)
             try:
                 result = await loop.run_in_executor(
                     None,
                     lambda: subprocess.run(
-                        cmd, shell=True, capture_output=True, text=True, timeout=60
+                        cmd, shell=use_shell, capture_output=True, text=True, timeout=60
                     )
                 )
                 if result.returncode == 0:
@@ -93,11 +149,12 @@ class DockerOrchestrator:
                 return False, str(e)
         else:
             # SSH로 원격 실행
+            remote_cmd = cmd if isinstance(cmd, str) else shlex.join(cmd)
             try:
                 conn = self._get_connection(node_ip)
                 result = await loop.run_in_executor(
-                    None,
-                    lambda: conn.run(cmd, hide=True)
+                    self._ssh_executor,
+                    lambda: conn.run(remote_cmd, hide=True)
                 )
                 return True, result.stdout.strip()
             except UnexpectedExit as e:
@@ -136,48 +193,48 @@ class DockerOrchestrator:
         """
         try:
             # 환경 변수 구성
-            env_str = ""
+            env_args: list[str] = []
             if env_vars:
-                env_str = " ".join([f"-e {k}={v}" for k, v in env_vars.items()])
+                for k, v in env_vars.items():
+                    env_args += ["-e", f"{k}={v}"]
             
             # 영구 볼륨 마운트 설정
-            volume_str = ""
+            volume_args: list[str] = []
             workspace_path = None
             if user_id and instance_id:
                 workspace_path = f"/home/mroot/user_data/{user_id}/{instance_id}"
                 # 워크스페이스 디렉토리 생성
-                success, _ = await self._run_command(node_ip, f"mkdir -p {workspace_path}")
+                success, _ = await self._run_command(node_ip, ["mkdir", "-p", workspace_path])
                 if not success:
                     print(f"Warning: Failed to create workspace directory: {workspace_path}")
-                volume_str = f"-v {workspace_path}:/workspace"
+                volume_args = ["-v", f"{workspace_path}:/workspace"]
             
             # 노드의 실제 CPU 수 확인 및 제한
             actual_cpu = cpu_limit
-            nproc_success, nproc_output = await self._run_command(node_ip, "nproc")
-            if nproc_success and nproc_output.isdigit():
-                max_cpus = int(nproc_output)
+            max_cpus = await self._get_node_cpu_count(node_ip)
+            if max_cpus is not None:
                 if cpu_limit > max_cpus:
                     print(f"Warning: Requested {cpu_limit} CPUs but node has {max_cpus}. Limiting to {max_cpus}.")
                     actual_cpu = float(max_cpus)
             
-            # Docker run 명령 구성
+            # Docker run 명령 구성 (인자 목록으로 구성하여 셸 해석을 피함)
             # --network host: 호스트 네트워크 사용 (브리지 네트워크 문제 해결)
             # --init: PID 1 문제 해결
             # -t: 터미널 할당 (웹 터미널용)
             # sleep infinity: 컨테이너 유지
-            cmd = (
-                f"docker run -d "
-                f"--name {container_name} "
-                f"--network host "
-                f"--cpus={actual_cpu} "
-                f"--memory={memory_limit} "
-                f"{volume_str} "
-                f"{env_str} "
-                f"--init "
-                f"-t "
-                f"{image} "
-                f"sleep infinity"
-            ).strip()
+            cmd = [
+                "docker", "run", "-d",
+                "--name", container_name,
+                "--network", "host",
+                f"--cpus={actual_cpu}",
+                f"--memory={memory_limit}",
+                *volume_args,
+                *env_args,
+                "--init",
+                "-t",
+                image,
+                "sleep", "infinity",
+            ]
             
             # 명령 실행 (_run_command가 로컬/원격 구분)
             success, output = await self._run_command(node_ip, cmd)
@@ -218,19 +275,11 @@ class DockerOrchestrator:
         Returns:
             작업 결과 딕셔너리
         """
-        try:
-            conn = self._get_connection(node_ip)
-            
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: conn.run(f"docker stop {container_id}", hide=True)
-            )
-            
-            return {"success": True, "container_id": container_id, "status": "stopped"}
-            
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        success, output = await self._run_command(node_ip, ["docker", "stop", container_id])
+        if not success:
+            return {"success": False, "error": output}
+        
+        return {"success": True, "container_id": container_id, "status": "stopped"}
     
     async def start_container(self, node_ip: str, container_id: str) -> dict:
         """
@@ -243,19 +292,11 @@ class DockerOrchestrator:
         Returns:
             작업 결과 딕셔너리
         """
-        try:
-            conn = self._get_connection(node_ip)
-            
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: conn.run(f"docker start {container_id}", hide=True)
-            )
-            
-            return {"success": True, "container_id": container_id, "status": "running"}
-            
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        success, output = await self._run_command(node_ip, ["docker", "start", container_id])
+        if not success:
+            return {"success": False, "error": output}
+        
+        return {"success": True, "container_id": container_id, "status": "running"}
     
     async def remove_container(self, node_ip: str, container_id: str, force: bool = True) -> dict:
         """
@@ -269,21 +310,12 @@ class DockerOrchestrator:
         Returns:
             작업 결과 딕셔너리
         """
-        try:
-            conn = self._get_connection(node_ip)
-            
-            force_flag = "-f" if force else ""
-            
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: conn.run(f"docker rm {force_flag} {container_id}", hide=True)
-            )
-            
-            return {"success": True, "container_id": container_id, "status": "removed"}
-            
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+        cmd = ["docker", "rm", "-f", container_id] if force else ["docker", "rm", container_id]
+        success, output = await self._run_command(node_ip, cmd)
+        if not success:
+            return {"success": False, "error": output}
+        
+        return {"success": True, "container_id": container_id, "status": "removed"}
     
     async def get_container_status(self, node_ip: str, container_id: str) -> dict:
         """
@@ -296,19 +328,14 @@ class DockerOrchestrator:
         Returns:
             컨테이너 상태 딕셔너리
         """
+        success, output = await self._run_command(
+            node_ip, ["docker", "inspect", "--format={{json .State}}", container_id]
+        )
+        if not success:
+            return {"success": False, "error": output}
+        
         try:
-            conn = self._get_connection(node_ip)
-            
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: conn.run(
-                    f"docker inspect --format='{{{{json .State}}}}' {container_id}",
-                    hide=True
-                )
-            )
-            
-            state = json.loads(result.stdout.strip())
+            state = orjson.loads(output)
             
             return {
                 "success": True,
@@ -332,35 +359,77 @@ class DockerOrchestrator:
         Returns:
             컨테이너 목록
         """
-        try:
-            conn = self._get_connection(node_ip)
-            
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: conn.run(
-                    "docker ps -a --format='{{.ID}}|{{.Names}}|{{.Image}}|{{.Status}}|{{.Ports}}'",
-                    hide=True
-                )
-            )
-            
-            containers = []
-            for line in result.stdout.strip().split("\n"):
-                if line:
-                    parts = line.split("|")
-                    if len(parts) >= 4:
-                        containers.append({
-                            "id": parts[0],
-                            "name": parts[1],
-                            "image": parts[2],
-                            "status": parts[3],
-                            "ports": parts[4] if len(parts) > 4 else "",
-                        })
-            
-            return containers
-            
-        except Exception as e:
+        success, output = await self._run_command(
+            node_ip,
+            ["docker", "ps", "-a", "--format={{.ID}}|{{.Names}}|{{.Image}}|{{.Status}}|{{.Ports}}"]
+        )
+        if not success:
             return []
+        
+        containers = []
+        for line in output.splitlines():
+            # Ports 필드까지만 분할 (최대 5개)
+            parts = line.split("|", 4)
+            if len(parts) < 4:
+                continue
+            containers.append({
+                "id": parts[0],
+                "name": parts[1],
+                "image": parts[2],
+                "status": parts[3],
+                "ports": parts[4] if len(parts) > 4 else "",
+            })
+        
+        return containers
+    
+    async def get_container_status_many(self, targets: list[tuple[str, str]]) -> dict[str, dict]:
+        """
+        여러 컨테이너의 상태를 동시에 조회합니다.
+        
+        Args:
+            targets: (노드 IP, 컨테이너 ID) 목록
+        
+        Returns:
+            컨테이너 ID별 상태 딕셔너리
+        """
+        async def fetch(node_ip: str, container_id: str) -> dict:
+            async with self._fanout_semaphore:
+                return await self.get_container_status(node_ip, container_id)
+        
+        results = await asyncio.gather(
+            *(fetch(node_ip, container_id) for node_ip, container_id in targets),
+            return_exceptions=True
+        )
+        return {
+            container_id: (
+                {"success": False, "error": str(result)}
+                if isinstance(result, Exception) else result
+            )
+            for (_, container_id), result in zip(targets, results)
+        }
+    
+    async def list_containers_many(self, node_ips: list[str]) -> dict[str, list[dict]]:
+        """
+        여러 노드의 컨테이너 목록을 동시에 조회합니다.
+        
+        Args:
+            node_ips: 노드 IP 목록
+        
+        Returns:
+            노드 IP별 컨테이너 목록 (조회 실패 시 빈 목록)
+        """
+        async def fetch(node_ip: str) -> list[dict]:
+            async with self._fanout_semaphore:
+                return await self.list_containers(node_ip)
+        
+        results = await asyncio.gather(
+            *(fetch(node_ip) for node_ip in node_ips),
+            return_exceptions=True
+        )
+        return {
+            node_ip: [] if isinstance(result, Exception) else result
+            for node_ip, result in zip(node_ips, results)
+        }
     
     def close_all_connections(self):
         """모든 SSH 연결을 닫습니다."""
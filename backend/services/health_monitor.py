@@ -5,8 +5,10 @@
 # ============================================================================
 
 import asyncio
+import socket
+import struct
 import time
-from typing import Optional
+from typing import Optional, AsyncIterator
 from datetime import datetime
 
 import httpx
@@ -15,14 +17,26 @@ from models.node import NodeInfo, NodeStatus, NodeHealth, NodeWithStatus
 from models.cluster import ClusterStatus, ClusterSummary, ClusterHealth
 from services.node_manager import node_manager
 from core.config import settings
+from core.clock import request_now
+
+
+# 프로브 소켓 종료 시 FIN 대신 RST로 즉시 닫도록 하는 SO_LINGER 값 (l_onoff=1, l_linger=0)
+_LINGER_RESET = struct.pack("ii", 1, 0)
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """start_ns 이후 경과 시간을 0.01ms 단위로 자른 밀리초 값으로 반환합니다 (정수 연산)."""
+    return ((time.perf_counter_ns() - start_ns) // 10_000) / 100
 
 
 class HealthMonitor:
     """
     비동기 헬스 모니터링 서비스
     
-    asyncio.gather를 사용하여 17개 이상의 노드를 동시에 헬스체크합니다.
+    asyncio를 사용하여 17개 이상의 노드를 동시에 헬스체크합니다.
     효율적인 네트워크 I/O를 위해 완전한 비동기 방식으로 구현되었습니다.
+    동시 체크 수는 settings.health_check_parallelism으로 제한합니다.
+    체크 결과 모델은 내부에서 만든 값만 담으므로 검증 없이(model_construct) 생성합니다.
     """
     
     def __init__(self, timeout: float = None):
@@ -33,111 +47,240 @@ class HealthMonitor:
             timeout: 헬스체크 타임아웃 (초, 기본값: 설정에서 로드)
         """
         self.timeout = timeout or settings.health_check_timeout
+        self.deadline = settings.health_check_deadline
         self._http_client: Optional[httpx.AsyncClient] = None
+        self.parallelism = max(1, settings.health_check_parallelism)
+        self._check_semaphore = asyncio.Semaphore(self.parallelism)
+        # IP별로 한 번만 해석한 프로브 주소 (주소 패밀리, sockaddr)
+        self._probe_addrs: dict[str, tuple[int, tuple]] = {}
+        # 노드별 마지막 정상 결과 (monotonic 시각, 상태)
+        self._last_ok: dict[str, tuple[float, NodeStatus]] = {}
+        
+        # 백그라운드 갱신으로 유지되는 최신 헬스체크 스냅샷
+        self._latest: dict[str, NodeWithStatus] = {}
+        self._refreshed_at: Optional[datetime] = None
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        
+        # 스냅샷이 바뀔 때마다 증가하는 세대 번호와, 세대별로 계산해 둔 클러스터 상태
+        self._generation = 0
+        self._status_cache: dict[bool, tuple[int, ClusterStatus]] = {}
     
-    async def _get_http_client(self) -> httpx.AsyncClient:
+    def _get_http_client(self) -> httpx.AsyncClient:
         """HTTP 클라이언트 인스턴스를 반환합니다 (재사용)."""
         if self._http_client is None or self._http_client.is_closed:
+            # 폴링 주기보다 긴 keep-alive로 노드별 소켓을 재사용
+            # 연결 단계는 짧게 제한하여 꺼진 노드에서 오래 기다리지 않도록 함
             self._http_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout),
-                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+                timeout=httpx.Timeout(self.timeout, connect=min(1.0, self.timeout)),
+                limits=httpx.Limits(
+                    max_connections=200,
+                    max_keepalive_connections=100,
+                    keepalive_expiry=60.0
+                )
             )
         return self._http_client
     
+    async def start(self) -> None:
+        """
+        공유 HTTP 클라이언트를 준비하고 백그라운드 헬스체크를 시작합니다.
+        (애플리케이션 시작 시 호출)
+        """
+        self._get_http_client()
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(
+                self.background_refresh(settings.health_check_interval)
+            )
+    
     async def close(self) -> None:
-        """HTTP 클라이언트를 정리합니다."""
+        """백그라운드 헬스체크를 중지하고 HTTP 클라이언트를 정리합니다."""
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
         if self._http_client and not self._http_client.is_closed:
             await self._http_client.aclose()
     
-    async def check_node_health(self, node: NodeInfo) -> NodeStatus:
+    def _get_probe_addr(self, ip: str) -> tuple[int, tuple]:
+        """
+        프로브 대상 (주소 패밀리, sockaddr)을 반환합니다.
+        
+        Tailscale IP는 숫자 주소이므로 AI_NUMERICHOST로 한 번만 해석해 두고,
+        이후 프로브에서는 getaddrinfo 없이 그대로 연결합니다.
+        숫자 주소가 아니면 호스트명 그대로 넘겨 연결 시 해석하도록 하고 캐시하지 않습니다.
+        """
+        addr = self._probe_addrs.get(ip)
+        if addr is not None:
+            return addr
+        
+        try:
+            family, _, _, _, sockaddr = socket.getaddrinfo(
+                ip, 22, type=socket.SOCK_STREAM, flags=socket.AI_NUMERICHOST
+            )[0]
+        except socket.gaierror:
+            return socket.AF_INET, (ip, 22)
+        
+        addr = self._probe_addrs[ip] = (family, sockaddr)
+        return addr
+    
+    async def check_node_health(self, node: NodeInfo, force: bool = False) -> NodeStatus:
         """
         단일 노드의 헬스를 체크합니다.
         
-        TCP 연결을 통해 노드의 응답 여부와 응답 시간을 측정합니다.
+        health_check_fresh_ttl 이내에 정상으로 확인된 노드는 다시 연결하지 않고
+        직전 결과를 그대로(실제 확인 시각 last_check_at 포함) 재사용합니다.
+        비정상/알 수 없는 노드는 복구를 빨리 감지하도록 매번 확인합니다.
         
         Args:
             node: 체크할 노드 정보
+            force: True이면 직전 결과를 재사용하지 않고 항상 확인
             
         Returns:
             NodeStatus: 노드 상태 결과
         """
-        start_time = time.perf_counter()
+        last_ok = self._last_ok.get(node.id)
+        if (
+            not force
+            and last_ok is not None
+            and time.monotonic() - last_ok[0] < settings.health_check_fresh_ttl
+        ):
+            return last_ok[1]
+        
+        if settings.health_check_http_port:
+            status = await self._check_node_http(node)
+        else:
+            status = await self._check_node_tcp(node)
+        
+        if status.health is NodeHealth.HEALTHY:
+            self._last_ok[node.id] = (time.monotonic(), status)
+        else:
+            self._last_ok.pop(node.id, None)
+        return status
+    
+    async def _check_node_tcp(self, node: NodeInfo) -> NodeStatus:
+        """
+        TCP 연결을 통해 노드의 응답 여부와 응답 시간을 측정합니다.
+        
+        스트림(StreamReader/Writer) 없이 논블로킹 소켓으로 연결만 확인하고 바로 닫습니다.
+        """
+        start_ns = time.perf_counter_ns()
+        sock = None
         
         try:
             # TCP 연결 시도 (기본 포트 22 - SSH)
             # 실제 환경에서는 각 노드에 헬스체크 엔드포인트가 있을 수 있음
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(node.tailscale_ip, 22),
+            family, sockaddr = self._get_probe_addr(node.tailscale_ip)
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER_RESET)
+            await asyncio.wait_for(
+                asyncio.get_running_loop().sock_connect(sock, sockaddr),
                 timeout=self.timeout
             )
             
             # 연결 성공
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            health, is_online, error_message = NodeHealth.HEALTHY, True, None
             
-            # 연결 종료
-            writer.close()
-            await writer.wait_closed()
+        except asyncio.TimeoutError:
+            health, is_online, error_message = NodeHealth.UNHEALTHY, False, "연결 시간 초과"
             
-            return NodeStatus(
-                node_id=node.id,
-                health=NodeHealth.HEALTHY,
-                is_online=True,
-                response_time_ms=round(elapsed_ms, 2),
-                last_check_at=datetime.now(),
-                error_message=None
+        except ConnectionRefusedError:
+            # 연결 거부는 노드가 온라인이지만 SSH가 비활성화된 경우 (노드는 살아있음)
+            health, is_online, error_message = (
+                NodeHealth.HEALTHY, True, "SSH 포트 연결 거부 (노드는 온라인)"
             )
             
-        except asyncio.TimeoutError:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            return NodeStatus(
-                node_id=node.id,
-                health=NodeHealth.UNHEALTHY,
-                is_online=False,
-                response_time_ms=round(elapsed_ms, 2),
-                last_check_at=datetime.now(),
-                error_message="연결 시간 초과"
+        except OSError as e:
+            health, is_online, error_message = (
+                NodeHealth.UNHEALTHY, False, f"네트워크 오류: {str(e)}"
             )
             
-        except ConnectionRefusedError:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            # 연결 거부는 노드가 온라인이지만 SSH가 비활성화된 경우
-            return NodeStatus(
-                node_id=node.id,
-                health=NodeHealth.HEALTHY,  # 연결 거부는 노드가 살아있다는 의미
-                is_online=True,
-                response_time_ms=round(elapsed_ms, 2),
-                last_check_at=datetime.now(),
-                error_message="SSH 포트 연결 거부 (노드는 온라인)"
+        except Exception as e:
+            health, is_online, error_message = (
+                NodeHealth.UNKNOWN, False, f"알 수 없는 오류: {str(e)}"
             )
+        
+        finally:
+            # 연결 종료 (RST로 즉시 닫으므로 종료 핸드셰이크를 기다리지 않음)
+            if sock is not None:
+                sock.close()
+        
+        # 소요 시간과 확인 시각은 결과와 관계없이 한 번만 계산
+        elapsed_ms = _elapsed_ms(start_ns)
+        return NodeStatus.model_construct(
+            node_id=node.id,
+            health=health,
+            is_online=is_online,
+            response_time_ms=elapsed_ms,
+            last_check_at=datetime.now(),
+            error_message=error_message
+        )
+    
+    async def _check_node_http(self, node: NodeInfo) -> NodeStatus:
+        """
+        노드의 HTTP 헬스체크 엔드포인트로 상태를 확인합니다.
+        
+        공유 HTTP 클라이언트의 keep-alive 연결을 재사용하므로 폴링마다
+        TCP 핸드셰이크를 반복하지 않습니다.
+        """
+        url = f"http://{node.tailscale_ip}:{settings.health_check_http_port}{settings.health_check_http_path}"
+        start_ns = time.perf_counter_ns()
+        
+        try:
+            response = await self._get_http_client().get(url)
+            if response.is_success:
+                health, is_online, error_message = NodeHealth.HEALTHY, True, None
+            else:
+                # 응답은 왔으므로 온라인이지만 헬스체크는 실패
+                health, is_online, error_message = (
+                    NodeHealth.UNHEALTHY, True, f"헬스체크 응답 코드: {response.status_code}"
+                )
             
-        except OSError as e:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            return NodeStatus(
-                node_id=node.id,
-                health=NodeHealth.UNHEALTHY,
-                is_online=False,
-                response_time_ms=round(elapsed_ms, 2),
-                last_check_at=datetime.now(),
-                error_message=f"네트워크 오류: {str(e)}"
+        except httpx.TimeoutException:
+            health, is_online, error_message = NodeHealth.UNHEALTHY, False, "연결 시간 초과"
+            
+        except httpx.TransportError as e:
+            health, is_online, error_message = (
+                NodeHealth.UNHEALTHY, False, f"네트워크 오류: {str(e)}"
             )
             
         except Exception as e:
-            elapsed_ms = (time.perf_counter() - start_time) * 1000
-            return NodeStatus(
-                node_id=node.id,
-                health=NodeHealth.UNKNOWN,
-                is_online=False,
-                response_time_ms=round(elapsed_ms, 2),
-                last_check_at=datetime.now(),
-                error_message=f"알 수 없는 오류: {str(e)}"
+            health, is_online, error_message = (
+                NodeHealth.UNKNOWN, False, f"알 수 없는 오류: {str(e)}"
             )
+        
+        elapsed_ms = _elapsed_ms(start_ns)
+        return NodeStatus.model_construct(
+            node_id=node.id,
+            health=health,
+            is_online=is_online,
+            response_time_ms=elapsed_ms,
+            last_check_at=datetime.now(),
+            error_message=error_message
+        )
+    
+    async def _check_node_bounded(self, node: NodeInfo, force: bool = False) -> NodeStatus:
+        """
+        동시 실행 수를 제한하여 단일 노드를 체크합니다.
+        
+        연결 단계는 프로브 내부의 타임아웃(TCP 연결 / HTTP 클라이언트)으로 제한되고,
+        전체 노드 체크는 _probe_all_nodes의 공통 마감 시간 하나로 제한되므로
+        노드마다 별도의 타이머를 추가로 두지 않습니다.
+        """
+        async with self._check_semaphore:
+            return await self.check_node_health(node, force)
     
-    async def check_all_nodes(self) -> list[NodeWithStatus]:
+    async def _probe_all_nodes(self, force: bool = False) -> list[NodeWithStatus]:
         """
         모든 노드의 헬스를 동시에 체크합니다.
         
-        asyncio.gather를 사용하여 17개 노드를 병렬로 체크하므로
-        전체 체크 시간이 크게 단축됩니다.
+        17개 노드를 병렬로 체크하고, 전체 마감 시간(deadline)이 지나면
+        아직 끝나지 않은 체크는 취소하여 가장 느린 노드가 전체 결과를 붙잡지 않게 합니다.
+        
+        Args:
+            force: True이면 최근 정상 결과를 재사용하지 않고 모든 노드를 실제로 확인
         
         Returns:
             list[NodeWithStatus]: 모든 노드의 정보와 상태
@@ -148,31 +291,224 @@ class HealthMonitor:
         if not nodes:
             return []
         
-        # 모든 노드에 대해 동시에 헬스체크 실행
-        health_checks = [self.check_node_health(node) for node in nodes]
-        statuses = await asyncio.gather(*health_checks, return_exceptions=True)
+        # 모든 노드에 대해 동시에 헬스체크 실행 (동시 실행 수 제한)
+        # 동시 실행 한도만큼씩 나눠 시작하고, 그 사이에 이벤트 루프에 양보
+        tasks = []
+        try:
+            for i in range(0, len(nodes), self.parallelism):
+                if i:
+                    await asyncio.sleep(0)
+                tasks.extend(
+                    asyncio.create_task(self._check_node_bounded(node, force))
+                    for node in nodes[i:i + self.parallelism]
+                )
+            _, pending = await asyncio.wait(tasks, timeout=self.deadline)
+        except asyncio.CancelledError:
+            # 호출자가 취소되면 (종료 시 등) 진행 중인 체크도 함께 정리하고 취소를 전파
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.wait(tasks)
+            raise
         
-        # 결과 조합
+        # 마감 시간까지 끝나지 않은 체크는 취소
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        
+        # 결과 조합 (노드 순서 유지)
         results = []
-        for node, status in zip(nodes, statuses):
-            if isinstance(status, Exception):
+        for node, task in zip(nodes, tasks):
+            if task.cancelled():
+                status = self._deadline_status(node)
+            elif task.exception() is not None:
                 # 예외 발생 시 오류 상태로 처리
-                status = NodeStatus(
-                    node_id=node.id,
-                    health=NodeHealth.UNKNOWN,
-                    is_online=False,
-                    last_check_at=datetime.now(),
-                    error_message=f"헬스체크 실패: {str(status)}"
-                )
+                status = self._failed_status(node, task.exception())
+            else:
+                status = task.result()
             
-            results.append(NodeWithStatus(info=node, status=status))
+            results.append(NodeWithStatus.model_construct(info=node, status=status))
         
         return results
     
+    def _deadline_status(self, node: NodeInfo) -> NodeStatus:
+        """전체 마감 시간까지 체크가 끝나지 않은 노드의 상태를 만듭니다."""
+        return NodeStatus.model_construct(
+            node_id=node.id,
+            health=NodeHealth.UNHEALTHY,
+            is_online=False,
+            response_time_ms=self.deadline * 1000,
+            last_check_at=datetime.now(),
+            error_message="헬스체크 마감 시간 초과"
+        )
+    
+    def _failed_status(self, node: NodeInfo, error: Exception) -> NodeStatus:
+        """헬스체크 자체가 예외로 실패한 노드의 상태를 만듭니다."""
+        return NodeStatus.model_construct(
+            node_id=node.id,
+            health=NodeHealth.UNKNOWN,
+            is_online=False,
+            last_check_at=datetime.now(),
+            error_message=f"헬스체크 실패: {str(error)}"
+        )
+    
+    async def _check_node_with_info(self, node: NodeInfo, force: bool = False) -> NodeWithStatus:
+        """단일 노드를 체크하여 노드 정보와 함께 반환합니다."""
+        try:
+            status = await self._check_node_bounded(node, force)
+        except Exception as e:
+            status = self._failed_status(node, e)
+        return NodeWithStatus.model_construct(info=node, status=status)
+    
+    async def iter_node_health(self, force: bool = False) -> AsyncIterator[NodeWithStatus]:
+        """
+        노드 헬스 상태를 체크가 끝나는 순서대로 하나씩 반환합니다.
+        
+        스냅샷이 있고 force가 False이면 스냅샷을 그대로 내보내고,
+        그렇지 않으면 모든 노드를 동시에 체크하면서 완료된 노드부터 내보냅니다.
+        체크는 refresh()와 같은 락과 전체 마감 시간(deadline) 아래에서 수행되며,
+        마감 시간까지 끝나지 않은 노드는 비정상으로 내보냅니다.
+        락은 체크가 끝나면 바로 놓이고, 클라이언트로 내보내는 동안에는 잡고 있지 않습니다.
+        체크 결과는 스냅샷에도 반영됩니다.
+        
+        Args:
+            force: True이면 스냅샷 대신 즉시 전체 노드를 체크
+        """
+        if not force and self._refreshed_at is not None:
+            for node_with_status in list(self._latest.values()):
+                yield node_with_status
+            return
+        
+        # 이미 갱신이 진행 중이면 새로 체크하지 않고 그 결과를 내보냄
+        if self._refresh_lock.locked():
+            async with self._refresh_lock:
+                snapshot = list(self._latest.values())
+            for node_with_status in snapshot:
+                yield node_with_status
+            return
+        
+        # 체크는 락을 잡은 별도 태스크에서 진행하고, 결과는 큐를 통해 락 밖에서 내보냄
+        # (느린 클라이언트가 스트림을 읽는 동안 refresh()가 막히지 않도록)
+        queue: asyncio.Queue[Optional[NodeWithStatus]] = asyncio.Queue()
+        sweep = asyncio.create_task(self._stream_sweep(queue))
+        try:
+            while True:
+                node_with_status = await queue.get()
+                if node_with_status is None:
+                    break
+                yield node_with_status
+            # 체크 중 발생한 예외 전달
+            await sweep
+        finally:
+            # 클라이언트 연결 종료로 중단되면 진행 중인 체크도 정리
+            if not sweep.done():
+                sweep.cancel()
+                await asyncio.wait((sweep,))
+    
+    async def _stream_sweep(self, queue: "asyncio.Queue[Optional[NodeWithStatus]]") -> None:
+        """
+        refresh()와 같은 락과 마감 시간 아래에서 모든 노드를 체크하고,
+        완료된 순서대로 스냅샷에 반영하면서 큐에 넣습니다 (끝나면 None).
+        
+        마감 시간까지 끝나지 않은 노드는 비정상으로 넣습니다.
+        큐는 크기 제한이 없으므로 소비 속도와 관계없이 마감 시간 안에 락을 놓습니다.
+        """
+        try:
+            async with self._refresh_lock:
+                nodes = await node_manager.get_all_nodes()
+                # 강제 체크이므로 최근 정상 결과를 재사용하지 않음
+                tasks = [asyncio.create_task(self._check_node_with_info(node, force=True)) for node in nodes]
+                reported: set[str] = set()
+                try:
+                    for next_done in asyncio.as_completed(tasks, timeout=self.deadline):
+                        node_with_status = await next_done
+                        self._latest[node_with_status.info.id] = node_with_status
+                        self._generation += 1
+                        reported.add(node_with_status.info.id)
+                        queue.put_nowait(node_with_status)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    # 마감 시간 초과나 취소로 중단되면 남은 체크를 취소하고 정리
+                    for task in tasks:
+                        task.cancel()
+                    if tasks:
+                        await asyncio.wait(tasks)
+                
+                # 마감 시간까지 끝나지 않은 노드 (노드 순서 유지)
+                for node in nodes:
+                    if node.id not in reported:
+                        node_with_status = NodeWithStatus.model_construct(
+                            info=node, status=self._deadline_status(node)
+                        )
+                        self._latest[node.id] = node_with_status
+                        self._generation += 1
+                        queue.put_nowait(node_with_status)
+                self._refreshed_at = datetime.now()
+        finally:
+            queue.put_nowait(None)
+    
+    async def refresh(self, force: bool = False) -> list[NodeWithStatus]:
+        """
+        모든 노드를 체크하여 스냅샷을 갱신합니다.
+        
+        이미 갱신이 진행 중이면 새로 체크하지 않고 그 결과를 함께 사용합니다.
+        
+        Args:
+            force: True이면 최근 정상 결과를 재사용하지 않고 모든 노드를 실제로 확인
+        
+        Returns:
+            list[NodeWithStatus]: 갱신된 노드 상태 목록
+        """
+        if self._refresh_lock.locked():
+            async with self._refresh_lock:
+                return list(self._latest.values())
+        
+        async with self._refresh_lock:
+            results = await self._probe_all_nodes(force)
+            self._latest = {result.info.id: result for result in results}
+            self._refreshed_at = datetime.now()
+            self._generation += 1
+            return results
+    
+    async def background_refresh(self, interval: float) -> None:
+        """
+        interval 초마다 스냅샷을 갱신하는 백그라운드 루프
+        
+        API 요청은 스냅샷만 읽으므로 요청 수와 관계없이
+        노드 연결 시도는 주기당 한 번으로 유지됩니다.
+        """
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"Health refresh failed: {e}")
+            await asyncio.sleep(interval)
+    
+    async def check_all_nodes(self, force: bool = False) -> list[NodeWithStatus]:
+        """
+        모든 노드의 최신 헬스 상태를 반환합니다.
+        
+        백그라운드 갱신으로 유지되는 스냅샷을 반환하며, 스냅샷이 아직 없거나
+        force가 True이면 즉시 체크합니다.
+        
+        Args:
+            force: True이면 스냅샷 대신 즉시 전체 노드를 체크
+            
+        Returns:
+            list[NodeWithStatus]: 모든 노드의 정보와 상태
+        """
+        if force or self._refreshed_at is None:
+            return await self.refresh(force=force)
+        return list(self._latest.values())
+    
     async def get_cluster_status(self, include_nodes: bool = False) -> ClusterStatus:
         """
         클러스터 전체 상태를 반환합니다.
         
+        스냅샷이 바뀌지 않았으면 이전에 계산한 상태를 재사용하고 확인 시각만 갱신합니다.
+        
         Args:
             include_nodes: 개별 노드 상세 정보 포함 여부
             
@@ -182,20 +518,13 @@ class HealthMonitor:
         # 모든 노드 헬스체크
         nodes_with_status = await self.check_all_nodes()
         
-        # 통계 계산
-        total = len(nodes_with_status)
-        online = sum(1 for n in nodes_with_status if n.status.is_online)
-        offline = total - online
-        healthy = sum(1 for n in nodes_with_status if n.status.health == NodeHealth.HEALTHY)
-        unhealthy = sum(1 for n in nodes_with_status if n.status.health == NodeHealth.UNHEALTHY)
-        
-        summary = ClusterSummary(
-            total_nodes=total,
-            online_nodes=online,
-            offline_nodes=offline,
-            healthy_nodes=healthy,
-            unhealthy_nodes=unhealthy
-        )
+        generation = self._generation
+        cached = self._status_cache.get(include_nodes)
+        if cached is not None and cached[0] == generation:
+            return cached[1].model_copy(update={"checked_at": request_now()})
+        
+        # 통계 계산 (단일 순회)
+        summary = ClusterSummary.from_nodes(nodes_with_status)
         
         # 클러스터 헬스 상태 결정
         cluster_health = ClusterStatus.calculate_health(summary)
@@ -204,20 +533,22 @@ class HealthMonitor:
         if cluster_health == ClusterHealth.HEALTHY:
             message = "모든 노드가 정상 작동 중입니다."
         elif cluster_health == ClusterHealth.DEGRADED:
-            message = f"일부 노드에 문제가 있습니다. ({unhealthy}개 비정상)"
+            message = f"일부 노드에 문제가 있습니다. ({summary.unhealthy_nodes}개 비정상)"
         elif cluster_health == ClusterHealth.CRITICAL:
-            message = f"다수의 노드가 오프라인입니다. ({offline}개 오프라인)"
+            message = f"다수의 노드가 오프라인입니다. ({summary.offline_nodes}개 오프라인)"
         else:
             message = "클러스터에 연결된 노드가 없습니다."
         
-        return ClusterStatus(
+        cluster_status = ClusterStatus(
             cluster_name="mcp-cluster",
             health=cluster_health,
             summary=summary,
-            checked_at=datetime.now(),
+            checked_at=request_now(),
             nodes=nodes_with_status if include_nodes else None,
             message=message
         )
+        self._status_cache[include_nodes] = (generation, cluster_status)
+        return cluster_status
 
 
 # 싱글톤 인스턴스
@@ -4,9 +4,8 @@
 # 설명: 사용자 컨테이너 인스턴스의 CRUD 및 생명주기 관리
 # ============================================================================
 
-import json
-import aiofiles
-import random
+import asyncio
+from collections import deque
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -19,9 +18,19 @@ from services.quota_service import quota_service
 from services.ray_service import ray_service
 from services.docker_orchestrator import docker_orchestrator
 from core.config import settings
+from core.jsonio import dump_json, read_json, write_encoded, write_json
 from core.exceptions import MCPOrchestratorException, InsufficientCapacityException
 
 
+# 인스턴스 변경 내용을 모아서 파일에 쓰기까지의 지연 시간 (초)
+INSTANCES_FLUSH_DELAY = 0.5
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """저장된 ISO 형식 시각 문자열을 datetime으로 변환합니다."""
+    return datetime.fromisoformat(value) if value else None
+
+
 class InstanceNotFoundException(MCPOrchestratorException):
     """인스턴스를 찾을 수 없을 때 발생하는 예외"""
     
@@ -63,6 +72,28 @@ class InstanceManager:
             str(Path(settings.nodes_file_path).parent / "instances.json")
         )
         self._instances_cache: dict = {}
+        self._instances_mtime_ns: int = 0
+        self._instances_lock = asyncio.Lock()
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # 보조 인덱스: user_id / node_id / 상태 -> 인스턴스 ID 집합
+        self._by_user: dict[str, set[str]] = {}
+        self._by_node: dict[str, set[str]] = {}
+        self._by_status: dict[str, set[str]] = {}
+        self._indexed_status: dict[str, str] = {}
+        # 생성 시간 역순(최신이 앞)으로 유지되는 인스턴스 ID 목록 (전체 / 사용자별)
+        self._ordered_ids: deque[str] = deque()
+        self._user_ordered: dict[str, deque[str]] = {}
+        
+        # 검증을 마친 Instance 객체 캐시 (파일을 다시 읽으면 비움, 변경 시 해당 키만 교체)
+        self._instance_objects: dict[str, Instance] = {}
+        # 객체만 변경되고 저장 데이터(dict)에는 아직 반영되지 않은 인스턴스 ID (저장 시 직렬화)
+        self._unsynced_ids: set[str] = set()
+        # 인스턴스별 직렬화 결과 ('"id":{...}' 바이트) - 바뀐 행만 다시 직렬화
+        self._row_json: dict[str, bytes] = {}
+        # Ray 장애 시 대체 배치에서 동률 노드를 돌아가며 고르기 위한 카운터
+        self._fallback_rr = 0
     
     async def _ensure_file_exists(self) -> None:
         """인스턴스 파일이 존재하는지 확인하고, 없으면 생성합니다."""
@@ -76,27 +107,253 @@ class InstanceManager:
                 },
                 "instances": {}
             }
-            async with aiofiles.open(self.instances_file_path, mode='w', encoding='utf-8') as f:
-                await f.write(json.dumps(initial_data, indent=2, ensure_ascii=False))
+            await write_json(self.instances_file_path, initial_data)
     
     async def _load_instances(self) -> dict:
-        """인스턴스 정보를 로드합니다."""
-        await self._ensure_file_exists()
+        """
+        인스턴스 정보를 로드합니다.
+        
+        파일 수정 시각(mtime)이 마지막으로 읽은 시점과 같으면 메모리 캐시를 반환하고,
+        외부에서 파일이 변경된 경우에만 다시 읽습니다.
+        아직 저장되지 않은 변경이 있으면 메모리 캐시가 최신이므로 그대로 반환합니다.
+        """
+        if self._dirty:
+            return self._instances_cache
         
-        async with aiofiles.open(self.instances_file_path, mode='r', encoding='utf-8') as f:
-            content = await f.read()
-            data = json.loads(content)
+        async with self._instances_lock:
+            await self._ensure_file_exists()
+            
+            mtime_ns = self.instances_file_path.stat().st_mtime_ns
+            if self._instances_cache and mtime_ns == self._instances_mtime_ns:
+                return self._instances_cache
+            
+            data = await read_json(self.instances_file_path)
             self._instances_cache = data
+            self._instances_mtime_ns = mtime_ns
+            self._rebuild_indexes(data)
             return data
     
     async def _save_instances(self, data: dict) -> None:
-        """인스턴스 정보를 저장합니다."""
+        """인스턴스 정보를 저장합니다 (캐시에도 즉시 반영)."""
         data["metadata"]["updated_at"] = datetime.now().isoformat()
         
-        async with aiofiles.open(self.instances_file_path, mode='w', encoding='utf-8') as f:
-            await f.write(json.dumps(data, indent=2, ensure_ascii=False))
+        payload = self._encode_instances(data)
+        
+        async with self._instances_lock:
+            # 변경마다 전체를 다시 쓰므로 들여쓰기 없는 형식으로 저장
+            await write_encoded(self.instances_file_path, payload)
+            
+            self._instances_cache = data
+            self._instances_mtime_ns = self.instances_file_path.stat().st_mtime_ns
+    
+    def _encode_instances(self, data: dict) -> bytes:
+        """
+        저장 데이터를 압축 형식 JSON으로 직렬화합니다.
+        
+        인스턴스 행은 이전 저장 때 직렬화한 바이트를 재사용하고 바뀐 행만 다시
+        직렬화하므로, 저장 비용이 전체 인스턴스 수가 아니라 변경된 행 수에 비례합니다.
+        결과는 write_json(data, compact=True)와 같습니다.
+        """
+        row_json = self._row_json
+        rows = []
+        for instance_id, instance_data in data["instances"].items():
+            encoded = row_json.get(instance_id)
+            if encoded is None:
+                encoded = row_json[instance_id] = (
+                    dump_json(instance_id, compact=True) + b":" + dump_json(instance_data, compact=True)
+                )
+            rows.append(encoded)
+        
+        fields = [
+            dump_json(key, compact=True) + b":" + (
+                b"{" + b",".join(rows) + b"}" if key == "instances" else dump_json(value, compact=True)
+            )
+            for key, value in data.items()
+        ]
+        return b"{" + b",".join(fields) + b"}"
+    
+    def _schedule_flush(self) -> None:
+        """
+        메모리에 반영된 변경을 지연 저장하도록 예약합니다 (이미 예약돼 있으면 합쳐짐).
+        
+        요청은 파일 쓰기를 기다리지 않고 반환되며, INSTANCES_FLUSH_DELAY 동안의
+        변경은 한 번의 쓰기로 저장됩니다.
+        """
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
+    async def _flush_later(self) -> None:
+        """
+        잠시 기다린 뒤 그동안 쌓인 변경을 한 번에 저장합니다.
+        
+        저장 중에 새 변경이 들어오거나 저장에 실패하면 다시 기다린 뒤 저장합니다.
+        """
+        while True:
+            await asyncio.sleep(INSTANCES_FLUSH_DELAY)
+            try:
+                await self._flush_dirty()
+            except Exception as e:
+                print(f"Failed to flush instances: {e}")
+            if not self._dirty:
+                return
+    
+    async def _flush_dirty(self) -> None:
+        """저장되지 않은 변경이 있으면 파일에 저장합니다."""
+        if not self._dirty:
+            return
+        # 저장 중 들어온 변경은 다시 dirty로 표시되어 다음 저장에 포함됨
+        self._dirty = False
+        self._sync_instance_data(self._instances_cache)
+        try:
+            await self._save_instances(self._instances_cache)
+        except BaseException:
+            self._dirty = True
+            raise
+    
+    async def flush(self) -> None:
+        """
+        예약된 지연 저장을 즉시 수행합니다.
+        (애플리케이션 종료 시 호출)
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self._flush_dirty()
+    
+    def _rebuild_indexes(self, data: dict) -> None:
+        """파일에서 새로 읽은 데이터로 사용자/상태 인덱스를 다시 만듭니다."""
+        self._by_user = {}
+        self._by_node = {}
+        self._by_status = {}
+        self._indexed_status = {}
+        self._instance_objects = {}
+        self._row_json = {}
+        self._ordered_ids = deque()
+        self._user_ordered = {}
+        
+        # 생성 시간 역순으로 한 번만 정렬해 두고, 이후 생성분은 앞에 추가
+        # (저장된 created_at은 같은 형식의 ISO 문자열이므로 문자열 순서가 시간 순서와 같음)
+        items = sorted(
+            data.get("instances", {}).items(),
+            key=lambda item: item[1].get("created_at") or "",
+            reverse=True
+        )
+        for instance_id, instance_data in items:
+            self._index_instance(
+                instance_id,
+                instance_data.get("user_id"),
+                instance_data.get("node_id"),
+                instance_data.get("status"),
+                newest=False
+            )
+    
+    def _index_instance(
+        self,
+        instance_id: str,
+        user_id: str,
+        node_id: str,
+        status: str,
+        newest: bool = True
+    ) -> None:
+        """
+        단일 인스턴스의 인덱스 항목을 추가하거나 상태 변경을 반영합니다.
+        
+        처음 보는 인스턴스는 순서 목록에 추가합니다 (newest면 맨 앞, 아니면 맨 뒤).
+        """
+        previous = self._indexed_status.get(instance_id)
+        if previous is not None:
+            self._by_status.get(previous, set()).discard(instance_id)
+        else:
+            user_ordered = self._user_ordered.setdefault(user_id, deque())
+            if newest:
+                self._ordered_ids.appendleft(instance_id)
+                user_ordered.appendleft(instance_id)
+            else:
+                self._ordered_ids.append(instance_id)
+                user_ordered.append(instance_id)
+        
+        self._by_user.setdefault(user_id, set()).add(instance_id)
+        self._by_node.setdefault(node_id, set()).add(instance_id)
+        self._by_status.setdefault(status, set()).add(instance_id)
+        self._indexed_status[instance_id] = status
+    
+    def _put_instance(self, data: dict, instance: Instance) -> None:
+        """
+        인스턴스 객체를 캐시에 반영하고 인덱스를 갱신합니다.
+        
+        저장 데이터(dict)로의 직렬화는 지연 저장 시점에 한 번만 수행하므로,
+        저장 전에 같은 인스턴스가 여러 번 바뀌어도 model_dump는 한 번입니다.
+        """
+        self._index_instance(instance.id, instance.user_id, instance.node_id, instance.status.value)
+        self._instance_objects[instance.id] = instance
+        self._unsynced_ids.add(instance.id)
+    
+    def _sync_instance_data(self, data: dict) -> None:
+        """아직 직렬화하지 않은 인스턴스 객체를 저장 데이터에 기록합니다."""
+        instances = data["instances"]
+        for instance_id in self._unsynced_ids:
+            instances[instance_id] = self._instance_objects[instance_id].model_dump(mode='json')
+            self._row_json.pop(instance_id, None)
+        self._unsynced_ids.clear()
+    
+    def _get_cached_instance(self, data: dict, instance_id: str) -> Optional[Instance]:
+        """
+        Instance 객체를 캐시에서 가져오고, 없으면 저장 데이터로 한 번만 생성합니다.
+        
+        반환된 객체는 여러 요청이 공유하므로 변경할 때는 복사본을 사용합니다.
+        """
+        instance = self._instance_objects.get(instance_id)
+        if instance is None:
+            instance_data = data.get("instances", {}).get(instance_id)
+            if not instance_data:
+                return None
+            instance = self._instance_objects[instance_id] = self._build_instance(instance_data)
+        return instance
+    
+    def _build_instance(self, instance_data: dict) -> Instance:
+        """
+        저장된 인스턴스 데이터로 Instance 모델을 생성합니다.
+        
+        서비스가 model_dump(mode='json')로 직접 기록한 데이터이므로 검증 없이(model_construct)
+        생성하고, 상태와 시각만 원래 타입으로 변환합니다.
+        """
+        return Instance.model_construct(**{
+            **instance_data,
+            "status": InstanceStatus(instance_data.get("status", InstanceStatus.PENDING)),
+            "created_at": _parse_datetime(instance_data.get("created_at")) or datetime.now(),
+            "started_at": _parse_datetime(instance_data.get("started_at")),
+            "stopped_at": _parse_datetime(instance_data.get("stopped_at")),
+        })
+    
+    def _live_ids(self, user_id: Optional[str] = None) -> set[str]:
+        """종료되지 않은 인스턴스 ID 집합을 반환합니다 (user_id가 있으면 해당 사용자만)."""
+        if user_id is None:
+            ids = set(self._indexed_status)
+        else:
+            ids = self._by_user.get(user_id, set())
+        return ids - self._by_status.get(InstanceStatus.TERMINATED, set())
+    
+    def _node_load(self, node_id: str) -> int:
+        """노드에 배치된 (종료되지 않은) 인스턴스 수를 반환합니다."""
+        ids = self._by_node.get(node_id)
+        if not ids:
+            return 0
+        return len(ids - self._by_status.get(InstanceStatus.TERMINATED, set()))
+    
+    async def _pick_less_loaded(self, workers: list) -> str:
+        """
+        배치된 인스턴스가 가장 적은 워커를 선택합니다.
+        
+        용량 정보 없이도 한 노드에 인스턴스가 몰리지 않도록 하며, 동률이면
+        호출할 때마다 시작 위치를 옮겨(라운드 로빈) 동시 요청이 같은 노드로 몰리지 않게 합니다.
+        """
+        await self._load_instances()
+        start = self._fallback_rr % len(workers)
+        self._fallback_rr += 1
         
-        self._instances_cache = data
+        # min은 첫 번째 최솟값을 반환하므로 회전된 순서의 앞쪽 노드가 동률에서 선택됨
+        rotated = workers[start:] + workers[:start]
+        return min(rotated, key=lambda w: self._node_load(w.id)).id
     
     async def _select_node_with_capacity(self, required_cpu: int, required_memory: int) -> str:
         """
@@ -124,41 +381,40 @@ class InstanceManager:
                 detail="There are no worker nodes registered in the cluster."
             )
         
-        # Worker 노드 IP 집합
-        worker_ips = {w.tailscale_ip for w in workers}
-        worker_by_ip = {w.tailscale_ip: w for w in workers}
+        # Worker 노드 IP -> 노드 ID
+        worker_id_by_ip = {w.tailscale_ip: w.id for w in workers}
         
         # Ray에서 노드별 가용 리소스 조회
         try:
-            ray_nodes = ray_service.get_nodes_with_available_resources()
+            ray_nodes = await ray_service.get_nodes_with_available_resources()
             
-            # Worker 노드 중에서 요청 리소스를 충족하는 노드 찾기
-            capable_workers = []
+            # 한 번의 순회로 요청 리소스를 충족하는 Worker(병렬 리스트)와
+            # 부족할 때 보고할 Worker 최대 가용량을 함께 구함
+            capable_ids: list[str] = []
+            capable_cpus: list[float] = []
+            max_cpu = 0
+            max_mem = 0
             for ray_node in ray_nodes:
-                node_ip = ray_node.get("node_ip")
+                worker_id = worker_id_by_ip.get(ray_node.get("node_ip"))
+                if worker_id is None:
+                    continue
                 cpu_avail = ray_node.get("cpu_available", 0)
                 mem_avail = ray_node.get("memory_available_gb", 0)
                 
-                # Worker 노드이고 용량 충족하는 경우
-                if node_ip in worker_ips and cpu_avail >= required_cpu and mem_avail >= required_memory:
-                    capable_workers.append({
-                        "worker": worker_by_ip[node_ip],
-                        "cpu_available": cpu_avail,
-                        "memory_available": mem_avail
-                    })
+                if cpu_avail >= required_cpu and mem_avail >= required_memory:
+                    capable_ids.append(worker_id)
+                    capable_cpus.append(cpu_avail)
+                if cpu_avail > max_cpu:
+                    max_cpu = cpu_avail
+                if mem_avail > max_mem:
+                    max_mem = mem_avail
             
-            if capable_workers:
+            if capable_ids:
                 # CPU 가장 여유로운 노드 선택
-                best = max(capable_workers, key=lambda x: x["cpu_available"])
-                return best["worker"].id
+                best = max(range(len(capable_ids)), key=capable_cpus.__getitem__)
+                return capable_ids[best]
             
-            # 용량 충족 노드 없음 - Worker 중 최대 용량 조회
-            max_cpu = 0
-            max_mem = 0
-            for ray_node in ray_nodes:
-                if ray_node.get("node_ip") in worker_ips:
-                    max_cpu = max(max_cpu, ray_node.get("cpu_available", 0))
-                    max_mem = max(max_mem, ray_node.get("memory_available_gb", 0))
+            # 용량 충족 노드 없음 - Worker 중 최대 용량 보고
             
             raise InsufficientCapacityException(
                 requested_cpu=required_cpu,
@@ -171,8 +427,8 @@ class InstanceManager:
             raise
         except Exception as e:
             print(f"Ray capacity check failed, using fallback: {e}")
-            # Ray 실패 시 랜덤 선택 (용량 체크 불가)
-            return random.choice(workers).id
+            # Ray 실패 시 인스턴스 수 기준으로 선택 (용량 체크 불가)
+            return await self._pick_less_loaded(workers)
     
     async def create_instance(self, user_id: str, request: InstanceCreate) -> Instance:
         """
@@ -217,9 +473,6 @@ class InstanceManager:
         port = await port_allocator.allocate_port(node_id, instance.id)
         instance.port = port
         
-        # 쿼터 사용량 업데이트
-        await quota_service.allocate_resources(user_id, request.cpu, request.memory)
-        
         # 청구 사용량 기록 (AWS 스타일)
         from services.billing_service import billing_service
         await billing_service.record_instance_start(user_id, request.cpu, request.memory)
@@ -242,9 +495,9 @@ class InstanceManager:
                 instance.started_at = datetime.now()
                 instance.container_id = deploy_result.get("container_id")
             else:
-                # 배포 실패 시 리소스 롤백
-                await quota_service.release_resources(user_id, request.cpu, request.memory)
+                # 배포 실패 시 리소스 롤백 (노드 상태가 바뀌었을 수 있으므로 Ray 캐시도 무효화)
                 await port_allocator.release_port(node_id, instance.id)
+                ray_service.invalidate_cache()
                 raise MCPOrchestratorException(
                     message="Container deployment failed",
                     detail=deploy_result.get("error", "Unknown error")
@@ -253,17 +506,20 @@ class InstanceManager:
             raise
         except Exception as e:
             # 배포 실패 시 리소스 롤백
-            await quota_service.release_resources(user_id, request.cpu, request.memory)
             await port_allocator.release_port(node_id, instance.id)
+            ray_service.invalidate_cache()
             raise MCPOrchestratorException(
                 message="Container deployment failed",
                 detail=str(e)
             )
         
+        # 쿼터 사용량 업데이트 (배포 성공 후에 한 번만 반영하므로 실패 시 되돌릴 필요 없음)
+        await quota_service.allocate_resources(user_id, request.cpu, request.memory)
+        
         # 저장
         data = await self._load_instances()
-        data["instances"][instance.id] = instance.model_dump(mode='json')
-        await self._save_instances(data)
+        self._put_instance(data, instance)
+        self._schedule_flush()
         
         return instance
     
@@ -283,40 +539,44 @@ class InstanceManager:
         """
         data = await self._load_instances()
         
-        instance_data = data.get("instances", {}).get(instance_id)
-        if not instance_data:
+        instance = self._get_cached_instance(data, instance_id)
+        if instance is None:
             raise InstanceNotFoundException(instance_id)
         
-        instance = Instance(**instance_data)
-        
         # 소유권 확인
         if user_id and instance.user_id != user_id:
             raise InstanceNotFoundException(instance_id)
         
         return instance
     
-    async def get_user_instances(self, user_id: str) -> list[Instance]:
+    async def get_user_instances(
+        self,
+        user_id: str,
+        status: Optional[InstanceStatus] = None
+    ) -> list[Instance]:
         """
         사용자의 모든 인스턴스를 조회합니다.
         
         Args:
             user_id: 사용자 ID
+            status: 특정 상태의 인스턴스만 조회 (None이면 전체)
             
         Returns:
             list[Instance]: 인스턴스 목록
         """
         data = await self._load_instances()
         
-        instances = []
-        for instance_data in data.get("instances", {}).values():
-            if instance_data.get("user_id") == user_id:
-                # terminated 상태가 아닌 것만
-                if instance_data.get("status") != InstanceStatus.TERMINATED:
-                    instances.append(Instance(**instance_data))
-        
-        # 생성 시간 역순 정렬
-        instances.sort(key=lambda x: x.created_at, reverse=True)
-        return instances
+        # terminated 상태가 아닌 것만, 상태 필터는 인덱스에서 모델 생성 전에 적용
+        ids = self._live_ids(user_id)
+        if status is not None:
+            ids = ids & self._by_status.get(status, set())
+        
+        # 생성 시간 역순으로 유지되는 목록을 따라가므로 정렬 불필요
+        return [
+            self._get_cached_instance(data, instance_id)
+            for instance_id in self._user_ordered.get(user_id, ())
+            if instance_id in ids
+        ]
     
     async def get_all_instances(self) -> list[Instance]:
         """
@@ -327,13 +587,12 @@ class InstanceManager:
         """
         data = await self._load_instances()
         
-        instances = []
-        for instance_data in data.get("instances", {}).values():
-            if instance_data.get("status") != InstanceStatus.TERMINATED:
-                instances.append(Instance(**instance_data))
-        
-        instances.sort(key=lambda x: x.created_at, reverse=True)
-        return instances
+        live_ids = self._live_ids()
+        return [
+            self._get_cached_instance(data, instance_id)
+            for instance_id in self._ordered_ids
+            if instance_id in live_ids
+        ]
     
     async def stop_instance(self, instance_id: str, user_id: str) -> Instance:
         """
@@ -346,7 +605,8 @@ class InstanceManager:
         Returns:
             Instance: 업데이트된 인스턴스
         """
-        instance = await self.get_instance(instance_id, user_id)
+        # 캐시된 객체는 공유되므로 복사본을 변경한 뒤 다시 기록
+        instance = (await self.get_instance(instance_id, user_id)).model_copy()
         
         if instance.status not in [InstanceStatus.RUNNING, InstanceStatus.PENDING]:
             raise MCPOrchestratorException(
@@ -359,8 +619,8 @@ class InstanceManager:
         
         # 저장
         data = await self._load_instances()
-        data["instances"][instance_id] = instance.model_dump(mode='json')
-        await self._save_instances(data)
+        self._put_instance(data, instance)
+        self._schedule_flush()
         
         return instance
     
@@ -375,7 +635,8 @@ class InstanceManager:
         Returns:
             Instance: 업데이트된 인스턴스
         """
-        instance = await self.get_instance(instance_id, user_id)
+        # 캐시된 객체는 공유되므로 복사본을 변경한 뒤 다시 기록
+        instance = (await self.get_instance(instance_id, user_id)).model_copy()
         
         if instance.status != InstanceStatus.STOPPED:
             raise MCPOrchestratorException(
@@ -389,8 +650,8 @@ class InstanceManager:
         
         # 저장
         data = await self._load_instances()
-        data["instances"][instance_id] = instance.model_dump(mode='json')
-        await self._save_instances(data)
+        self._put_instance(data, instance)
+        self._schedule_flush()
         
         return instance
     
@@ -405,22 +666,58 @@ class InstanceManager:
         Returns:
             bool: 성공 여부
         """
-        instance = await self.get_instance(instance_id, user_id)
+        # 캐시된 객체는 공유되므로 복사본을 변경한 뒤 다시 기록
+        instance = (await self.get_instance(instance_id, user_id)).model_copy()
+        
+        await self._mark_terminated(instance)
+        self._schedule_flush()
+        
+        return True
+    
+    async def terminate_instances(self, instance_ids: list[str], user_id: str) -> list[str]:
+        """
+        여러 인스턴스를 한 번에 종료합니다.
+        
+        모든 변경을 메모리에 반영한 뒤 저장을 한 번만 예약하므로, 종료할 인스턴스 수와
+        관계없이 instances.json / port_allocations.json 쓰기는 각각 한 번으로 합쳐집니다.
+        없거나 접근 권한이 없는 인스턴스와 이미 종료된 인스턴스는 건너뜁니다.
+        
+        Args:
+            instance_ids: 종료할 인스턴스 ID 목록
+            user_id: 사용자 ID
+            
+        Returns:
+            list[str]: 종료된 인스턴스 ID 목록
+        """
+        terminated = []
+        for instance_id in dict.fromkeys(instance_ids):
+            try:
+                instance = await self.get_instance(instance_id, user_id)
+            except InstanceNotFoundException:
+                continue
+            if instance.status == InstanceStatus.TERMINATED:
+                continue
+            
+            await self._mark_terminated(instance.model_copy())
+            terminated.append(instance_id)
         
+        if terminated:
+            self._schedule_flush()
+        return terminated
+    
+    async def _mark_terminated(self, instance: Instance) -> None:
+        """포트와 쿼터를 해제하고 인스턴스를 종료 상태로 기록합니다 (저장은 호출자가 예약)."""
         # 포트 해제
-        await port_allocator.release_port(instance.node_id, instance_id)
+        await port_allocator.release_port(instance.node_id, instance.id)
         
         # 쿼터 해제
-        await quota_service.release_resources(user_id, instance.cpu, instance.memory)
+        await quota_service.release_resources(instance.user_id, instance.cpu, instance.memory)
         
         # 인스턴스 상태 업데이트 (삭제 표시)
         instance.status = InstanceStatus.TERMINATED
         
         data = await self._load_instances()
-        data["instances"][instance_id] = instance.model_dump(mode='json')
-        await self._save_instances(data)
-        
-        return True
+        self._put_instance(data, instance)
     
     async def get_instance_count(self, user_id: str = None) -> int:
         """
@@ -432,12 +729,13 @@ class InstanceManager:
         Returns:
             int: 인스턴스 수
         """
-        if user_id:
-            instances = await self.get_user_instances(user_id)
-        else:
-            instances = await self.get_all_instances()
+        await self._load_instances()
         
-        return len([i for i in instances if i.status == InstanceStatus.RUNNING])
+        # running은 terminated와 겹치지 않으므로 종료 제외 집합을 만들 필요 없음
+        running = self._by_status.get(InstanceStatus.RUNNING, set())
+        if not user_id:
+            return len(running)
+        return len(self._by_user.get(user_id, set()) & running)
     
     async def get_instance_summary(self, user_id: str = None) -> dict:
         """
@@ -449,17 +747,23 @@ class InstanceManager:
         Returns:
             dict: 요약 정보
         """
+        await self._load_instances()
+        
+        # 인덱스 크기/교집합만으로 계산 (모델 생성 없음)
+        # 상태별 집합은 서로 겹치지 않으므로 종료 제외 집합을 따로 만들지 않음
+        by_status = self._by_status
+        terminated = by_status.get(InstanceStatus.TERMINATED, set())
+        statuses = (InstanceStatus.RUNNING, InstanceStatus.STOPPED, InstanceStatus.PENDING)
         if user_id:
-            instances = await self.get_user_instances(user_id)
+            ids = self._by_user.get(user_id, set())
+            total = len(ids) - len(ids & terminated)
+            running, stopped, pending = (len(ids & by_status.get(s, set())) for s in statuses)
         else:
-            instances = await self.get_all_instances()
-        
-        running = len([i for i in instances if i.status == InstanceStatus.RUNNING])
-        stopped = len([i for i in instances if i.status == InstanceStatus.STOPPED])
-        pending = len([i for i in instances if i.status == InstanceStatus.PENDING])
+            total = len(self._indexed_status) - len(terminated)
+            running, stopped, pending = (len(by_status.get(s, ())) for s in statuses)
         
         return {
-            "total": len(instances),
+            "total": total,
             "running": running,
             "stopped": stopped,
             "pending": pending
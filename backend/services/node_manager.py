@@ -5,14 +5,17 @@
 #       JSON 파일 기반 저장소 사용
 # ============================================================================
 
-import json
-import aiofiles
+import asyncio
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
+import orjson
+
 from models.node import NodeInfo, NodeRole
 from core.config import settings
+from core.jsonio import read_json, write_json
 from core.exceptions import NodeNotFoundException, DataFileException
 
 
@@ -33,7 +36,28 @@ class NodeManager:
         """
         self.nodes_file_path = Path(nodes_file_path or settings.nodes_file_path)
         self._nodes_cache: dict[str, NodeInfo] = {}
+        self._by_role: dict[NodeRole, tuple[NodeInfo, ...]] = {}
         self._last_loaded: Optional[datetime] = None
+        # 캐시를 만든 시점의 파일 수정 시각 (0이면 아직 읽지 않음)
+        self._nodes_mtime_ns: int = 0
+        self._nodes_lock = asyncio.Lock()
+        # 노드 ID -> (마지막으로 저장한 NodeInfo, 그때 덤프한 dict)
+        # NodeInfo는 불변이므로 같은 객체면 덤프 결과를 그대로 재사용
+        self._node_rows: dict[str, tuple[NodeInfo, dict]] = {}
+    
+    def _set_cache(self, nodes: dict[str, NodeInfo]) -> None:
+        """
+        노드 캐시와 역할별 인덱스를 갱신합니다.
+        
+        역할별 인덱스는 캐시와 동일한 NodeInfo 객체를 참조하므로
+        복사 비용 없이 역할 필터링을 dict 조회로 대체합니다.
+        """
+        by_role: dict[NodeRole, list[NodeInfo]] = defaultdict(list)
+        for node in nodes.values():
+            by_role[node.role].append(node)
+        
+        self._nodes_cache = nodes
+        self._by_role = {role: tuple(members) for role, members in by_role.items()}
     
     async def _ensure_file_exists(self) -> None:
         """노드 파일이 존재하는지 확인하고, 없으면 생성합니다."""
@@ -47,25 +71,46 @@ class NodeManager:
         """
         JSON 파일에서 노드 정보를 로드합니다.
         
+        파일 수정 시각(mtime)이 마지막으로 읽거나 쓴 시점과 같으면 파일을 읽지 않고
+        메모리 캐시를 반환합니다. 반환된 dict는 캐시 자체이므로 변경하지 않습니다.
+        
         Returns:
             dict[str, NodeInfo]: 노드 ID를 키로 하는 노드 정보 딕셔너리
         """
-        await self._ensure_file_exists()
+        try:
+            if self.nodes_file_path.stat().st_mtime_ns == self._nodes_mtime_ns:
+                return self._nodes_cache
+        except FileNotFoundError:
+            pass
         
+        async with self._nodes_lock:
+            await self._ensure_file_exists()
+            
+            # 락을 기다리는 동안 다른 요청이 이미 다시 읽었을 수 있음
+            mtime_ns = self.nodes_file_path.stat().st_mtime_ns
+            if mtime_ns == self._nodes_mtime_ns:
+                return self._nodes_cache
+            
+            nodes = await self._read_nodes()
+            self._nodes_mtime_ns = mtime_ns
+            return nodes
+    
+    async def _read_nodes(self) -> dict[str, NodeInfo]:
+        """노드 파일을 읽어 캐시와 인덱스를 갱신합니다."""
         try:
-            async with aiofiles.open(self.nodes_file_path, mode='r', encoding='utf-8') as f:
-                content = await f.read()
-                data = json.loads(content)
-                
-                nodes = {}
-                for node_id, node_data in data.get("nodes", {}).items():
-                    nodes[node_id] = NodeInfo(**node_data)
-                
-                self._nodes_cache = nodes
-                self._last_loaded = datetime.now()
-                return nodes
+            data = await read_json(self.nodes_file_path)
+            
+            # 등록 시간이 없는 노드는 default_factory 대신 로드 시각 하나를 공유
+            loaded_at = datetime.now()
+            nodes = {}
+            for node_id, node_data in data.get("nodes", {}).items():
+                nodes[node_id] = NodeInfo(**{"created_at": loaded_at, **node_data})
+            
+            self._set_cache(nodes)
+            self._last_loaded = loaded_at
+            return nodes
                 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise DataFileException(
                 file_path=str(self.nodes_file_path),
                 operation="읽기",
@@ -86,6 +131,17 @@ class NodeManager:
             nodes: 저장할 노드 정보 딕셔너리
         """
         try:
+            # datetime/Enum은 orjson이 직접 직렬화하므로 JSON 모드 변환 없이 덤프하고,
+            # 바뀌지 않은 노드는 이전 저장 때 만든 dict를 재사용
+            dump_node = NodeInfo.__pydantic_serializer__.to_python
+            prev_rows = self._node_rows
+            node_rows: dict[str, tuple[NodeInfo, dict]] = {}
+            for node_id, node in nodes.items():
+                cached = prev_rows.get(node_id)
+                if cached is None or cached[0] is not node:
+                    cached = (node, dump_node(node))
+                node_rows[node_id] = cached
+            
             data = {
                 "metadata": {
                     "version": "1.0",
@@ -93,15 +149,16 @@ class NodeManager:
                     "total_nodes": len(nodes)
                 },
                 "nodes": {
-                    node_id: node.model_dump(mode='json')
-                    for node_id, node in nodes.items()
+                    node_id: row
+                    for node_id, (_, row) in node_rows.items()
                 }
             }
             
-            async with aiofiles.open(self.nodes_file_path, mode='w', encoding='utf-8') as f:
-                await f.write(json.dumps(data, indent=2, ensure_ascii=False))
+            await write_json(self.nodes_file_path, data)
+            self._node_rows = node_rows
             
-            self._nodes_cache = nodes
+            self._set_cache(nodes)
+            self._nodes_mtime_ns = self.nodes_file_path.stat().st_mtime_ns
             
         except Exception as e:
             raise DataFileException(
@@ -150,7 +207,8 @@ class NodeManager:
         Returns:
             NodeInfo: 추가된 노드 정보
         """
-        nodes = await self._load_nodes()
+        # 캐시를 직접 바꾸지 않도록 복사본을 변경해 저장 (저장 성공 시 캐시가 교체됨)
+        nodes = dict(await self._load_nodes())
         nodes[node.id] = node
         await self._save_nodes(nodes)
         return node
@@ -169,7 +227,7 @@ class NodeManager:
         Raises:
             NodeNotFoundException: 노드를 찾을 수 없는 경우
         """
-        nodes = await self._load_nodes()
+        nodes = dict(await self._load_nodes())
         
         if node_id not in nodes:
             raise NodeNotFoundException(node_id)
@@ -191,7 +249,7 @@ class NodeManager:
         Raises:
             NodeNotFoundException: 노드를 찾을 수 없는 경우
         """
-        nodes = await self._load_nodes()
+        nodes = dict(await self._load_nodes())
         
         if node_id not in nodes:
             raise NodeNotFoundException(node_id)
@@ -200,7 +258,7 @@ class NodeManager:
         await self._save_nodes(nodes)
         return True
     
-    async def get_nodes_by_role(self, role: NodeRole) -> list[NodeInfo]:
+    async def get_nodes_by_role(self, role: NodeRole) -> tuple[NodeInfo, ...]:
         """
         특정 역할의 노드들을 반환합니다.
         
@@ -208,10 +266,10 @@ class NodeManager:
             role: 노드 역할
             
         Returns:
-            list[NodeInfo]: 해당 역할의 노드 목록
+            tuple[NodeInfo, ...]: 해당 역할의 노드 목록 (역할별 인덱스에서 조회)
         """
-        nodes = await self._load_nodes()
-        return [node for node in nodes.values() if node.role == role]
+        await self._load_nodes()
+        return self._by_role.get(role, ())
     
     async def get_node_count(self) -> int:
         """
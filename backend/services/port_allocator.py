@@ -5,15 +5,20 @@
 #       각 노드에서 8000번 포트부터 순차적으로 할당
 # ============================================================================
 
-import json
-import aiofiles
+import asyncio
+from collections import deque
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 from core.config import settings
+from core.jsonio import read_json, write_json
 
 
+# 포트 할당 변경 내용을 모아서 파일에 쓰기까지의 지연 시간 (초)
+ALLOCATIONS_FLUSH_DELAY = 0.5
+
 class PortAllocator:
     """
     포트 할당 서비스 클래스
@@ -38,6 +43,12 @@ class PortAllocator:
             str(Path(settings.nodes_file_path).parent / "port_allocations.json")
         )
         self._allocations_cache: dict = {}
+        self._allocations_mtime_ns: int = 0
+        self._allocations_lock = asyncio.Lock()
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        # 노드별 빈 포트 큐 (다음 할당 순서대로, 해제된 포트는 맨 뒤로)
+        self._free_ports: dict[str, deque[int]] = {}
     
     async def _ensure_file_exists(self) -> None:
         """포트 할당 파일이 존재하는지 확인하고, 없으면 생성합니다."""
@@ -52,26 +63,98 @@ class PortAllocator:
                 "allocations": {},
                 "next_port_per_node": {}
             }
-            async with aiofiles.open(self.allocations_file_path, mode='w', encoding='utf-8') as f:
-                await f.write(json.dumps(initial_data, indent=2, ensure_ascii=False))
+            await write_json(self.allocations_file_path, initial_data)
     
     async def _load_allocations(self) -> dict:
-        """포트 할당 정보를 로드합니다."""
-        await self._ensure_file_exists()
+        """
+        포트 할당 정보를 로드합니다.
         
-        async with aiofiles.open(self.allocations_file_path, mode='r', encoding='utf-8') as f:
-            content = await f.read()
-            self._allocations_cache = json.loads(content)
+        파일 수정 시각(mtime)이 마지막으로 읽은 시점과 같으면 메모리 캐시를 반환하고,
+        외부에서 파일이 변경된 경우에만 다시 읽습니다.
+        아직 저장되지 않은 변경이 있으면 메모리 캐시가 최신이므로 그대로 반환합니다.
+        """
+        if self._dirty:
+            return self._allocations_cache
+        
+        async with self._allocations_lock:
+            await self._ensure_file_exists()
+            
+            mtime_ns = self.allocations_file_path.stat().st_mtime_ns
+            if self._allocations_cache and mtime_ns == self._allocations_mtime_ns:
+                return self._allocations_cache
+            
+            self._allocations_cache = await read_json(self.allocations_file_path)
+            self._allocations_mtime_ns = mtime_ns
+            self._free_ports = {}
             return self._allocations_cache
     
     async def _save_allocations(self, data: dict) -> None:
-        """포트 할당 정보를 저장합니다."""
+        """포트 할당 정보를 저장합니다 (캐시에도 즉시 반영)."""
         data["metadata"]["updated_at"] = datetime.now().isoformat()
         
-        async with aiofiles.open(self.allocations_file_path, mode='w', encoding='utf-8') as f:
-            await f.write(json.dumps(data, indent=2, ensure_ascii=False))
+        async with self._allocations_lock:
+            await write_json(self.allocations_file_path, data)
+            
+            self._allocations_cache = data
+            self._allocations_mtime_ns = self.allocations_file_path.stat().st_mtime_ns
+    
+    def _schedule_flush(self) -> None:
+        """
+        메모리에 반영된 변경을 지연 저장하도록 예약합니다 (이미 예약돼 있으면 합쳐짐).
+        
+        ALLOCATIONS_FLUSH_DELAY 동안의 할당/해제는 한 번의 쓰기로 저장됩니다.
+        """
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+    
+    async def _flush_later(self) -> None:
+        """잠시 기다린 뒤 그동안 쌓인 변경을 한 번에 저장합니다 (실패 시 재시도)."""
+        while True:
+            await asyncio.sleep(ALLOCATIONS_FLUSH_DELAY)
+            try:
+                await self._flush_dirty()
+            except Exception as e:
+                print(f"Failed to flush port allocations: {e}")
+            if not self._dirty:
+                return
+    
+    async def _flush_dirty(self) -> None:
+        """저장되지 않은 변경이 있으면 파일에 저장합니다."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            await self._save_allocations(self._allocations_cache)
+        except BaseException:
+            self._dirty = True
+            raise
+    
+    async def flush(self) -> None:
+        """
+        예약된 지연 저장을 즉시 수행합니다.
+        (애플리케이션 종료 시 호출)
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self._flush_dirty()
+    
+    def _free_port_queue(self, data: dict, node_id: str) -> deque[int]:
+        """
+        노드의 빈 포트 큐를 반환합니다 (없으면 할당 현황으로 한 번만 생성).
         
-        self._allocations_cache = data
+        next_port_per_node부터 PORT_END까지, 이어서 PORT_START부터 순서로 채우므로
+        기존처럼 순차 할당하고, 해제된 포트는 나머지를 모두 쓴 뒤에 재사용됩니다.
+        """
+        free = self._free_ports.get(node_id)
+        if free is None:
+            used = set(data["allocations"][node_id].values())
+            start = data["next_port_per_node"][node_id]
+            if not self.PORT_START <= start <= self.PORT_END:
+                start = self.PORT_START
+            order = chain(range(start, self.PORT_END + 1), range(self.PORT_START, start))
+            free = self._free_ports[node_id] = deque(p for p in order if p not in used)
+        return free
     
     async def allocate_port(self, node_id: str, instance_id: str) -> int:
         """
@@ -101,27 +184,20 @@ class PortAllocator:
         if node_id not in data["allocations"]:
             data["allocations"][node_id] = {}
         
-        # 사용 가능한 포트 찾기
-        port = data["next_port_per_node"][node_id]
-        used_ports = set(data["allocations"][node_id].values())
-        
-        while port in used_ports and port <= self.PORT_END:
-            port += 1
-        
-        if port > self.PORT_END:
-            # 해제된 포트 찾기
-            for p in range(self.PORT_START, self.PORT_END + 1):
-                if p not in used_ports:
-                    port = p
-                    break
-            else:
-                raise ValueError(f"노드 {node_id}에 사용 가능한 포트가 없습니다.")
+        # 빈 포트 큐에서 다음 포트 꺼내기 (O(1))
+        free = self._free_port_queue(data, node_id)
+        if not free:
+            raise ValueError(f"노드 {node_id}에 사용 가능한 포트가 없습니다.")
+        port = free.popleft()
         
-        # 포트 할당
+        # 포트 할당 (같은 인스턴스에 이전 포트가 있으면 반납)
+        previous = data["allocations"][node_id].get(instance_id)
+        if previous is not None:
+            free.append(previous)
         data["allocations"][node_id][instance_id] = port
         data["next_port_per_node"][node_id] = port + 1
         
-        await self._save_allocations(data)
+        self._schedule_flush()
         return port
     
     async def release_port(self, node_id: str, instance_id: str) -> Optional[int]:
@@ -144,7 +220,10 @@ class PortAllocator:
             return None
         
         port = data["allocations"][node_id].pop(instance_id)
-        await self._save_allocations(data)
+        free = self._free_ports.get(node_id)
+        if free is not None:
+            free.append(port)
+        self._schedule_flush()
         return port
     
     async def get_allocated_port(self, node_id: str, instance_id: str) -> Optional[int]:
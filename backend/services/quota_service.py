@@ -24,7 +24,8 @@ class QuotaService:
         사용자가 요청한 리소스가 쿼터 내인지 확인합니다.
         
         NOTE: 제한은 더 이상 적용되지 않습니다 (사용량 기반 청구 방식).
-        항상 허용하고, 사용량만 기록합니다.
+        항상 허용하고, 사용량만 기록합니다. 결과가 사용자와 무관하므로 사용자 조회 없이
+        바로 반환합니다 (현재 사용량은 get_quota_summary로 조회).
         
         Args:
             user_id: 사용자 ID
@@ -34,24 +35,10 @@ class QuotaService:
         Returns:
             dict: 쿼터 확인 결과 (항상 allowed: True)
         """
-        user = await auth_service.get_user_by_id(user_id)
-        
-        if not user:
-            # 사용자가 없어도 허용 (데모 모드)
-            return {
-                "allowed": True,
-                "user_id": user_id,
-                "note": "Usage-based billing mode"
-            }
-        
-        quota = user.quota
-        
         # 제한 없이 항상 허용 (사용량 기반 청구)
         return {
             "allowed": True,
-            "current_instances": quota.used_instances,
-            "current_cpu": quota.used_cpu,
-            "current_memory": quota.used_memory,
+            "user_id": user_id,
             "note": "Usage-based billing - no limits applied"
         }
     
@@ -67,21 +54,7 @@ class QuotaService:
         Returns:
             bool: 성공 여부
         """
-        user = await auth_service.get_user_by_id(user_id)
-        
-        if not user:
-            return False
-        
-        new_quota = UserQuota(
-            max_instances=user.quota.max_instances,
-            max_cpu=user.quota.max_cpu,
-            max_memory=user.quota.max_memory,
-            used_instances=user.quota.used_instances + 1,
-            used_cpu=user.quota.used_cpu + cpu,
-            used_memory=user.quota.used_memory + memory
-        )
-        
-        return await auth_service.update_user_quota(user_id, new_quota)
+        return await self.adjust_resources(user_id, cpu, memory, 1)
     
     async def release_resources(self, user_id: str, cpu: int, memory: int) -> bool:
         """
@@ -95,21 +68,25 @@ class QuotaService:
         Returns:
             bool: 성공 여부
         """
-        user = await auth_service.get_user_by_id(user_id)
-        
-        if not user:
-            return False
+        return await self.adjust_resources(user_id, -cpu, -memory, -1)
+    
+    async def adjust_resources(self, user_id: str, cpu: int, memory: int, instances: int) -> bool:
+        """
+        쿼터 사용량에 부호 있는 증감분을 한 번에 반영합니다.
         
-        new_quota = UserQuota(
-            max_instances=user.quota.max_instances,
-            max_cpu=user.quota.max_cpu,
-            max_memory=user.quota.max_memory,
-            used_instances=max(0, user.quota.used_instances - 1),
-            used_cpu=max(0, user.quota.used_cpu - cpu),
-            used_memory=max(0, user.quota.used_memory - memory)
-        )
+        사용자 레코드 전체를 읽고 UserQuota를 새로 만들어 덮어쓰지 않고,
+        캐시된 사용량에 증감분만 더하므로 동시 생성/종료 시에도 갱신이 유실되지 않습니다.
         
-        return await auth_service.update_user_quota(user_id, new_quota)
+        Args:
+            user_id: 사용자 ID
+            cpu: CPU 코어 수 증감분
+            memory: 메모리 (GB) 증감분
+            instances: 인스턴스 수 증감분
+            
+        Returns:
+            bool: 성공 여부
+        """
+        return await auth_service.adjust_user_quota(user_id, instances, cpu, memory)
     
     async def get_user_quota(self, user_id: str) -> Optional[UserQuota]:
         """
@@ -4,10 +4,33 @@
 # 설명: Ray SDK를 통한 클러스터 모니터링 및 리소스 관리
 # ============================================================================
 
+import asyncio
+import logging
+import time
+
 import ray
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
 from datetime import datetime
 
+from core.cache import TTLCache
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# 백그라운드 연결 확인(ray.cluster_resources 호출) 주기 (초) - 조회가 실패하면 즉시 다시 확인
+RAY_PROBE_INTERVAL = 10.0
+
+# Ray SDK 호출 전용 스레드 수 (스냅샷 조회 3개 + 연결 확인 1개)
+# GCS가 느려져도 기본 executor를 쓰는 다른 블로킹 작업은 막히지 않도록 분리
+RAY_SDK_WORKERS = 4
+
+# Ray 메모리(bytes) -> GB 변환 계수 (2의 거듭제곱이라 나눗셈과 결과가 같음)
+_INV_GIB = 1.0 / (1024**3)
+
+_T = TypeVar("_T")
+
 
 class RayService:
     """
@@ -28,6 +51,221 @@ class RayService:
         """
         self.head_node_address = head_node_address
         self._initialized = False
+        # 마지막으로 연결이 확인된 시각 (time.monotonic)
+        self._last_probe_ok = 0.0
+        # 클러스터 상태 스냅샷 캐시 - 여러 대시보드의 동시 폴링을 한 번의 조회로 합침
+        self._cache = TTLCache(ttl=settings.ray_cache_ttl)
+        # 진행 중인 스냅샷 갱신 (동시 캐시 미스는 이 태스크 하나를 함께 기다림)
+        self._refresh_task: Optional[asyncio.Task] = None
+        # 백그라운드 연결 확인 태스크 (start()로 시작, 요청 경로는 결과 플래그만 읽음)
+        self._health_task: Optional[asyncio.Task] = None
+        self._probe_now = asyncio.Event()
+        self._pool = ThreadPoolExecutor(max_workers=RAY_SDK_WORKERS, thread_name_prefix="ray-sdk")
+    
+    def _run_sync(self, func: Callable[[], _T]) -> "asyncio.Future[_T]":
+        """블로킹 Ray SDK 호출을 전용 스레드 풀에서 실행합니다."""
+        return asyncio.get_running_loop().run_in_executor(self._pool, func)
+    
+    async def start(self) -> None:
+        """
+        백그라운드 연결 확인을 시작합니다.
+        (애플리케이션 시작 시 호출)
+        """
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_loop())
+    
+    async def close(self) -> None:
+        """백그라운드 연결 확인을 중지합니다."""
+        if self._health_task and not self._health_task.done():
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+        self._health_task = None
+    
+    async def _health_loop(self) -> None:
+        """
+        RAY_PROBE_INTERVAL마다 연결을 확인하고 끊어졌으면 재연결합니다.
+        
+        조회가 실패하면 _probe_now로 깨워 주기를 기다리지 않고 바로 다시 확인합니다.
+        """
+        while True:
+            self._probe_now.clear()
+            try:
+                if await self._run_sync(self._probe_connection):
+                    self._last_probe_ok = time.monotonic()
+            except Exception as e:
+                logger.warning("Ray health check failed: %s", e)
+                self._initialized = False
+            
+            try:
+                await asyncio.wait_for(self._probe_now.wait(), timeout=RAY_PROBE_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def _snapshot(self) -> dict:
+        """
+        짧은 TTL 동안 재사용되는 클러스터 상태 스냅샷을 반환합니다.
+        
+        모든 조회 메서드가 같은 스냅샷에서 결과를 만들므로, 상태 요청 하나가
+        ray.nodes() / cluster_resources() / available_resources()를 각각 최대 한 번만 호출합니다.
+        동시에 캐시 미스가 나면 첫 요청만 Ray를 조회하고 나머지는 그 결과를 받습니다.
+        """
+        snapshot = self._cache.get("snapshot")
+        if snapshot is not None:
+            return snapshot
+        
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_snapshot())
+        return await asyncio.shield(self._refresh_task)
+    
+    async def _refresh_snapshot(self) -> dict:
+        """Ray에서 스냅샷을 새로 읽어 캐시에 저장합니다 (동시 요청당 한 번만 실행)."""
+        try:
+            snapshot = await self._fetch_snapshot()
+            self._cache.set("snapshot", snapshot)
+            return snapshot
+        finally:
+            self._refresh_task = None
+    
+    def invalidate_cache(self) -> None:
+        """캐시된 스냅샷을 버려 다음 조회가 Ray에서 새로 읽도록 합니다."""
+        self._cache.clear()
+    
+    async def _fetch_snapshot(self) -> dict:
+        """
+        Ray에서 노드/전체 리소스/가용 리소스를 조회해 응답 형식으로 변환합니다.
+        
+        Ray SDK는 동기(블로킹) API이므로 전용 스레드 풀(ray-sdk)에서 실행하고, 세 조회는 동시에 보내
+        GCS 왕복 세 번을 한 번 분량으로 줄입니다.
+        연결 실패나 조회 오류 시에는 빈 결과를 담은 스냅샷을 반환합니다 (TTL 동안 재조회하지 않음).
+        """
+        snapshot = {
+            "nodes": [],
+            "nodes_with_available_resources": [],
+            "cluster_resources": {},
+            "available_resources": {},
+            "max_available_capacity": {"max_cpu": 0, "max_memory_gb": 0},
+        }
+        snapshot.update(self._summarize_usage({}, {}))
+        if self._health_task is not None:
+            # 연결 상태는 백그라운드 태스크가 관리하므로 플래그만 확인
+            if not self._initialized:
+                return snapshot
+        elif not self._connection_is_fresh() and not await self._run_sync(self._ensure_connected):
+            # 백그라운드 확인 없이 사용하는 경우(스크립트 등)에는 요청 경로에서 직접 확인
+            return snapshot
+        
+        nodes, total, available = await asyncio.gather(
+            self._run_sync(ray.nodes),
+            self._run_sync(ray.cluster_resources),
+            self._run_sync(ray.available_resources),
+            return_exceptions=True
+        )
+        
+        if isinstance(nodes, Exception):
+            logger.warning("Failed to get nodes: %s", nodes)
+        else:
+            (
+                snapshot["nodes"],
+                snapshot["nodes_with_available_resources"],
+                snapshot["max_available_capacity"],
+            ) = self._build_node_views(nodes)
+        
+        if isinstance(total, Exception):
+            logger.warning("Failed to get cluster resources: %s", total)
+        else:
+            snapshot["cluster_resources"] = self._format_resources(total)
+        
+        if isinstance(available, Exception):
+            logger.warning("Failed to get available resources: %s", available)
+        else:
+            snapshot["available_resources"] = self._format_resources(available)
+        
+        # 사용량/사용률은 스냅샷마다 한 번만 계산해 두고 상태 요청에서는 그대로 사용
+        snapshot.update(self._summarize_usage(snapshot["cluster_resources"], snapshot["available_resources"]))
+        
+        # 조회가 하나라도 실패하면 연결을 바로 다시 확인 (필요하면 재연결)
+        if any(isinstance(result, Exception) for result in (nodes, total, available)):
+            self._last_probe_ok = 0.0
+            self._probe_now.set()
+        
+        return snapshot
+    
+    @staticmethod
+    def _summarize_usage(total: dict, available: dict) -> dict:
+        """전체/가용 리소스로 사용량과 사용률(%)을 계산합니다 (항목마다 조회 한 번)."""
+        used = {}
+        usage_percent = {}
+        for key in ("cpu", "memory", "gpu"):
+            total_value = total.get(key, 0)
+            used_value = total_value - available.get(key, 0)
+            used[key] = used_value
+            usage_percent[key] = (used_value / total_value) * 100 if total_value > 0 else 0
+        return {"used": used, "usage_percent": usage_percent}
+    
+    @staticmethod
+    def _build_node_views(raw_nodes: list[dict]) -> tuple[list[dict], list[dict], dict]:
+        """
+        ray.nodes() 결과를 한 번 순회하며 노드 응답 형식과 집계값을 함께 만듭니다.
+        
+        - 노드 정보 목록 (get_nodes)
+        - 살아있는 노드의 가용 리소스 목록 (get_nodes_with_available_resources)
+        - 단일 노드 최대 가용 리소스 (get_max_available_capacity)
+        
+        Ray는 노드별 available을 직접 제공하지 않으므로 노드의 총 리소스를
+        가용으로 표시합니다 (보수적 추정, 인스턴스 추적 별도 필요).
+        """
+        full_list = []
+        capacity_list = []
+        max_cpu = 0
+        max_memory = 0
+        for node in raw_nodes:
+            node_id = node.get("NodeID", "")
+            # 주소 파싱은 스냅샷을 만들 때 노드당 한 번만 (partition은 리스트를 만들지 않음)
+            node_ip = (node.get("NodeManagerAddress") or "").partition(":")[0]
+            is_alive = node.get("Alive", False)
+            resources = node.get("Resources", {})
+            
+            full_list.append({
+                "node_id": node_id,
+                "node_name": node.get("NodeName", ""),
+                "node_ip": node_ip,
+                "is_alive": is_alive,
+                "resources": resources,
+                "resources_total": resources,
+                "labels": node.get("Labels", {}),
+            })
+            
+            if is_alive:
+                cpu_total = resources.get("CPU", 0)
+                memory_total = resources.get("memory", 0) * _INV_GIB  # GB
+                capacity_list.append({
+                    "node_id": node_id,
+                    "node_ip": node_ip,
+                    "cpu_total": cpu_total,
+                    "memory_total_gb": memory_total,
+                    "cpu_available": cpu_total,
+                    "memory_available_gb": memory_total,
+                })
+                if cpu_total > max_cpu:
+                    max_cpu = cpu_total
+                if memory_total > max_memory:
+                    max_memory = memory_total
+        
+        max_capacity = {"max_cpu": int(max_cpu), "max_memory_gb": int(max_memory)}
+        return full_list, capacity_list, max_capacity
+    
+    @staticmethod
+    def _format_resources(resources: dict) -> dict:
+        """ray.cluster_resources()/available_resources() 결과를 GB 단위 응답 형식으로 변환합니다."""
+        return {
+            "cpu": resources.get("CPU", 0),
+            "memory": resources.get("memory", 0) * _INV_GIB,  # bytes to GB
+            "gpu": resources.get("GPU", 0),
+            "object_store_memory": resources.get("object_store_memory", 0) * _INV_GIB,
+        }
     
     def _reconnect(self) -> bool:
         """Ray 클러스터에 재연결"""
@@ -44,15 +282,35 @@ class RayService:
                 logging_level="warning"
             )
             self._initialized = True
-            print(f"Ray reconnected: {ray.cluster_resources()}")
+            # 로그를 남길 때만 리소스 조회 (GCS 호출 1회 절약)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Ray reconnected: %s", ray.cluster_resources())
             return True
         except Exception as e:
-            print(f"Ray reconnection failed: {e}")
+            logger.warning("Ray reconnection failed: %s", e)
             self._initialized = False
             return False
     
+    def _connection_is_fresh(self) -> bool:
+        """최근 RAY_PROBE_INTERVAL 안에 연결이 확인되었는지 반환합니다."""
+        return self._initialized and time.monotonic() - self._last_probe_ok < RAY_PROBE_INTERVAL
+    
     def _ensure_connected(self) -> bool:
-        """Ray 클러스터 연결 확인 및 초기화"""
+        """
+        Ray 클러스터 연결 확인 및 초기화
+        
+        최근에 연결이 확인되었으면 Ray 호출 없이 True를 반환합니다.
+        """
+        if self._connection_is_fresh():
+            return True
+        
+        connected = self._probe_connection()
+        if connected:
+            self._last_probe_ok = time.monotonic()
+        return connected
+    
+    def _probe_connection(self) -> bool:
+        """Ray 클러스터에 실제로 연결을 확인하고, 끊어졌으면 (재)연결합니다."""
         # 이미 연결되어 있으면 True
         try:
             if ray.is_initialized():
@@ -62,7 +320,7 @@ class RayService:
                 return True
         except Exception:
             # 연결이 끊어졌으면 재연결 시도
-            print("Ray connection lost, attempting to reconnect...")
+            logger.warning("Ray connection lost, attempting to reconnect...")
             return self._reconnect()
             
         # 초기화 안됐으면 연결 시도
@@ -74,151 +332,101 @@ class RayService:
                     logging_level="warning"
                 )
                 self._initialized = True
-                print(f"Ray connected: {ray.cluster_resources()}")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Ray connected: %s", ray.cluster_resources())
             except Exception as e:
-                print(f"Ray connection failed: {e}")
+                logger.warning("Ray connection failed: %s", e)
                 return False
         return ray.is_initialized()
     
-    def get_nodes(self) -> list[dict]:
+    async def get_nodes(self) -> list[dict]:
         """
         ray.nodes()를 사용하여 모든 노드 정보를 조회합니다.
         
         Returns:
             노드 정보 리스트 (NodeID, IP, CPU, Memory, GPU 등)
         """
-        if not self._ensure_connected():
-            return []
-        
-        try:
-            nodes = ray.nodes()
-            result = []
-            
-            for node in nodes:
-                result.append({
-                    "node_id": node.get("NodeID", ""),
-                    "node_name": node.get("NodeName", ""),
-                    "node_ip": node.get("NodeManagerAddress", "").split(":")[0] if node.get("NodeManagerAddress") else "",
-                    "is_alive": node.get("Alive", False),
-                    "resources": node.get("Resources", {}),
-                    "resources_total": node.get("Resources", {}),
-                    "labels": node.get("Labels", {}),
-                })
-            
-            return result
-        except Exception as e:
-            print(f"Failed to get nodes: {e}")
-            return []
+        return (await self._snapshot())["nodes"]
     
-    def get_cluster_resources(self) -> dict:
+    async def get_cluster_resources(self) -> dict:
         """
         클러스터 전체 리소스 현황을 조회합니다.
         
         Returns:
             전체 리소스 (CPU, Memory, GPU 등)
         """
-        if not self._ensure_connected():
-            return {}
+        return (await self._snapshot())["cluster_resources"]
+    
+    async def get_resource_usage(self) -> dict:
+        """
+        전체/가용 리소스와 사용량, 사용률을 함께 조회합니다.
         
-        try:
-            resources = ray.cluster_resources()
-            return {
-                "cpu": resources.get("CPU", 0),
-                "memory": resources.get("memory", 0) / (1024**3),  # bytes to GB
-                "gpu": resources.get("GPU", 0),
-                "object_store_memory": resources.get("object_store_memory", 0) / (1024**3),
-            }
-        except Exception as e:
-            print(f"Failed to get cluster resources: {e}")
-            return {}
+        Returns:
+            {"total", "available", "used", "usage_percent"} 딕셔너리
+        """
+        snapshot = await self._snapshot()
+        return {
+            "total": snapshot["cluster_resources"],
+            "available": snapshot["available_resources"],
+            "used": snapshot["used"],
+            "usage_percent": snapshot["usage_percent"],
+        }
     
-    def get_available_resources(self) -> dict:
+    async def get_available_resources(self) -> dict:
         """
         현재 사용 가능한 리소스를 조회합니다.
         
         Returns:
             사용 가능한 리소스 (CPU, Memory, GPU 등)
         """
-        if not self._ensure_connected():
-            return {}
-        
-        try:
-            resources = ray.available_resources()
-            return {
-                "cpu": resources.get("CPU", 0),
-                "memory": resources.get("memory", 0) / (1024**3),  # bytes to GB
-                "gpu": resources.get("GPU", 0),
-                "object_store_memory": resources.get("object_store_memory", 0) / (1024**3),
-            }
-        except Exception as e:
-            print(f"Failed to get available resources: {e}")
-            return {}
+        return (await self._snapshot())["available_resources"]
     
-    def get_cluster_status(self) -> dict:
+    async def get_cluster_status(self) -> dict:
         """
-        클러스터 전체 상태 요약을 반환합니다.
+        클러스터 전체 상태 요약을 반환합니다 (하나의 스냅샷에서 계산).
         
         Returns:
             클러스터 상태 요약 딕셔너리
         """
-        nodes = self.get_nodes()
-        total_resources = self.get_cluster_resources()
-        available_resources = self.get_available_resources()
-        
-        alive_nodes = [n for n in nodes if n.get("is_alive", False)]
-        
-        # 리소스 사용량 계산
-        used_cpu = total_resources.get("cpu", 0) - available_resources.get("cpu", 0)
-        used_memory = total_resources.get("memory", 0) - available_resources.get("memory", 0)
-        used_gpu = total_resources.get("gpu", 0) - available_resources.get("gpu", 0)
+        snapshot = await self._snapshot()
+        total_count = len(snapshot["nodes"])
+        # 살아있는 노드 목록은 스냅샷을 만들 때 이미 걸러져 있음
+        alive_count = len(snapshot["nodes_with_available_resources"])
         
         return {
             "nodes": {
-                "total": len(nodes),
-                "alive": len(alive_nodes),
-                "dead": len(nodes) - len(alive_nodes),
+                "total": total_count,
+                "alive": alive_count,
+                "dead": total_count - alive_count,
             },
             "resources": {
-                "total": total_resources,
-                "available": available_resources,
-                "used": {
-                    "cpu": used_cpu,
-                    "memory": used_memory,
-                    "gpu": used_gpu,
-                }
-            },
-            "usage_percent": {
-                "cpu": (used_cpu / total_resources.get("cpu", 1)) * 100 if total_resources.get("cpu", 0) > 0 else 0,
-                "memory": (used_memory / total_resources.get("memory", 1)) * 100 if total_resources.get("memory", 0) > 0 else 0,
-                "gpu": (used_gpu / total_resources.get("gpu", 1)) * 100 if total_resources.get("gpu", 0) > 0 else 0,
+                "total": snapshot["cluster_resources"],
+                "available": snapshot["available_resources"],
+                "used": snapshot["used"],
             },
+            "usage_percent": snapshot["usage_percent"],
             "is_connected": self._initialized and ray.is_initialized(),
             "head_node": self.head_node_address,
             "timestamp": datetime.now().isoformat(),
         }
     
-    def find_least_loaded_node(self) -> Optional[dict]:
+    async def find_least_loaded_node(self) -> Optional[dict]:
         """
         가장 여유있는 노드를 찾습니다.
         
         Returns:
             가장 여유있는 노드 정보 또는 None
         """
-        nodes = self.get_nodes()
-        alive_nodes = [n for n in nodes if n.get("is_alive", False)]
-        
-        if not alive_nodes:
-            return None
-        
-        # 사용 가능한 CPU 기준으로 정렬
-        def get_available_cpu(node):
-            resources = node.get("resources", {})
-            return resources.get("CPU", 0)
+        nodes = await self.get_nodes()
         
-        sorted_nodes = sorted(alive_nodes, key=get_available_cpu, reverse=True)
-        return sorted_nodes[0] if sorted_nodes else None
+        # 사용 가능한 CPU가 가장 많은 노드 (정렬 없이 한 번 순회, 동률이면 앞쪽 노드)
+        return max(
+            (n for n in nodes if n.get("is_alive", False)),
+            key=lambda n: n.get("resources", {}).get("CPU", 0),
+            default=None
+        )
     
-    def get_nodes_with_available_resources(self) -> list[dict]:
+    async def get_nodes_with_available_resources(self) -> list[dict]:
         """
         각 노드별 사용 가능한 리소스를 조회합니다.
         ray.available_resources()는 클러스터 전체만 반환하므로,
@@ -227,45 +435,9 @@ class RayService:
         Returns:
             노드별 가용 리소스 리스트
         """
-        if not self._ensure_connected():
-            return []
-        
-        try:
-            nodes = ray.nodes()
-            cluster_available = ray.available_resources()
-            
-            result = []
-            for node in nodes:
-                if not node.get("Alive", False):
-                    continue
-                
-                # 노드의 총 리소스
-                resources = node.get("Resources", {})
-                node_ip = node.get("NodeManagerAddress", "").split(":")[0]
-                
-                # 해당 노드의 가용 리소스 계산
-                # Ray는 노드별 available을 직접 제공하지 않으므로
-                # 노드의 총 리소스를 사용 (보수적 추정)
-                # 실제 가용량은 클러스터 전체 가용량을 참조
-                cpu_total = resources.get("CPU", 0)
-                memory_total = resources.get("memory", 0) / (1024**3)  # GB
-                
-                result.append({
-                    "node_id": node.get("NodeID", ""),
-                    "node_ip": node_ip,
-                    "cpu_total": cpu_total,
-                    "memory_total_gb": memory_total,
-                    # 현재는 총 리소스를 가용으로 표시 (인스턴스 추적 별도 필요)
-                    "cpu_available": cpu_total,
-                    "memory_available_gb": memory_total,
-                })
-            
-            return result
-        except Exception as e:
-            print(f"Failed to get nodes with resources: {e}")
-            return []
+        return (await self._snapshot())["nodes_with_available_resources"]
     
-    def find_node_with_capacity(self, required_cpu: float, required_memory_gb: float) -> Optional[dict]:
+    async def find_node_with_capacity(self, required_cpu: float, required_memory_gb: float) -> Optional[dict]:
         """
         요청한 리소스를 제공할 수 있는 노드를 찾습니다.
         
@@ -276,46 +448,27 @@ class RayService:
         Returns:
             조건을 만족하는 노드 정보 또는 None
         """
-        nodes = self.get_nodes_with_available_resources()
+        nodes = await self.get_nodes_with_available_resources()
         
-        # 요청 리소스를 제공할 수 있는 노드 필터링
-        capable_nodes = [
+        # 요청 리소스를 제공할 수 있는 노드 중 가장 여유있는 노드 선택 (CPU 기준)
+        capable_nodes = (
             n for n in nodes
             if n.get("cpu_available", 0) >= required_cpu
             and n.get("memory_available_gb", 0) >= required_memory_gb
-        ]
-        
-        if not capable_nodes:
-            return None
-        
-        # 가장 여유있는 노드 선택 (CPU 기준)
-        sorted_nodes = sorted(
-            capable_nodes,
-            key=lambda n: n.get("cpu_available", 0),
-            reverse=True
         )
-        return sorted_nodes[0]
+        return max(capable_nodes, key=lambda n: n.get("cpu_available", 0), default=None)
     
-    def get_max_available_capacity(self) -> dict:
+    async def get_max_available_capacity(self) -> dict:
         """
         클러스터에서 단일 노드가 제공할 수 있는 최대 리소스를 반환합니다.
         UI에서 선택 가능한 옵션을 제한하는 데 사용됩니다.
         
+        스냅샷을 만들 때 노드 목록과 같은 순회에서 계산해 둔 값을 복사해 반환합니다.
+        
         Returns:
             {"max_cpu": int, "max_memory_gb": int}
         """
-        nodes = self.get_nodes_with_available_resources()
-        
-        if not nodes:
-            return {"max_cpu": 0, "max_memory_gb": 0}
-        
-        max_cpu = max(n.get("cpu_available", 0) for n in nodes)
-        max_memory = max(n.get("memory_available_gb", 0) for n in nodes)
-        
-        return {
-            "max_cpu": int(max_cpu),
-            "max_memory_gb": int(max_memory),
-        }
+        return dict((await self._snapshot())["max_available_capacity"])
     
     def disconnect(self):
         """Ray 연결 종료"""
@@ -325,6 +478,8 @@ class RayService:
                 self._initialized = False
             except Exception:
                 pass
+        # 느린 GCS 호출이 남아 있어도 종료를 기다리지 않음
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
 
 # 싱글톤 인스턴스
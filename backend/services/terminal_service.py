@@ -5,11 +5,58 @@
 # ============================================================================
 
 import asyncio
+import fcntl
+import logging
+import os
+import pty
+import signal
+import struct
 import subprocess
-from typing import Optional
+import tempfile
+import termios
+import tty
+from pathlib import Path
+from typing import AsyncIterator, Optional
 from fabric import Connection
 
 
+logger = logging.getLogger(__name__)
+
+# 출력 병합 설정: 첫 청크 이후 이 시간(초) 안에 이어서 도착한 출력을 한 프레임으로 묶음
+OUTPUT_READ_SIZE = 4096
+OUTPUT_COALESCE_WINDOW = 0.005
+OUTPUT_COALESCE_MAX_BYTES = 65536
+
+# 노드별 SSH 연결 재사용 (OpenSSH ControlMaster)
+# 같은 노드의 두 번째 세션부터는 인증된 기존 연결에 채널만 새로 엽니다.
+SSH_CONTROL_DIR = Path(tempfile.gettempdir()) / "kws-ssh"
+SSH_CONTROL_PERSIST = "10m"  # 마지막 세션이 닫힌 뒤 마스터 연결 유지 시간
+
+# resize 메시지를 받기 전까지 사용할 기본 터미널 크기 (xterm.js 기본값)
+DEFAULT_TERMINAL_ROWS = 24
+DEFAULT_TERMINAL_COLS = 80
+
+_SSH_BASE_OPTIONS = (
+    "-o", "StrictHostKeyChecking=no",
+    "-o", "UserKnownHostsFile=/dev/null",
+    "-o", "LogLevel=ERROR",  # 경고 메시지 숨기기
+)
+
+
+def _ssh_control_options() -> tuple[str, ...]:
+    """ControlMaster 다중화 옵션 (%C: 호스트/포트/사용자 해시로 노드별 소켓 구분)"""
+    return (
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={SSH_CONTROL_DIR}/%C",
+        "-o", f"ControlPersist={SSH_CONTROL_PERSIST}",
+    )
+
+
+def _set_winsize(fd: int, rows: int, cols: int) -> None:
+    """PTY의 창 크기를 설정합니다."""
+    fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", rows, cols, 0, 0))
+
+
 class TerminalSession:
     """
     Docker exec 세션 관리
@@ -29,6 +76,11 @@ class TerminalSession:
         self.ssh_user = ssh_user
         self.process: Optional[asyncio.subprocess.Process] = None
         self._running = False
+        # 로컬 PTY: ssh 클라이언트가 이 크기를 원격 PTY에 window-change로 전달
+        self._master_fd: Optional[int] = None
+        self._stdout: Optional[asyncio.StreamReader] = None
+        self._stdout_transport: Optional[asyncio.ReadTransport] = None
+        self._stdin: Optional[asyncio.StreamWriter] = None
     
     async def start(self) -> bool:
         """
@@ -36,72 +88,160 @@ class TerminalSession:
         SSH를 통해 원격 노드의 docker exec에 연결합니다.
         """
         try:
-            # SSH를 통해 docker exec 실행
+            # SSH를 통해 docker exec 실행 (노드별 마스터 연결이 있으면 재사용)
+            SSH_CONTROL_DIR.mkdir(mode=0o700, exist_ok=True)
             cmd = [
                 "ssh",
                 "-tt",  # Force pseudo-terminal allocation
-                "-o", "StrictHostKeyChecking=no",
-                "-o", "UserKnownHostsFile=/dev/null",
-                "-o", "LogLevel=ERROR",  # 경고 메시지 숨기기
+                *_SSH_BASE_OPTIONS,
+                *_ssh_control_options(),
                 f"{self.ssh_user}@{self.node_ip}",
                 f"docker exec -it {self.container_id} /bin/bash"
             ]
             
-            self.process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.STDOUT
-            )
+            # 파이프 대신 로컬 PTY에 연결해야 ssh가 창 크기를 읽고 원격에 전달할 수 있음
+            master_fd, slave_fd = pty.openpty()
+            tty.setraw(slave_fd)
+            _set_winsize(master_fd, DEFAULT_TERMINAL_ROWS, DEFAULT_TERMINAL_COLS)
+            try:
+                self.process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=slave_fd,
+                    stdout=slave_fd,
+                    stderr=slave_fd
+                )
+            except BaseException:
+                os.close(master_fd)
+                raise
+            finally:
+                # 자식만 slave를 들고 있어야 종료 시 master 읽기가 끝남(EIO)
+                os.close(slave_fd)
+            
+            self._master_fd = master_fd
+            await self._open_streams(master_fd)
             
             self._running = True
             return True
             
         except Exception as e:
-            print(f"Failed to start terminal session: {e}")
+            logger.warning("Failed to start terminal session: %s", e)
+            await self.close()
             return False
     
+    async def _open_streams(self, master_fd: int):
+        """PTY master를 asyncio 스트림으로 감쌉니다 (읽기/쓰기용 fd를 따로 복제)."""
+        loop = asyncio.get_running_loop()
+        
+        reader = asyncio.StreamReader(limit=OUTPUT_COALESCE_MAX_BYTES)
+        self._stdout_transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader),
+            os.fdopen(os.dup(master_fd), "rb", buffering=0)
+        )
+        transport, protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin,
+            os.fdopen(os.dup(master_fd), "wb", buffering=0)
+        )
+        self._stdout = reader
+        self._stdin = asyncio.StreamWriter(transport, protocol, None, loop)
+    
     async def read(self) -> Optional[bytes]:
-        """stdout에서 데이터를 읽습니다."""
-        if not self.process or not self._running:
+        """
+        stdout에서 데이터를 읽습니다.
+        
+        출력이 생길 때까지 대기하며, 프로세스가 종료되면(EOF) None을 반환합니다.
+        첫 청크를 받은 뒤에는 OUTPUT_COALESCE_WINDOW 안에 이어서 도착한 출력을
+        OUTPUT_COALESCE_MAX_BYTES까지 모아 한 번에 반환하여, `cat` 같은 대량 출력 시
+        WebSocket 프레임 수를 줄입니다.
+        """
+        if not self._stdout or not self._running:
             return None
         
+        stdout = self._stdout
         try:
-            data = await asyncio.wait_for(
-                self.process.stdout.read(4096),
-                timeout=0.1
-            )
-            return data if data else None
-        except asyncio.TimeoutError:
-            return None
+            data = await stdout.read(OUTPUT_READ_SIZE)
         except Exception:
             return None
+        if not data:
+            return None
+        
+        buf = bytearray(data)
+        while len(buf) < OUTPUT_COALESCE_MAX_BYTES:
+            try:
+                more = await asyncio.wait_for(
+                    stdout.read(OUTPUT_READ_SIZE),
+                    timeout=OUTPUT_COALESCE_WINDOW
+                )
+            except asyncio.TimeoutError:
+                break
+            except Exception:
+                # 이미 모은 출력은 전달하고, 다음 read()에서 종료를 감지
+                break
+            if not more:
+                break
+            buf += more
+        
+        return bytes(buf)
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """출력을 (병합된) 청크 단위로 반환합니다."""
+        # 프로세스가 종료돼도 파이프에 남은 출력은 EOF까지 모두 전달
+        while True:
+            data = await self.read()
+            if data is None:
+                break
+            yield data
     
     async def write(self, data: bytes):
         """stdin에 데이터를 씁니다."""
-        if not self.process or not self._running:
+        if not self._stdin or not self._running:
             return
         
         try:
-            self.process.stdin.write(data)
-            await self.process.stdin.drain()
+            self._stdin.write(data)
+            await self._stdin.drain()
         except Exception as e:
-            print(f"Failed to write to terminal: {e}")
+            logger.debug("Failed to write to terminal: %s", e)
     
-    async def resize(self, rows: int, cols: int):
-        """터미널 크기를 조정합니다."""
-        # SSH 터널에서는 resize가 자동 처리됨
-        pass
+    def resize(self, rows: int, cols: int):
+        """
+        터미널 크기를 조정합니다.
+        
+        로컬 PTY 크기를 바꾸고 ssh에 SIGWINCH를 보내면, ssh가 새 크기를 읽어
+        원격 PTY에 window-change 요청으로 전달합니다.
+        """
+        if self._master_fd is None or not self.is_running:
+            return
+        
+        try:
+            _set_winsize(self._master_fd, rows, cols)
+            self.process.send_signal(signal.SIGWINCH)
+        except (OSError, ProcessLookupError, struct.error) as e:
+            logger.debug("Failed to resize terminal: %s", e)
     
     async def close(self):
         """터미널 세션을 종료합니다."""
         self._running = False
-        if self.process:
+        if self.process and self.process.returncode is None:
             try:
                 self.process.terminate()
                 await asyncio.wait_for(self.process.wait(), timeout=2.0)
+            except ProcessLookupError:
+                pass
             except Exception:
-                self.process.kill()
+                try:
+                    self.process.kill()
+                except ProcessLookupError:
+                    pass
+        
+        if self._stdout_transport is not None:
+            self._stdout_transport.close()
+            self._stdout_transport = None
+        if self._stdin is not None:
+            self._stdin.close()
+            self._stdin = None
+        if self._master_fd is not None:
+            os.close(self._master_fd)
+            self._master_fd = None
     
     @property
     def is_running(self) -> bool:
@@ -117,6 +257,8 @@ class TerminalManager:
     
     def __init__(self):
         self._sessions: dict[str, TerminalSession] = {}
+        # 마스터 SSH 연결을 연 적이 있는 (사용자, 노드 IP)
+        self._ssh_hosts: set[tuple[str, str]] = set()
     
     async def create_session(
         self,
@@ -132,6 +274,7 @@ class TerminalManager:
         session = TerminalSession(node_ip, container_id)
         if await session.start():
             self._sessions[session_id] = session
+            self._ssh_hosts.add((session.ssh_user, node_ip))
             return session
         return None
     
@@ -150,6 +293,22 @@ class TerminalManager:
         for session in self._sessions.values():
             await session.close()
         self._sessions.clear()
+        await self._close_ssh_masters()
+    
+    async def _close_ssh_masters(self):
+        """재사용 중인 노드별 마스터 SSH 연결을 닫습니다."""
+        for ssh_user, node_ip in self._ssh_hosts:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    "ssh", *_SSH_BASE_OPTIONS, *_ssh_control_options(),
+                    "-O", "exit", f"{ssh_user}@{node_ip}",
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                await asyncio.wait_for(proc.wait(), timeout=2.0)
+            except Exception:
+                pass
+        self._ssh_hosts.clear()
 
 
 # 싱글톤 인스턴스
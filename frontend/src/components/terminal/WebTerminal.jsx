@@ -6,6 +6,20 @@
 import { useEffect, useRef, useState } from 'react';
 import { Terminal } from 'lucide-react';
 
+// Client -> Server 바이너리 프레임 opcode (첫 1바이트)
+const OP_DATA = 0x00;
+const OP_RESIZE = 0x01;
+
+const textEncoder = new TextEncoder();
+
+function encodeFrame(opcode, text) {
+    const payload = textEncoder.encode(text);
+    const frame = new Uint8Array(payload.length + 1);
+    frame[0] = opcode;
+    frame.set(payload, 1);
+    return frame;
+}
+
 function WebTerminal({ instanceId, onClose }) {
     const terminalRef = useRef(null);
     const terminalInstance = useRef(null);
@@ -80,6 +94,7 @@ function WebTerminal({ instanceId, onClose }) {
                 const wsUrl = `${protocol}//${window.location.host}/ws/terminal/${instanceId}`;
 
                 const ws = new WebSocket(wsUrl);
+                ws.binaryType = 'arraybuffer';
                 wsRef.current = ws;
 
                 ws.onopen = () => {
@@ -90,8 +105,8 @@ function WebTerminal({ instanceId, onClose }) {
                 };
 
                 ws.onmessage = (event) => {
-                    if (event.data instanceof Blob) {
-                        event.data.text().then(text => term.write(text));
+                    if (event.data instanceof ArrayBuffer) {
+                        term.write(new Uint8Array(event.data));
                     } else {
                         term.write(event.data);
                     }
@@ -113,10 +128,10 @@ function WebTerminal({ instanceId, onClose }) {
                     }
                 };
 
-                // Handle terminal input
+                // Handle terminal input (binary frame: opcode 0x00 + UTF-8 bytes)
                 term.onData((data) => {
                     if (ws.readyState === WebSocket.OPEN) {
-                        ws.send(data);
+                        ws.send(encodeFrame(OP_DATA, data));
                     }
                 });
 
@@ -125,11 +140,10 @@ function WebTerminal({ instanceId, onClose }) {
                     if (fitAddonRef.current) {
                         fitAddonRef.current.fit();
                         if (ws.readyState === WebSocket.OPEN) {
-                            ws.send(JSON.stringify({
-                                type: 'resize',
+                            ws.send(encodeFrame(OP_RESIZE, JSON.stringify({
                                 rows: term.rows,
                                 cols: term.cols
-                            }));
+                            })));
                         }
                     }
                 };